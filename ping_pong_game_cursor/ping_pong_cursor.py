@@ -1,11 +1,33 @@
+import argparse
+import os
 import sys
 import pygame
 
+# Shared helpers live in pong_core/ at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from pong_core import controls
+from pong_core.controls import LEFT, RIGHT
+from pong_core.dirty_rect import DirtyRectRenderer
+from pong_core.governor import QUALITY_MODES, QualityGovernor
+from pong_core.inputs import KeyboardSource, MailboxSource
+from pong_core.net import ABANDONED, DEFAULT_PORT, OVER, PLAYING, WAITING, NetClient, UdpClient
+from pong_core.pro_pong import COLLISION_MODES, Match
+from pong_core.profiler import NULL_PROFILER, FrameProfiler
+from pong_core.replay import GAME_PRO_PONG, InputRecorder
+from pong_core.rules import PRO_PONG
+from pong_core.shared_state import SharedState, pro_pong_state
+from pong_core.spectate import SpectatorFeed, pro_pong_snapshot
+from pong_core.sprites import Theme, atlas_cache
+from pong_core.startup import font_cache, init_pygame
+from pong_core.stats import ProPongObserver, StatsRecorder, StatsStore
+from pong_core.text_cache import text_cache
+from pong_core.timestep import FixedTimestep
+
 # -----------------------------------------------------------------------------
 # CONSTANTS
 # -----------------------------------------------------------------------------
-WINDOW_WIDTH, WINDOW_HEIGHT = 800, 560
-FPS = 60
+WINDOW_WIDTH, WINDOW_HEIGHT = PRO_PONG.window_width, PRO_PONG.window_height
+FPS = PRO_PONG.fps
 
 # Professional Palette
 BLACK, WHITE = (0, 0, 0), (255, 255, 255)
@@ -14,36 +36,66 @@ BALL_COLOR = (255, 215, 0)
 NET_COLOR = (100, 100, 100)
 MENU_BG = (20, 25, 35)
 
-# Physics Settings
-PADDLE_WIDTH, PADDLE_HEIGHT = 12, 90
-PADDLE_SPEED = 10
-PADDLE_MARGIN = 30
+# Physics Settings (paddle, ball and scoring rules) live in pong_core.rules.PRO_PONG
+
+# Rendering: "flip" redraws everything, "dirty" updates only changed regions
+RENDER_MODES = ("flip", "dirty")
 
-BALL_SIZE = 12
-BALL_SPEED_INITIAL = 5
-BALL_SPEED_MAX = 12
-ANGLE_MULTIPLIER = 0.12  # Lower intensity for smoother vertical bounce
-BALL_DY_MAX = 7
+# Profiling: one timer per numbered section of run_game (F3 toggles the overlay)
+PROFILE_PHASES = ("events", "input", "physics", "scoring", "text", "draw", "flip", "idle")
 
-SCORE_LIMIT = 11
-BEST_OF = 5
+BEST_OF = PRO_PONG.best_of
 
-TOP_BAR_H = 60
+TOP_BAR_H = PRO_PONG.top_bar_h
 PLAY_Y = TOP_BAR_H
-PLAY_H = WINDOW_HEIGHT - TOP_BAR_H
-PLAY_BOTTOM = PLAY_Y + PLAY_H
+
+# Paddles, ball and the dashed net, rasterized once into a sprite atlas
+THEME = Theme(
+    "pro-pong",
+    (PRO_PONG.paddle_width, PRO_PONG.paddle_height), PADDLE_COLOR, 0,
+    PRO_PONG.ball_size, BALL_COLOR,
+    (2, WINDOW_HEIGHT - PLAY_Y), NET_COLOR, 10, 20,
+)
+NET_POS = (WINDOW_WIDTH // 2 - 1, PLAY_Y)
 
 # -----------------------------------------------------------------------------
 # HELPERS
 # -----------------------------------------------------------------------------
-def clamp(value, low, high):
-    return max(low, min(high, value))
-
-def check_game_won(score_a, score_b):
-    """Win by 2 rule implementation."""
-    if (score_a >= SCORE_LIMIT or score_b >= SCORE_LIMIT) and abs(score_a - score_b) >= 2:
-        return True
-    return False
+def build_table_background():
+    """Static layer for dirty-rect mode: play field, top bar and net."""
+    background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    background.fill(BLACK)
+    pygame.draw.rect(background, MENU_BG, (0, 0, WINDOW_WIDTH, TOP_BAR_H))
+    atlas_cache.get(THEME).draw(background, (("net", NET_POS),))
+    return background
+
+def draw_table(screen, labels, rect_p1, rect_p2, rect_ball):
+    """Full redraw for flip mode: table, `labels` as (surface, pos) pairs, net and objects."""
+    screen.fill(BLACK)
+    pygame.draw.rect(screen, MENU_BG, (0, 0, WINDOW_WIDTH, TOP_BAR_H))
+
+    # Text Rendering
+    for label, pos in labels:
+        screen.blit(label, pos)
+
+    # Net & Objects: one batched blit from the sprite atlas
+    atlas_cache.get(THEME).draw(screen, (
+        ("net", NET_POS), ("paddle", rect_p1.topleft), ("paddle", rect_p2.topleft), ("ball", rect_ball.topleft),
+    ))
+
+def score_labels(font, status, sets_a, sets_b, antialias=True):
+    """Top-bar labels as (surface, pos) pairs: `status` (the score) and the set count."""
+    s_txt = text_cache.render(font, status, antialias, WHITE)
+    s_pos = (WINDOW_WIDTH // 2 - s_txt.get_width() // 2, 10)
+    set_txt = text_cache.render(font, f"Sets: {sets_a} - {sets_b}", antialias, (200, 200, 200))
+    set_pos = (WINDOW_WIDTH // 2 - set_txt.get_width() // 2, 35)
+    return (s_txt, s_pos), (set_txt, set_pos)
+
+def paint_paddle(surface, rect):
+    surface.blit(atlas_cache.get(THEME).sprite("paddle"), rect)
+
+def paint_ball(surface, rect):
+    surface.blit(atlas_cache.get(THEME).sprite("ball"), rect)
 
 # -----------------------------------------------------------------------------
 # MENU SYSTEM
@@ -63,23 +115,23 @@ def run_menu(screen, font, title_font, best_result):
                 if event.key == pygame.K_ESCAPE: return False
 
         screen.fill(MENU_BG)
-        title = title_font.render("PRO PING-PONG", True, WHITE)
+        title = text_cache.render(title_font, "PRO PING-PONG", True, WHITE)
         screen.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 80))
 
-        ctrls = font.render("P1: W/S  |  P2: Up/Down", True, WHITE)
+        ctrls = text_cache.render(font, "P1: W/S  |  P2: Up/Down", True, WHITE)
         screen.blit(ctrls, (WINDOW_WIDTH // 2 - ctrls.get_width() // 2, 200))
 
-        rules = font.render(f"Best of {BEST_OF} | 11 pts (Win by 2)", True, (150, 150, 150))
+        rules = text_cache.render(font, f"Best of {BEST_OF} | {PRO_PONG.score_limit} pts (Win by 2)", True, (150, 150, 150))
         screen.blit(rules, (WINDOW_WIDTH // 2 - rules.get_width() // 2, 250))
 
-        best = font.render(best_result, True, (255, 215, 0))
+        best = text_cache.render(font, best_result, True, (255, 215, 0))
         screen.blit(best, (WINDOW_WIDTH // 2 - best.get_width() // 2, 320))
 
         # Start Button
         m_pos = pygame.mouse.get_pos()
         color = (90, 150, 220) if btn_rect.collidepoint(m_pos) else (60, 120, 180)
         pygame.draw.rect(screen, color, btn_rect, border_radius=5)
-        txt = font.render("START GAME", True, WHITE)
+        txt = text_cache.render(font, "START GAME", True, WHITE)
         screen.blit(txt, (btn_rect.centerx - txt.get_width() // 2, btn_rect.centery - txt.get_height() // 2))
 
         pygame.display.flip()
@@ -88,131 +140,206 @@ def run_menu(screen, font, title_font, best_result):
 # -----------------------------------------------------------------------------
 # CORE GAME LOOP
 # -----------------------------------------------------------------------------
-def run_game(screen, font, clock):
-    # Setup Positions
-    p1_y = float(PLAY_Y + (PLAY_H - PADDLE_HEIGHT) // 2)
-    p2_y = float(PLAY_Y + (PLAY_H - PADDLE_HEIGHT) // 2)
-    ball_x, ball_y = float(WINDOW_WIDTH // 2), float(PLAY_Y + PLAY_H // 2)
-    ball_dx, ball_dy = float(BALL_SPEED_INITIAL), 3.0
-
-    score_a, score_b = 0, 0
-    sets_a, sets_b = 0, 0
-    serve_cooldown = 60
-    paddle_hit_cooldown = 0
+def run_game(screen, font, clock, render_mode="flip", physics_hz=FPS, collision="rect", recorder=None,
+             profiler=NULL_PROFILER, stats=None, feed=None, quality="auto", shared=None):
+    renderer = None
+    if render_mode == "dirty":
+        renderer = DirtyRectRenderer(screen, build_table_background())
+
+    match = Match(PRO_PONG, physics_hz, collision)
+    keyboard = KeyboardSource()
+    mailbox = MailboxSource(shared, LEFT) if shared is not None else None  # External controller, tick by tick
+    timestep = FixedTimestep(physics_hz)
+    frame_time = 1.0 / FPS
+    # Only the score text can be scaled back; physics stays on the fixed timestep
+    governor = QualityGovernor(("antialias",), FPS, quality)
 
     while True:
+        profiler.begin_frame()
+
         # 1. EVENT HANDLING (Optimized: No pump(), cleaner queue)
         for event in pygame.event.get():
             if event.type == pygame.QUIT: return 0, 0
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE: return 0, 0
+            if keyboard.handle_event(event): continue
+            profiler.handle_event(event)
+        profiler.lap("events")
+
+        # 2. INPUT: the held keys as kept from events (resynced on focus changes)
+        keys = keyboard.poll()
+        profiler.lap("input")
+
+        # 3. BALL MOVEMENT & COLLISION, 4. SCORING & SETS
+        # Fixed-rate physics: as many ticks as the last frame's duration covers.
+        # Match.step, split so the profiler can time the two sections apart.
+        for _ in range(timestep.advance(frame_time)):
+            mask = keys | mailbox.poll() if mailbox is not None else keys
+            held = controls.unpack(mask)
+            if recorder is not None: recorder.record(mask)
+            match.snap()
+            match.move_paddles(*held)
+            match.move_ball()
+            profiler.lap("physics")
+            over = match.check_score()
+            if stats is not None: stats(match)
+            if feed is not None: feed.publish(pro_pong_snapshot(match, OVER if over else PLAYING))
+            if shared is not None: shared.publish(pro_pong_state(match, OVER if over else PLAYING))
+            if over: return match.sets_a, match.sets_b
+            profiler.lap("scoring")
+
+        rect_p1, rect_p2, rect_ball = match.rects(timestep.alpha)
+        score_a, score_b, sets_a, sets_b = match.score_a, match.score_b, match.sets_a, match.sets_b
 
-        # 2. KEYBOARD POLLING (Placed before physics to avoid "sticking")
-        keys = pygame.key.get_pressed()
-        
-        # Player 1 (Left)
-        if keys[pygame.K_w] and p1_y > PLAY_Y: p1_y -= PADDLE_SPEED
-        if keys[pygame.K_s] and p1_y < (PLAY_BOTTOM - PADDLE_HEIGHT): p1_y += PADDLE_SPEED
-        # Player 2 (Right)
-        if keys[pygame.K_UP] and p2_y > PLAY_Y: p2_y -= PADDLE_SPEED
-        if keys[pygame.K_DOWN] and p2_y < (PLAY_BOTTOM - PADDLE_HEIGHT): p2_y += PADDLE_SPEED
-
-        # 3. BALL MOVEMENT & COLLISION
-        if serve_cooldown > 0:
-            serve_cooldown -= 1
+        # 5. RENDERING
+        antialias = governor.enabled("antialias")
+        (s_txt, s_pos), (set_txt, set_pos) = score_labels(font, f"{score_a} - {score_b}", sets_a, sets_b, antialias)
+        overlay = profiler.overlay_surface()
+        profiler.lap("text")
+
+        if renderer is not None:
+            # Dirty rects: only moved objects and changed labels are repainted
+            renderer.draw("score", s_txt.get_rect(topleft=s_pos), s_txt, (score_a, score_b, antialias))
+            renderer.draw("sets", set_txt.get_rect(topleft=set_pos), set_txt, (sets_a, sets_b, antialias))
+            renderer.draw("p1", rect_p1, paint_paddle)
+            renderer.draw("p2", rect_p2, paint_paddle)
+            renderer.draw("ball", rect_ball, paint_ball)
+            if overlay is not None:
+                renderer.draw("profiler", overlay.get_rect(topleft=(8, 8)), overlay, overlay)
+            profiler.lap("draw")
+            renderer.present()
         else:
-            ball_x += ball_dx
-            ball_y += ball_dy
-
-        # Wall Collision
-        if ball_y <= PLAY_Y:
-            ball_y = float(PLAY_Y)
-            ball_dy *= -1
-        elif ball_y >= (PLAY_BOTTOM - BALL_SIZE):
-            ball_y = float(PLAY_BOTTOM - BALL_SIZE)
-            ball_dy *= -1
-
-        # Rects for collision
-        rect_p1 = pygame.Rect(PADDLE_MARGIN, int(p1_y), PADDLE_WIDTH, PADDLE_HEIGHT)
-        rect_p2 = pygame.Rect(WINDOW_WIDTH - PADDLE_MARGIN - PADDLE_WIDTH, int(p2_y), PADDLE_WIDTH, PADDLE_HEIGHT)
-        rect_ball = pygame.Rect(int(ball_x), int(ball_y), BALL_SIZE, BALL_SIZE)
-
-        if paddle_hit_cooldown > 0: paddle_hit_cooldown -= 1
-
-        # Paddle Collision Logic
-        if paddle_hit_cooldown == 0:
-            # Left Paddle
-            if ball_dx < 0 and rect_ball.colliderect(rect_p1):
-                diff = (ball_y + BALL_SIZE / 2.0) - (p1_y + PADDLE_HEIGHT / 2.0)
-                target_dy = clamp(diff * ANGLE_MULTIPLIER * 2.0, -BALL_DY_MAX, BALL_DY_MAX)
-                ball_dy = clamp(0.6 * ball_dy + 0.4 * target_dy, -BALL_DY_MAX, BALL_DY_MAX)
-                ball_dx = clamp(abs(ball_dx) + 0.3, BALL_SPEED_INITIAL, BALL_SPEED_MAX)
-                ball_x = float(rect_p1.right + 2)
-                paddle_hit_cooldown = 4 # Anti-vibration cooldown
-
-            # Right Paddle
-            elif ball_dx > 0 and rect_ball.colliderect(rect_p2):
-                diff = (ball_y + BALL_SIZE / 2.0) - (p2_y + PADDLE_HEIGHT / 2.0)
-                target_dy = clamp(diff * ANGLE_MULTIPLIER * 2.0, -BALL_DY_MAX, BALL_DY_MAX)
-                ball_dy = clamp(0.6 * ball_dy + 0.4 * target_dy, -BALL_DY_MAX, BALL_DY_MAX)
-                ball_dx = -clamp(abs(ball_dx) + 0.3, BALL_SPEED_INITIAL, BALL_SPEED_MAX)
-                ball_x = float(rect_p2.left - BALL_SIZE - 2)
-                paddle_hit_cooldown = 4
-
-        # 4. SCORING & SETS
-        if ball_x < 0 or ball_x > WINDOW_WIDTH:
-            scored_by_a = (ball_x > WINDOW_WIDTH)
-            if scored_by_a: score_a += 1
-            else: score_b += 1
-
-            if check_game_won(score_a, score_b):
-                if score_a > score_b: sets_a += 1
-                else: sets_b += 1
-                score_a, score_b = 0, 0
-                if sets_a >= 3 or sets_b >= 3: return sets_a, sets_b
-
-            # Reset Ball State
-            ball_x, ball_y = float(WINDOW_WIDTH // 2), float(PLAY_Y + PLAY_H // 2)
-            ball_dx = float(BALL_SPEED_INITIAL if scored_by_a else -BALL_SPEED_INITIAL)
-            ball_dy = 3.0
-            serve_cooldown, paddle_hit_cooldown = 60, 0
+            draw_table(screen, ((s_txt, s_pos), (set_txt, set_pos)), rect_p1, rect_p2, rect_ball)
+            if overlay is not None: screen.blit(overlay, (8, 8))
+            profiler.lap("draw")
 
-        # 5. RENDERING
-        screen.fill(BLACK)
-        pygame.draw.rect(screen, MENU_BG, (0, 0, WINDOW_WIDTH, TOP_BAR_H))
-        
-        # Text Rendering
-        s_txt = font.render(f"{score_a} - {score_b}", True, WHITE)
-        screen.blit(s_txt, (WINDOW_WIDTH // 2 - s_txt.get_width() // 2, 10))
-        set_txt = font.render(f"Sets: {sets_a} - {sets_b}", True, (200, 200, 200))
-        screen.blit(set_txt, (WINDOW_WIDTH // 2 - set_txt.get_width() // 2, 35))
-
-        # Net & Objects
-        for y in range(PLAY_Y, WINDOW_HEIGHT, 20):
-            pygame.draw.rect(screen, NET_COLOR, (WINDOW_WIDTH // 2 - 1, y, 2, 10))
-        pygame.draw.rect(screen, PADDLE_COLOR, rect_p1)
-        pygame.draw.rect(screen, PADDLE_COLOR, rect_p2)
-        pygame.draw.ellipse(screen, BALL_COLOR, rect_ball)
+            pygame.display.flip()
+        profiler.lap("flip")
+        frame_time = clock.tick(FPS) / 1000.0
+        governor.frame(clock.get_rawtime() / 1000.0)
+        profiler.lap("idle")
+        profiler.end_frame()
 
-        pygame.display.flip()
-        clock.tick(FPS)
+# -----------------------------------------------------------------------------
+# NETWORK GAME LOOP (one paddle here, the other on a remote client)
+# -----------------------------------------------------------------------------
+def run_net_game(screen, font, clock, address, match_id):
+    """Returns (sets_a, sets_b, note); `note` says why a match ended without a winner."""
+    host, _, port = address.rpartition(":")
+    client = NetClient(match_id, PRO_PONG)
+    link = UdpClient(client, host or "127.0.0.1", int(port or DEFAULT_PORT))
+    keyboard = KeyboardSource()
+    timestep = FixedTimestep(FPS)  # Until WELCOME says the server's tick rate
+    frame_time = 1.0 / FPS
+
+    try:
+        while True:
+            # 1. EVENT HANDLING
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    link.send(client.leave_packet())
+                    return 0, 0, None
+                keyboard.handle_event(event)
+
+            # 2. INPUT (either key pair moves this player's paddle)
+            mask = keyboard.poll()
+            up = bool(mask & (controls.LEFT_UP | controls.RIGHT_UP))
+            down = bool(mask & (controls.LEFT_DOWN | controls.RIGHT_DOWN))
+
+            # 3. NETWORK: server states in, one predicted input per tick out
+            link.poll()
+            if client.rejected: return 0, 0, f"Match {match_id} is full or under way"
+            if client.side is not None and timestep.hz != client.match.physics_hz:
+                timestep = FixedTimestep(client.match.physics_hz)  # One input per server tick
+            for _ in range(timestep.advance(frame_time)):
+                link.send(client.join_packet() if client.side is None else client.input_packet(up, down))
+
+            match = client.match
+            if client.status == OVER: return match.sets_a, match.sets_b, None
+            if client.status == ABANDONED:
+                return match.sets_a, match.sets_b, f"Opponent left at sets {match.sets_a}:{match.sets_b}"
+
+            # 5. RENDERING
+            if client.status == WAITING:
+                status = "Waiting for opponent..." if client.side else f"Connecting to {address}..."
+            else:
+                status = f"{match.score_a} - {match.score_b}"
+            draw_table(screen, score_labels(font, status, match.sets_a, match.sets_b), *match.rects())
+            pygame.display.flip()
+            frame_time = clock.tick(FPS) / 1000.0
+    finally:
+        link.close()
 
 # -----------------------------------------------------------------------------
 # MAIN ENTRY
 # -----------------------------------------------------------------------------
-def main():
-    pygame.init()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pro Ping-Pong")
+    parser.add_argument("--render", choices=RENDER_MODES, default="flip",
+                        help="dirty: push only changed regions instead of full flips")
+    parser.add_argument("--physics-hz", type=int, default=FPS,
+                        help="fixed physics rate, independent of the render rate (e.g. 120, 240)")
+    parser.add_argument("--collision", choices=COLLISION_MODES, default="rect",
+                        help="swept: exact time-of-impact paddle hits, no tunneling")
+    parser.add_argument("--record", metavar="PATH",
+                        help="append every match's inputs to a replay log (see pong_core.replay)")
+    parser.add_argument("--profile", metavar="PATH", nargs="?", const="profile.json",
+                        help="time each frame phase (F3 shows the overlay) and write p50/p95/p99 to PATH on exit")
+    parser.add_argument("--connect", metavar="HOST:PORT",
+                        help="play one paddle against a remote player via a pong_core.net server")
+    parser.add_argument("--match-id", type=int, default=1, help="match to join on the server")
+    parser.add_argument("--stats", metavar="PATH",
+                        help="record rallies and results in a SQLite file (see pong_core.stats); "
+                             "the menu's last result is kept there across runs")
+    parser.add_argument("--quality", choices=QUALITY_MODES, default="auto",
+                        help="auto: render the score text without antialiasing while frames run over budget")
+    parser.add_argument("--shared-state", metavar="PATH",
+                        help="write every tick to a memory-mapped file for other processes; "
+                             "its mailbox steers the left paddle (see pong_core.shared_state)")
+    parser.add_argument("--spectate", metavar="HOST:PORT",
+                        help="publish every tick to a pong_core.spectate hub for viewers to watch")
+    args = parser.parse_args(argv)
+
+    init_pygame()  # Display and fonts only; no audio device or joysticks
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("Ping-Pong Vibe Edition - Final")
-    font, title_font = pygame.font.SysFont("Arial", 28), pygame.font.SysFont("Arial", 60, bold=True)
+    font, title_font = font_cache.get("Arial", 28), font_cache.get("Arial", 60, bold=True)
     clock, best_result = pygame.time.Clock(), "Last Match: No record"
+    recorder = InputRecorder(args.record, GAME_PRO_PONG) if args.record else None
+    stats = StatsRecorder(args.stats, "pro-pong") if args.stats else None
+    if stats:
+        store = StatsStore(args.stats)
+        last = store.last_match("pro-pong")
+        store.close()
+        if last:
+            winner, s1, s2 = last
+            best_result = f"Last: {'Player 1' if winner == LEFT else 'Player 2'} won {max(s1, s2)}:{min(s1, s2)}"
+    profiler = FrameProfiler(PROFILE_PHASES) if args.profile else NULL_PROFILER
+    feed = SpectatorFeed(args.spectate) if args.spectate else None
+    shared = SharedState(args.shared_state, GAME_PRO_PONG) if args.shared_state else None
 
     while True:
         if not run_menu(screen, font, title_font, best_result): break
-        s1, s2 = run_game(screen, font, clock)
+        if args.connect:
+            s1, s2, note = run_net_game(screen, font, clock, args.connect, args.match_id)
+            if note:
+                best_result = f"Last: {note}"
+                continue
+        else:
+            if recorder: recorder.start_match(0, args.physics_hz, args.collision == "swept")
+            if stats: stats.start_match()
+            s1, s2 = run_game(screen, font, clock, args.render, args.physics_hz, args.collision, recorder, profiler,
+                              ProPongObserver(stats) if stats else None, feed, args.quality, shared)
+            if recorder: recorder.end_match()
+            if stats and (s1 or s2): stats.end_match(LEFT if s1 > s2 else RIGHT, s1, s2)
         if s1 == 0 and s2 == 0: break
         winner = "Player 1" if s1 > s2 else "Player 2"
         best_result = f"Last: {winner} won {max(s1, s2)}:{min(s1, s2)}"
 
+    if recorder: recorder.close()
+    if stats: stats.close()  # An unfinished match is kept as abandoned
+    if feed: feed.close()
+    if shared: shared.close()
+    if args.profile: profiler.export(args.profile)
     pygame.quit()
     sys.exit()
 
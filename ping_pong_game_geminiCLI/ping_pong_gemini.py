@@ -1,148 +1,92 @@
 
 import pygame
+import argparse
+import os
 import sys
-import random
 
-# --- Initialization ---
-pygame.init()
+# Shared helpers live in pong_core/ at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from pong_core import controls
+from pong_core.basic import BasicGame
+from pong_core.governor import QUALITY_MODES, QualityGovernor
+from pong_core.inputs import KeyboardSource
+from pong_core.rules import BASIC
+from pong_core.startup import init_pygame
+from pong_core.text_cache import text_cache
+from pong_core.timestep import FixedTimestep
 
 # --- Game Constants ---
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
+# Gameplay values (sizes, speeds) live in pong_core.rules.BASIC
+SCREEN_WIDTH = BASIC.screen_width
+SCREEN_HEIGHT = BASIC.screen_height
 BG_COLOR = pygame.Color('grey12')
 LIGHT_GREY = (200, 200, 200)
 
-PADDLE_WIDTH = 10
-PADDLE_HEIGHT = 140
-BALL_RADIUS = 7
+game_font = None  # Loaded by main() once pygame is initialized
 
-# Speeds
-PADDLE_SPEED = 7
-BALL_SPEED_X = 7
-BALL_SPEED_Y = 7
-
-# --- Game Setup ---
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption('Ping-Pong')
-
-# Clock to control the frame rate
-clock = pygame.time.Clock()
-
-# --- Game Objects ---
-# Paddles
-player_paddle = pygame.Rect(SCREEN_WIDTH - 20 - PADDLE_WIDTH, SCREEN_HEIGHT / 2 - PADDLE_HEIGHT / 2, PADDLE_WIDTH, PADDLE_HEIGHT)
-opponent_paddle = pygame.Rect(20, SCREEN_HEIGHT / 2 - PADDLE_HEIGHT / 2, PADDLE_WIDTH, PADDLE_HEIGHT)
-
-# Ball
-ball = pygame.Rect(SCREEN_WIDTH / 2 - BALL_RADIUS, SCREEN_HEIGHT / 2 - BALL_RADIUS, BALL_RADIUS * 2, BALL_RADIUS * 2)
-
-# --- Game Variables ---
-ball_speed_x = BALL_SPEED_X * random.choice((1, -1))
-ball_speed_y = BALL_SPEED_Y * random.choice((1, -1))
-player_speed = 0
-opponent_speed = 0
-
-# Score
-player_score = 0
-opponent_score = 0
-game_font = pygame.font.Font("freesansbold.ttf", 32)
-
-def ball_reset():
-    """Resets the ball to the center with a random direction."""
-    global ball_speed_x, ball_speed_y
-    ball.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-    ball_speed_y *= random.choice((1, -1))
-    ball_speed_x *= random.choice((1, -1))
-
-# --- Main Game Loop ---
-while True:
-    # --- Event Handling ---
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-        
-        # Player paddle movement
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_DOWN:
-                player_speed += PADDLE_SPEED
-            if event.key == pygame.K_UP:
-                player_speed -= PADDLE_SPEED
-        if event.type == pygame.KEYUP:
-            if event.key == pygame.K_DOWN:
-                player_speed -= PADDLE_SPEED
-            if event.key == pygame.K_UP:
-                player_speed += PADDLE_SPEED
-                
-        # Opponent paddle movement (simple AI)
-        # For a two-player game, this would be replaced with key handling for a second player (e.g., W and S keys)
-        # For simplicity, we'll make the opponent paddle track the ball
-        # You could use the following for a 2-player setup:
-        # if event.type == pygame.KEYDOWN:
-        #     if event.key == pygame.K_s:
-        #         opponent_speed += PADDLE_SPEED
-        #     if event.key == pygame.K_w:
-        #         opponent_speed -= PADDLE_SPEED
-        # if event.type == pygame.KEYUP:
-        #     if event.key == pygame.K_s:
-        #         opponent_speed -= PADDLE_SPEED
-        #     if event.key == pygame.K_w:
-        #         opponent_speed += PADDLE_SPEED
-
-    # --- Game Logic ---
-    
-    # Ball movement
-    ball.x += ball_speed_x
-    ball.y += ball_speed_y
-
-    # Ball collision: Top and Bottom walls
-    if ball.top <= 0 or ball.bottom >= SCREEN_HEIGHT:
-        ball_speed_y *= -1
-
-    # Ball collision: Left and Right walls (scoring)
-    if ball.left <= 0:
-        player_score += 1
-        ball_reset()
-
-    if ball.right >= SCREEN_WIDTH:
-        opponent_score += 1
-        ball_reset()
-
-    # Ball collision: Paddles
-    if ball.colliderect(player_paddle) or ball.colliderect(opponent_paddle):
-        ball_speed_x *= -1
-        
-    # Paddle movement and boundaries
-    player_paddle.y += player_speed
-    if player_paddle.top <= 0:
-        player_paddle.top = 0
-    if player_paddle.bottom >= SCREEN_HEIGHT:
-        player_paddle.bottom = SCREEN_HEIGHT
-
-    # Simple AI for opponent paddle
-    if opponent_paddle.top < ball.y:
-        opponent_paddle.top += PADDLE_SPEED
-    if opponent_paddle.bottom > ball.y:
-        opponent_paddle.bottom -= PADDLE_SPEED
-    if opponent_paddle.top <= 0:
-        opponent_paddle.top = 0
-    if opponent_paddle.bottom >= SCREEN_HEIGHT:
-        opponent_paddle.bottom = SCREEN_HEIGHT
-
-    # --- Drawing ---
+def draw(screen, game, aaline=True):
+    """Draws the table, paddles, ball, net and scores (the net as a plain rect with `aaline` off)."""
     screen.fill(BG_COLOR)
-    pygame.draw.rect(screen, LIGHT_GREY, player_paddle)
-    pygame.draw.rect(screen, LIGHT_GREY, opponent_paddle)
-    pygame.draw.ellipse(screen, LIGHT_GREY, ball)
-    pygame.draw.aaline(screen, LIGHT_GREY, (SCREEN_WIDTH / 2, 0), (SCREEN_WIDTH / 2, SCREEN_HEIGHT))
+    pygame.draw.rect(screen, LIGHT_GREY, game.player_paddle)
+    pygame.draw.rect(screen, LIGHT_GREY, game.opponent_paddle)
+    pygame.draw.ellipse(screen, LIGHT_GREY, game.ball)
+    if aaline:
+        pygame.draw.aaline(screen, LIGHT_GREY, (SCREEN_WIDTH / 2, 0), (SCREEN_WIDTH / 2, SCREEN_HEIGHT))
+    else:
+        pygame.draw.rect(screen, LIGHT_GREY, (SCREEN_WIDTH // 2, 0, 1, SCREEN_HEIGHT))
 
     # Display scores
-    player_text = game_font.render(f"{player_score}", False, LIGHT_GREY)
+    player_text = text_cache.render(game_font, f"{game.player_score}", False, LIGHT_GREY)
     screen.blit(player_text, (SCREEN_WIDTH / 2 + 20, SCREEN_HEIGHT / 2))
 
-    opponent_text = game_font.render(f"{opponent_score}", False, LIGHT_GREY)
+    opponent_text = text_cache.render(game_font, f"{game.opponent_score}", False, LIGHT_GREY)
     screen.blit(opponent_text, (SCREEN_WIDTH / 2 - 45, SCREEN_HEIGHT / 2))
 
-    # --- Update the Display ---
-    pygame.display.flip()
-    clock.tick(60)
+# --- Main Game Loop ---
+def main(argv=None):
+    global game_font
+    parser = argparse.ArgumentParser(description="Ping-Pong")
+    parser.add_argument("--quality", choices=QUALITY_MODES, default="auto",
+                        help="auto: draw the net without aaline while frames run over budget")
+    args = parser.parse_args(argv)
+
+    # --- Initialization ---
+    init_pygame()
+
+    # --- Game Setup ---
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption('Ping-Pong')
+    game_font = pygame.font.Font("freesansbold.ttf", 32)
+
+    # Clock to control the frame rate
+    clock = pygame.time.Clock()
+    game = BasicGame(BASIC)
+    keyboard = KeyboardSource(sides=(controls.RIGHT,))  # The player's Up/Down; the opponent tracks the ball
+    # Game ticks at a fixed 60 Hz; under load the governor draws the net without aaline
+    timestep = FixedTimestep(60)
+    frame_time = 1.0 / 60
+    governor = QualityGovernor(("aaline",), 60, args.quality)
+
+    while True:
+        # --- Event Handling ---
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+            keyboard.handle_event(event)
+
+        # --- Game Logic ---
+        for _ in range(timestep.advance(frame_time)):
+            game.step(controls.direction(keyboard.poll(), *controls.SIDE_BITS[controls.RIGHT]))
+
+        # --- Drawing ---
+        draw(screen, game, governor.enabled("aaline"))
+
+        # --- Update the Display ---
+        pygame.display.flip()
+        frame_time = clock.tick(60) / 1000.0
+        governor.frame(clock.get_rawtime() / 1000.0)
+
+if __name__ == "__main__":
+    main()
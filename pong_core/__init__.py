@@ -0,0 +1 @@
+"""Shared, display-free building blocks for the Ping-Pong games."""
@@ -0,0 +1,188 @@
+"""Paddle AIs for headless Hyper-Pong matches.
+
+An AI is a callable `ai(engine, side)` returning the paddle direction for the
+next tick (-1 up, 0 still, 1 down), the same value `GameEngine.step` takes.
+`side` is LEFT for the W/S (opponent) paddle and RIGHT for the arrow-key
+(player) paddle. `make_ai(name, seed)` builds one from the registry.
+
+The chasing AIs compare the paddle with the ball every tick. `PredictiveAI`
+instead works out where the ball will cross its paddle's plane, folding the
+wall reflections analytically, once per trajectory, and then only steers
+toward that cached target.
+
+`track_ball` is the Pro Ping-Pong counterpart, returning the held (up, down)
+keys a `Match` paddle takes; the tuner, the netcode bots and the video export
+all play with it.
+"""
+import random
+
+from pong_core.controls import LEFT, RIGHT
+
+
+def paddle_y(engine, side):
+    return engine.opponent_y if side == LEFT else engine.player_y
+
+
+def tracker_ai(engine, side):
+    """The ping_pong_gemini.py opponent: steps toward ball.y from both paddle ends."""
+    rules = engine.rules
+    top = paddle_y(engine, side)
+    direction = 0
+    if top < engine.ball_y:
+        top += rules.paddle_speed
+        direction += 1
+    if top + rules.paddle_height > engine.ball_y:
+        direction -= 1
+    return direction
+
+
+def center_ai(engine, side):
+    """Keeps the paddle's center on the ball's center, with a one-step dead zone."""
+    rules = engine.rules
+    offset = (engine.ball_y + engine.ball_size // 2) - (paddle_y(engine, side) + rules.paddle_height // 2)
+    if abs(offset) <= rules.paddle_speed:
+        return 0
+    return 1 if offset > 0 else -1
+
+
+def idle_ai(engine, side):
+    """Never moves."""
+    return 0
+
+
+class SluggishAI:
+    """`center_ai` that only reacts on a fraction of ticks, so it can be beaten."""
+
+    def __init__(self, reaction=0.8, seed=None):
+        self.reaction = reaction
+        self.rng = random.Random(seed)
+
+    def __call__(self, engine, side):
+        if self.rng.random() >= self.reaction:
+            return 0
+        return center_ai(engine, side)
+
+
+def fold(y, low, high):
+    """Reflects an unbounded coordinate back into [low, high], as wall bounces do."""
+    span = high - low
+    if span <= 0:
+        return low
+    offset = (y - low) % (2 * span)
+    return low + (offset if offset <= span else 2 * span - offset)
+
+
+def intercept_y(engine, side):
+    """Top y of the ball when it reaches `side`'s paddle face, or None if it is not coming.
+
+    Ball speeds are constant between paddle hits, so the straight-line
+    position is folded back between the walls instead of simulating ticks.
+    """
+    rules = engine.rules
+    if side == LEFT:
+        plane_x = engine.opponent_x + rules.paddle_width
+        coming = engine.ball_speed_x < 0
+    else:
+        plane_x = engine.player_x - engine.ball_size
+        coming = engine.ball_speed_x > 0
+    if not coming:
+        return None
+    ticks = (plane_x - engine.ball_x) / engine.ball_speed_x
+    if ticks < 0:
+        return None  # Already past the paddle
+    y = engine.ball_y + engine.ball_speed_y * ticks
+    return fold(y, 0, rules.screen_height - engine.ball_size), ticks
+
+
+# --- Difficulty: (aim error in pixels, reaction delay in ticks) ---
+DIFFICULTIES = {
+    "easy": (130, 20),
+    "medium": (95, 10),
+    "hard": (0, 0),
+}
+
+
+class PredictiveAI:
+    """Moves to the ball's predicted crossing point, recomputed once per trajectory.
+
+    The target is cached with the ball velocity it was computed for and the
+    tick the ball arrives, so a paddle hit, a wall bounce or a new serve
+    triggers one new prediction and every other tick is a comparison. Lower
+    difficulties aim off by up to `error` pixels and wait `delay` ticks
+    before reacting to a new trajectory. With the ball going away the paddle
+    drifts back to the middle.
+    """
+
+    def __init__(self, difficulty="medium", seed=None):
+        self.error, self.delay = DIFFICULTIES[difficulty]
+        self.rng = random.Random(seed)
+        self._velocity = None
+        self._arrival = -1
+        self._target = None  # Paddle-center y to steer to, None for the middle
+        self._ready = 0
+
+    def _plan(self, engine, side):
+        rules = engine.rules
+        self._velocity = (engine.ball_speed_x, engine.ball_speed_y)
+        self._ready = engine.ticks + self.delay
+        prediction = intercept_y(engine, side)
+        if prediction is None:
+            self._target, self._arrival = None, engine.ticks + rules.screen_width
+            return
+        y, ticks = prediction
+        self._arrival = engine.ticks + int(ticks) + 1
+        aim = self.rng.uniform(-self.error, self.error) if self.error else 0
+        self._target = y + engine.ball_size / 2 + aim
+
+    def __call__(self, engine, side):
+        if (engine.ball_speed_x, engine.ball_speed_y) != self._velocity or engine.ticks > self._arrival:
+            self._plan(engine, side)
+        if engine.ticks < self._ready:
+            return 0
+        rules = engine.rules
+        target = self._target if self._target is not None else rules.screen_height / 2
+        offset = target - (paddle_y(engine, side) + rules.paddle_height / 2)
+        if abs(offset) <= rules.paddle_speed:
+            return 0
+        return 1 if offset > 0 else -1
+
+
+# --- Pro Ping-Pong ---
+def chase(ball_y, ball_size, paddle_y, paddle_height, paddle_speed):
+    """-1, 0 or 1 moving a paddle's center toward the ball's, with a one-step dead zone."""
+    offset = (ball_y + ball_size / 2) - (paddle_y + paddle_height / 2)
+    return 1 if offset > paddle_speed else -1 if offset < -paddle_speed else 0
+
+
+def track_ball(match, side, rng=None, reaction=1.0):
+    """(up, down) chasing the ball with `side`'s paddle of a Pro Ping-Pong `Match`.
+
+    With `rng` the paddle only reacts on a `reaction` share of ticks.
+    """
+    if rng is not None and rng.random() >= reaction:
+        return False, False
+    rules = match.rules
+    paddle_y = match.p1_y if side == LEFT else match.p2_y
+    direction = chase(match.ball_y, rules.ball_size, paddle_y, rules.paddle_height, rules.paddle_speed)
+    return direction < 0, direction > 0
+
+
+# --- Registry ---
+AIS = {
+    "tracker": lambda seed: tracker_ai,
+    "center": lambda seed: center_ai,
+    "sluggish": lambda seed: SluggishAI(0.8, seed),
+    "idle": lambda seed: idle_ai,
+    "predictive-easy": lambda seed: PredictiveAI("easy", seed),
+    "predictive-medium": lambda seed: PredictiveAI("medium", seed),
+    "predictive-hard": lambda seed: PredictiveAI("hard", seed),
+}
+
+
+def make_ai(name, seed=None):
+    """Builds a fresh AI instance by registry name."""
+    try:
+        factory = AIS[name]
+    except KeyError:
+        raise ValueError(f"unknown AI {name!r}; choose from {', '.join(sorted(AIS))}") from None
+    return factory(seed)
@@ -0,0 +1,60 @@
+"""Prebuilt gradient backgrounds.
+
+Drawing a vertical gradient one `pygame.draw.line` per scanline costs
+`SCREEN_HEIGHT` Python-level calls every frame. `GradientCache` builds each
+gradient once with NumPy, keeps it as a display-format surface and blits it.
+NumPy is imported on the first build, not when the module loads.
+"""
+from collections import OrderedDict
+
+import pygame
+
+
+def build_gradient(size, top, bottom):
+    """Returns a new surface holding a vertical gradient from `top` to `bottom`."""
+    import numpy as np
+
+    width, height = size
+    top = np.array(tuple(top)[:3], dtype=np.float64)
+    bottom = np.array(tuple(bottom)[:3], dtype=np.float64)
+    ratio = (np.arange(height, dtype=np.float64) / height)[:, None]
+    # Same interpolation and int() truncation as the per-scanline version.
+    column = (top * (1 - ratio) + bottom * ratio).astype(np.uint8)
+
+    strip = pygame.surfarray.make_surface(column[None, :, :])
+    surface = pygame.transform.scale(strip, (width, height))
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
+
+
+class GradientCache:
+    """Small LRU of gradient surfaces keyed by (size, top color, bottom color)."""
+
+    def __init__(self, maxsize=4):
+        self.maxsize = maxsize
+        self._surfaces = OrderedDict()
+
+    def get(self, size, top, bottom):
+        """Returns the gradient surface for this size and color pair, building it once."""
+        key = (tuple(size), tuple(top), tuple(bottom))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = build_gradient(size, top, bottom)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def draw(self, target, top, bottom):
+        """Blits the gradient matching `target`'s size onto it."""
+        target.blit(self.get(target.get_size(), top, bottom), (0, 0))
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
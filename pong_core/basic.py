@@ -0,0 +1,99 @@
+"""Basic Pong game logic without a display.
+
+`BasicGame` is the game of ping_pong_gemini.py: the player's right paddle
+against a left paddle that tracks the ball, an endless rally with a point
+per miss. It follows that script's `pygame.Rect` arithmetic tick for tick,
+and `step` returns the same event flags as `pong_core.engine.GameEngine`.
+"""
+import random
+
+import pygame
+
+from pong_core.engine import PADDLE_HIT, POINT_SCORED, WALL_BOUNCE
+from pong_core.rules import BASIC
+
+
+class BasicGame:
+    """Paddles, ball and scores of ping_pong_gemini.py, one 60 FPS tick per `step`."""
+
+    __slots__ = (
+        "rules", "rng", "player_paddle", "opponent_paddle", "ball",
+        "ball_speed_x", "ball_speed_y", "player_score", "opponent_score",
+    )
+
+    def __init__(self, rules=BASIC, seed=None):
+        self.rules = rules
+        self.rng = random.Random(seed)
+        width, height = rules.screen_width, rules.screen_height
+        paddle_top = height / 2 - rules.paddle_height / 2
+        self.player_paddle = pygame.Rect(
+            width - rules.paddle_margin - rules.paddle_width, paddle_top, rules.paddle_width, rules.paddle_height
+        )
+        self.opponent_paddle = pygame.Rect(rules.paddle_margin, paddle_top, rules.paddle_width, rules.paddle_height)
+        size = rules.ball_radius * 2
+        self.ball = pygame.Rect(width / 2 - rules.ball_radius, height / 2 - rules.ball_radius, size, size)
+        self.ball_speed_x = rules.ball_speed_x * self.rng.choice((1, -1))
+        self.ball_speed_y = rules.ball_speed_y * self.rng.choice((1, -1))
+        self.player_score = self.opponent_score = 0
+
+    def ball_reset(self):
+        """Resets the ball to the center with a random direction."""
+        self.ball.center = (self.rules.screen_width / 2, self.rules.screen_height / 2)
+        self.ball_speed_y *= self.rng.choice((1, -1))
+        self.ball_speed_x *= self.rng.choice((1, -1))
+
+    def step(self, player_dir):
+        """Advances the game by one tick and returns the step event flags.
+
+        `player_dir` is the player's net paddle direction (-1 up, 0 still,
+        1 down); the opponent paddle is driven by the built-in tracking AI.
+        """
+        rules = self.rules
+        ball, player, opponent = self.ball, self.player_paddle, self.opponent_paddle
+        height = rules.screen_height
+        events = 0
+
+        # Ball movement
+        ball.x += self.ball_speed_x
+        ball.y += self.ball_speed_y
+
+        # Ball collision: Top and Bottom walls
+        if ball.top <= 0 or ball.bottom >= height:
+            self.ball_speed_y *= -1
+            events |= WALL_BOUNCE
+
+        # Ball collision: Left and Right walls (scoring)
+        if ball.left <= 0:
+            self.player_score += 1
+            self.ball_reset()
+            events |= POINT_SCORED
+        if ball.right >= rules.screen_width:
+            self.opponent_score += 1
+            self.ball_reset()
+            events |= POINT_SCORED
+
+        # Ball collision: Paddles
+        if ball.colliderect(player) or ball.colliderect(opponent):
+            self.ball_speed_x *= -1
+            events |= PADDLE_HIT
+
+        # Paddle movement and boundaries (a still paddle is always in bounds)
+        speed = rules.paddle_speed
+        if player_dir:
+            player.y += player_dir * speed
+            if player.top <= 0:
+                player.top = 0
+            if player.bottom >= height:
+                player.bottom = height
+
+        # Simple AI for opponent paddle
+        ball_y = ball.y
+        if opponent.top < ball_y:
+            opponent.top += speed
+        if opponent.bottom > ball_y:
+            opponent.bottom -= speed
+        if opponent.top <= 0:
+            opponent.top = 0
+        if opponent.bottom >= height:
+            opponent.bottom = height
+        return events
@@ -0,0 +1,270 @@
+"""Headless, vectorized Hyper-Pong simulator.
+
+Holds N independent matches in NumPy arrays and advances all of them with one
+call to `BatchSimulator.step`. The per-tick rules follow the PLAYING branch of
+ppg.py exactly: ball movement, wall bounce, `colliderect` paddle checks with
+the edge tolerance heuristics, scoring, `ball_reset`, set and match wins.
+
+    python -m pong_core.batch --games 10000 --set paddle_height=120
+"""
+import argparse
+import functools
+import time
+
+import numpy as np
+
+from pong_core.rules import HYPER_PONG, override
+
+NO_WINNER = 0
+PLAYER = 1  # Right paddle, arrow keys ("Player 1" in ppg.py)
+OPPONENT = 2  # Left paddle, W/S keys ("Player 2" in ppg.py)
+
+
+# --- Policies ---
+def tracking_policy(sim, reaction=1.0):
+    """Moves both paddles toward the ball's center, one paddle speed at a time.
+
+    With `reaction` below 1.0 each paddle only reacts on that fraction of ticks,
+    which lets the ball get past it now and then so matches can finish.
+    """
+    ball_center = sim.ball_y + sim.ball_size // 2
+    half = sim.rules.paddle_height // 2
+    dead_zone = sim.rules.paddle_speed
+    player = ball_center - (sim.player_y + half)
+    opponent = ball_center - (sim.opponent_y + half)
+    player_dir = np.where(np.abs(player) > dead_zone, np.sign(player), 0)
+    opponent_dir = np.where(np.abs(opponent) > dead_zone, np.sign(opponent), 0)
+    if reaction < 1.0:
+        player_dir *= sim.rng.random(sim.n) < reaction
+        opponent_dir *= sim.rng.random(sim.n) < reaction
+    return player_dir, opponent_dir
+
+
+def idle_policy(sim):
+    """Never moves either paddle."""
+    return 0, 0
+
+
+# --- Simulator ---
+class BatchSimulator:
+    """Steps N Hyper-Pong matches in lock-step."""
+
+    def __init__(self, n_games, rules=HYPER_PONG, seed=None):
+        self.n = int(n_games)
+        self.rules = rules
+        self.rng = np.random.default_rng(seed)
+
+        self.ball_size = rules.ball_radius * 2
+        self.player_x = rules.screen_width - rules.paddle_margin - rules.paddle_width
+        self.opponent_x = rules.paddle_margin
+        self.paddle_start_y = rules.screen_height // 2 - rules.paddle_height // 2
+
+        n = self.n
+        self.ball_x = np.zeros(n, np.int32)
+        self.ball_y = np.zeros(n, np.int32)
+        self.ball_dx = np.zeros(n, np.int32)
+        self.ball_dy = np.zeros(n, np.int32)
+        self.player_y = np.zeros(n, np.int32)
+        self.opponent_y = np.zeros(n, np.int32)
+
+        self.player_score = np.zeros(n, np.int16)
+        self.opponent_score = np.zeros(n, np.int16)
+        self.player_sets = np.zeros(n, np.int16)
+        self.opponent_sets = np.zeros(n, np.int16)
+        self.done = np.zeros(n, bool)
+        self.winner = np.zeros(n, np.int8)
+
+        # Bookkeeping for balance sweeps
+        self.ticks = np.zeros(n, np.int64)
+        self.points = np.zeros(n, np.int32)
+        self.hits = np.zeros(n, np.int64)
+        self.rally = np.zeros(n, np.int32)
+        self.longest_rally = np.zeros(n, np.int32)
+        self.reset()
+
+    def reset(self):
+        """Starts a fresh match in every slot (reset_game for all N games)."""
+        self.player_y[:] = self.paddle_start_y
+        self.opponent_y[:] = self.paddle_start_y
+        for array in (
+            self.player_score, self.opponent_score, self.player_sets, self.opponent_sets,
+            self.winner, self.ticks, self.points, self.hits, self.rally, self.longest_rally,
+        ):
+            array[:] = 0
+        self.done[:] = False
+        self.ball_reset(np.ones(self.n, bool))
+
+    def ball_reset(self, mask):
+        """Re-serves the ball from the center for every game selected by `mask`."""
+        count = int(np.count_nonzero(mask))
+        if not count:
+            return
+        rules = self.rules
+        signs = self.rng.integers(0, 2, size=(2, count), dtype=np.int32) * 2 - 1
+        self.ball_x[mask] = rules.screen_width // 2 - self.ball_size // 2
+        self.ball_y[mask] = rules.screen_height // 2 - self.ball_size // 2
+        self.ball_dy[mask] = rules.ball_speed_y_start * signs[0]
+        self.ball_dx[mask] = rules.ball_speed_x_start * signs[1]
+
+    def _paddle_hit(self, active, paddle_x, paddle_y, front_gap):
+        """Applies one `colliderect` paddle check; returns the collision mask."""
+        rules = self.rules
+        size = self.ball_size
+        bx, by = self.ball_x, self.ball_y
+        hit = (
+            active
+            & (bx < paddle_x + rules.paddle_width)
+            & (bx + size > paddle_x)
+            & (by < paddle_y + rules.paddle_height)
+            & (by + size > paddle_y)
+        )
+        tolerance = rules.edge_tolerance
+        front = hit & (np.abs(front_gap) < tolerance)
+        top = hit & ~front & (np.abs(by + size - paddle_y) < tolerance) & (self.ball_dy > 0)
+        bottom = (
+            hit & ~front & ~top
+            & (np.abs(by - (paddle_y + rules.paddle_height)) < tolerance)
+            & (self.ball_dy < 0)
+        )
+        np.negative(self.ball_dx, out=self.ball_dx, where=front)
+        np.negative(self.ball_dy, out=self.ball_dy, where=top | bottom)
+        return hit
+
+    def step(self, player_dir, opponent_dir):
+        """Advances every unfinished match by one 60 FPS tick.
+
+        `player_dir` and `opponent_dir` are scalars or length-N arrays of -1
+        (up), 0 or 1 (down), matching the net KEYDOWN/KEYUP speed in ppg.py.
+        """
+        rules = self.rules
+        active = ~self.done
+        size = self.ball_size
+
+        # Ball movement
+        self.ball_x += self.ball_dx * active
+        self.ball_y += self.ball_dy * active
+
+        # Ball collision: Top and Bottom walls
+        wall = active & ((self.ball_y <= 0) | (self.ball_y + size >= rules.screen_height))
+        np.negative(self.ball_dy, out=self.ball_dy, where=wall)
+
+        # Ball collision: Paddles
+        hit_player = self._paddle_hit(
+            active, self.player_x, self.player_y, self.ball_x + size - self.player_x
+        )
+        hit_opponent = self._paddle_hit(
+            active, self.opponent_x, self.opponent_y,
+            self.ball_x - (self.opponent_x + rules.paddle_width),
+        )
+        hits = hit_player.astype(np.int32) + hit_opponent
+        self.hits += hits
+        self.rally += hits
+
+        # Score checking
+        player_point = active & (self.ball_x <= 0)
+        opponent_point = active & ~player_point & (self.ball_x + size >= rules.screen_width)
+        scored = player_point | opponent_point
+        self.player_score += player_point
+        self.opponent_score += opponent_point
+        self.points += scored
+        np.maximum(self.longest_rally, self.rally, out=self.longest_rally)
+        self.rally[scored] = 0
+        self.ball_reset(scored)
+
+        # Check for set win
+        win_by = 2
+        player_set = (self.player_score >= rules.winning_score) & (
+            self.player_score >= self.opponent_score + win_by
+        )
+        self.player_sets += player_set
+        self.player_score[player_set] = 0
+        self.opponent_score[player_set] = 0
+        opponent_set = (self.opponent_score >= rules.winning_score) & (
+            self.opponent_score >= self.player_score + win_by
+        )
+        self.opponent_sets += opponent_set
+        self.player_score[opponent_set] = 0
+        self.opponent_score[opponent_set] = 0
+
+        # Check for match win
+        player_match = active & (self.player_sets >= rules.sets_to_win_match)
+        opponent_match = active & ~player_match & (self.opponent_sets >= rules.sets_to_win_match)
+        self.winner[player_match] = PLAYER
+        self.winner[opponent_match] = OPPONENT
+        self.done |= player_match | opponent_match
+
+        # Paddle movement and boundaries
+        self.player_y += np.asarray(player_dir, np.int32) * rules.paddle_speed * active
+        self.opponent_y += np.asarray(opponent_dir, np.int32) * rules.paddle_speed * active
+        max_y = rules.screen_height - rules.paddle_height
+        np.clip(self.player_y, 0, max_y, out=self.player_y)
+        np.clip(self.opponent_y, 0, max_y, out=self.opponent_y)
+
+        self.ticks += active
+        return hit_player, hit_opponent, wall, scored
+
+    def run(self, policy=tracking_policy, max_ticks=1_000_000):
+        """Steps until every match is over or `max_ticks` is reached.
+
+        `policy(sim)` returns the (player_dir, opponent_dir) pair for each tick.
+        """
+        for _ in range(max_ticks):
+            if self.done.all():
+                break
+            self.step(*policy(self))
+        return self.summary()
+
+    def summary(self):
+        """Aggregates finished-match statistics into a plain dict."""
+        finished = self.done
+        count = int(np.count_nonzero(finished))
+        ticks = self.ticks[finished]
+        return {
+            "games": self.n,
+            "finished": count,
+            "player_wins": int(np.count_nonzero(self.winner == PLAYER)),
+            "opponent_wins": int(np.count_nonzero(self.winner == OPPONENT)),
+            "mean_ticks": float(ticks.mean()) if count else 0.0,
+            "mean_points": float(self.points[finished].mean()) if count else 0.0,
+            "hits_per_point": float(self.hits.sum() / max(1, self.points.sum())),
+            "longest_rally": int(self.longest_rally.max()) if self.n else 0,
+        }
+
+
+# --- Command Line ---
+POLICIES = {"tracking": tracking_policy, "idle": idle_policy}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run many headless Hyper-Pong matches.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-ticks", type=int, default=1_000_000)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="tracking")
+    parser.add_argument(
+        "--reaction", type=float, default=0.8,
+        help="fraction of ticks the tracking policy reacts on (default: 0.8)",
+    )
+    parser.add_argument(
+        "--set", action="append", default=[], metavar="NAME=VALUE",
+        help="override a rule, e.g. paddle_height=120 (repeatable)",
+    )
+    args = parser.parse_args(argv)
+
+    changes = dict(item.split("=", 1) for item in args.set)
+    sim = BatchSimulator(args.games, override(HYPER_PONG, **changes), seed=args.seed)
+    start = time.perf_counter()
+    policy = POLICIES[args.policy]
+    if policy is tracking_policy:
+        policy = functools.partial(tracking_policy, reaction=args.reaction)
+    result = sim.run(policy, args.max_ticks)
+    elapsed = time.perf_counter() - start
+
+    total_ticks = int(sim.ticks.sum())
+    for key, value in result.items():
+        print(f"{key:>16}: {value}")
+    print(f"{'game_ticks/s':>16}: {total_ticks / elapsed:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
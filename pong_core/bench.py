@@ -0,0 +1,319 @@
+"""Reproducible performance benchmarks for all three games.
+
+Runs on SDL's dummy video and audio drivers, so no window or sound card is
+needed. Each benchmark reports one number:
+
+    physics/*  game-logic ticks per second (Match, GameEngine PLAYING, BasicGame)
+    render/*   full frames per second, including the gradient, net and display flip
+    startup/*  seconds from launching a fresh interpreter to the first frame
+
+Results are written as JSON and compared against a stored baseline; the
+command exits with status 1 when any benchmark is slower than the baseline by
+more than `--tolerance`:
+
+    python -m pong_core.bench --out results.json
+    python -m pong_core.bench --update-baseline
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+import pygame
+
+from pong_core import controls
+from pong_core.basic import BasicGame
+from pong_core.dirty_rect import DirtyRectRenderer
+from pong_core.engine import GameEngine, GameState
+from pong_core.pro_pong import Match
+from pong_core.renderer import HyperPongRenderer
+from pong_core.rules import BASIC, HYPER_PONG, PRO_PONG
+from pong_core.startup import ROOT, SCRIPTS, font_cache, load_script
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+PHYSICS_TICKS = 50_000
+RENDER_FRAMES = 300
+REPEATS = 3
+STARTUP_RUNS = 5
+INPUT_HOLD = 30  # Ticks each scripted input is held, like a player pressing a key
+
+# Runs a game script until its first display flip, then exits at once
+FIRST_FRAME = """
+import os, runpy, sys, pygame
+def first_frame(*args):
+    os._exit(0)
+pygame.display.flip = pygame.display.update = first_frame
+sys.argv = sys.argv[1:]
+runpy.run_path(sys.argv[0], run_name="__main__")
+"""
+
+# Synthesizes and loads ppg.py's three tones without a disk cache
+SOUND_STARTUP = """
+from pong_core.sound import ToneBank
+tones = ToneBank()
+for frequency, duration in ((440, 0.1), (880, 0.2), (220, 0.08)):
+    tones.sound(frequency, duration)
+"""
+
+BENCHMARKS = {}  # name -> (function, unit)
+
+
+def benchmark(name, unit):
+    def register(function):
+        BENCHMARKS[name] = (function, unit)
+        return function
+    return register
+
+
+def scripted_inputs(choices, seed=0, length=600):
+    """A repeatable input sequence, each choice held for INPUT_HOLD ticks."""
+    rng = random.Random(seed)
+    inputs = []
+    while len(inputs) < length:
+        inputs.extend([rng.choice(choices)] * INPUT_HOLD)
+    return inputs
+
+
+def best_rate(count, body, repeats=REPEATS):
+    """Runs `body()` `repeats` times; returns the best count per second."""
+    best = 0.0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        body()
+        best = max(best, count / (time.perf_counter() - start))
+    return best
+
+
+# --- Physics ---
+@benchmark("physics/pro-pong", "ticks/s")
+def physics_pro_pong():
+    inputs = scripted_inputs([controls.unpack(mask) for mask in range(16)])
+
+    def body():
+        match = Match(PRO_PONG)
+        for tick in range(PHYSICS_TICKS):
+            if match.step(*inputs[tick % len(inputs)]):
+                match = Match(PRO_PONG)
+    return best_rate(PHYSICS_TICKS, body)
+
+
+@benchmark("physics/hyper-pong", "ticks/s")
+def physics_hyper_pong():
+    inputs = scripted_inputs([(p, o) for p in (-1, 0, 1) for o in (-1, 0, 1)])
+
+    def body():
+        engine = GameEngine(HYPER_PONG)
+        engine.start_match(0)
+        for tick in range(PHYSICS_TICKS):
+            engine.step(*inputs[tick % len(inputs)])
+            if engine.state != GameState.PLAYING:
+                engine.start_match(tick)
+    return best_rate(PHYSICS_TICKS, body)
+
+
+@benchmark("physics/basic", "ticks/s")
+def physics_basic():
+    inputs = scripted_inputs((-1, 0, 1))
+
+    def body():
+        game = BasicGame(BASIC, seed=0)
+        for tick in range(PHYSICS_TICKS):
+            game.step(inputs[tick % len(inputs)])
+    return best_rate(PHYSICS_TICKS, body)
+
+
+# --- Rendering ---
+@benchmark("render/pro-pong-flip", "fps")
+def render_pro_pong_flip():
+    return _render_pro_pong(dirty=False)
+
+
+@benchmark("render/pro-pong-dirty", "fps")
+def render_pro_pong_dirty():
+    return _render_pro_pong(dirty=True)
+
+
+def _render_pro_pong(dirty):
+    game = load_script("pro-pong")
+    screen = pygame.display.set_mode((PRO_PONG.window_width, PRO_PONG.window_height))
+    font = font_cache.get("Arial", 28)  # The font main() hands to run_game
+    inputs = scripted_inputs([controls.unpack(mask) for mask in range(16)])
+
+    def body():
+        match = Match(PRO_PONG)
+        renderer = DirtyRectRenderer(screen, game.build_table_background()) if dirty else None
+        for frame in range(RENDER_FRAMES):
+            if match.step(*inputs[frame % len(inputs)]):
+                match = Match(PRO_PONG)
+            rect_p1, rect_p2, rect_ball = match.rects()
+            score_a, score_b, sets_a, sets_b = match.score_a, match.score_b, match.sets_a, match.sets_b
+            (s_txt, s_pos), (set_txt, set_pos) = game.score_labels(font, f"{score_a} - {score_b}", sets_a, sets_b)
+            if renderer is not None:
+                renderer.draw("score", s_txt.get_rect(topleft=s_pos), s_txt, (score_a, score_b))
+                renderer.draw("sets", set_txt.get_rect(topleft=set_pos), set_txt, (sets_a, sets_b))
+                renderer.draw("p1", rect_p1, game.paint_paddle)
+                renderer.draw("p2", rect_p2, game.paint_paddle)
+                renderer.draw("ball", rect_ball, game.paint_ball)
+                renderer.present()
+            else:
+                game.draw_table(screen, ((s_txt, s_pos), (set_txt, set_pos)), rect_p1, rect_p2, rect_ball)
+                pygame.display.flip()
+    return best_rate(RENDER_FRAMES, body)
+
+
+@benchmark("render/hyper-pong", "fps")
+def render_hyper_pong():
+    screen = pygame.display.set_mode((HYPER_PONG.screen_width, HYPER_PONG.screen_height))
+    renderer = HyperPongRenderer(screen, HYPER_PONG)
+    inputs = scripted_inputs([(p, o) for p in (-1, 0, 1) for o in (-1, 0, 1)])
+
+    def body():
+        engine = GameEngine(HYPER_PONG)
+        engine.start_match(0)
+        for frame in range(RENDER_FRAMES):
+            engine.step(*inputs[frame % len(inputs)])
+            renderer.draw(engine)
+            pygame.display.flip()
+    return best_rate(RENDER_FRAMES, body)
+
+
+@benchmark("render/hyper-pong-gradient", "fps")
+def render_hyper_pong_gradient():
+    screen = pygame.display.set_mode((HYPER_PONG.screen_width, HYPER_PONG.screen_height))
+    renderer = HyperPongRenderer(screen, HYPER_PONG)
+
+    def body():
+        for _ in range(RENDER_FRAMES):
+            renderer.draw_gradient_background()
+    return best_rate(RENDER_FRAMES, body)
+
+
+@benchmark("render/basic", "fps")
+def render_basic():
+    script = load_script("basic")
+    screen = pygame.display.set_mode((BASIC.screen_width, BASIC.screen_height))
+    script.game_font = pygame.font.Font("freesansbold.ttf", 32)
+    inputs = scripted_inputs((-1, 0, 1))
+
+    def body():
+        game = BasicGame(BASIC, seed=0)
+        for frame in range(RENDER_FRAMES):
+            game.step(inputs[frame % len(inputs)])
+            script.draw(screen, game)
+            pygame.display.flip()
+    return best_rate(RENDER_FRAMES, body)
+
+
+# --- Startup ---
+def time_process(args, runs=STARTUP_RUNS):
+    """Median wall time of a fresh interpreter running `args`."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+@benchmark("startup/pro-pong", "s")
+def startup_pro_pong():
+    return time_process(["-c", FIRST_FRAME, SCRIPTS["pro-pong"]])
+
+
+@benchmark("startup/hyper-pong", "s")
+def startup_hyper_pong():
+    return time_process(["-c", FIRST_FRAME, SCRIPTS["hyper-pong"]])
+
+
+@benchmark("startup/hyper-pong-sound", "s")
+def startup_hyper_pong_sound():
+    return time_process(["-c", SOUND_STARTUP])
+
+
+@benchmark("startup/basic", "s")
+def startup_basic():
+    return time_process(["-c", FIRST_FRAME, SCRIPTS["basic"]])
+
+
+# --- Running and comparing ---
+def run(names):
+    """Runs the named benchmarks; returns {name: {"value", "unit"}}."""
+    pygame.init()
+    results = {}
+    for name in names:
+        function, unit = BENCHMARKS[name]
+        results[name] = {"value": function(), "unit": unit}
+        print(f"{name:<28} {results[name]['value']:>12.4g} {unit}", flush=True)
+    pygame.quit()
+    return results
+
+
+def compare(results, baseline):
+    """Yields (name, value, baseline value, change) for benchmarks in both sets.
+
+    `change` is the relative speed-up, so it is negative when the new build is
+    slower, whichever way the unit counts.
+    """
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old, new = baseline[name]["value"], result["value"]
+        change = old / new - 1 if result["unit"] == "s" else new / old - 1
+        yield name, new, old, change
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark physics, rendering and startup of the Ping-Pong games.")
+    parser.add_argument("--only", metavar="PREFIX", action="append",
+                        help="run benchmarks whose name starts with PREFIX (repeatable, e.g. physics/)")
+    parser.add_argument("--out", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="stored results to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed slowdown before a benchmark counts as a regression (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if not args.only or name.startswith(tuple(args.only))]
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "results": run(names),
+    }
+    if args.out:
+        with open(args.out, "w") as out:
+            json.dump(report, out, indent=2)
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline) as src:
+            baseline = json.load(src)["results"]
+        print(f"\ncompared with {args.baseline}:")
+        for name, new, old, change in compare(report["results"], baseline):
+            flag = "REGRESSION" if change < -args.tolerance else ""
+            print(f"{name:<28} {old:>12.4g} -> {new:<12.4g} {change:+7.1%} {flag}")
+            if flag:
+                regressions.append(name)
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as out:
+            json.dump(report, out, indent=2)
+        print(f"baseline written to {args.baseline}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Continuous (swept) AABB collision.
+
+A per-frame `colliderect` overlap test misses a fast ball that jumps over a
+thin paddle between two frames, and can report the same hit on consecutive
+frames while the ball is still inside the paddle. `sweep_box` instead treats
+the ball's movement for the step as a segment and returns the exact fraction
+of the step at which it first touches the paddle, plus the face it hit.
+"""
+from collections import namedtuple
+
+INF = float("inf")
+
+# time: fraction of the move (0..1) at first contact.
+# normal_x/normal_y: outward normal of the face that was hit (-1, 0 or 1).
+Contact = namedtuple("Contact", ["time", "normal_x", "normal_y"])
+
+
+def _axis_times(pos, size, delta, target_pos, target_size):
+    """Entry and exit times along one axis, or None if the boxes never overlap on it."""
+    if delta > 0:
+        return (target_pos - (pos + size)) / delta, (target_pos + target_size - pos) / delta
+    if delta < 0:
+        return (target_pos + target_size - pos) / delta, (target_pos - (pos + size)) / delta
+    if pos < target_pos + target_size and pos + size > target_pos:
+        return -INF, INF
+    return None
+
+
+def sweep_box(x, y, w, h, dx, dy, tx, ty, tw, th):
+    """Sweeps box (x, y, w, h) by (dx, dy) against the static box (tx, ty, tw, th).
+
+    Returns a `Contact` for the first overlap during the move, or None. Boxes
+    that only touch edges do not collide, matching `Rect.colliderect`. A box
+    that already overlaps the target reports time 0.
+    """
+    x_times = _axis_times(x, w, dx, tx, tw)
+    if x_times is None:
+        return None
+    y_times = _axis_times(y, h, dy, ty, th)
+    if y_times is None:
+        return None
+
+    entry = max(x_times[0], y_times[0])
+    exit_ = min(x_times[1], y_times[1])
+    if entry >= exit_ or entry > 1.0 or exit_ <= 0.0:
+        return None
+
+    # The axis that started overlapping last is the face that was hit
+    if x_times[0] > y_times[0]:
+        normal = (-1 if dx > 0 else 1, 0)
+    else:
+        normal = (0, -1 if dy > 0 else 1)
+    return Contact(max(entry, 0.0), *normal)
+
+
+def sweep_rect(moving, velocity, target):
+    """`sweep_box` for Rect-like objects: `moving` travels by `velocity` toward `target`."""
+    return sweep_box(
+        moving.x, moving.y, moving.width, moving.height,
+        velocity[0], velocity[1],
+        target.x, target.y, target.width, target.height,
+    )
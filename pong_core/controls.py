@@ -0,0 +1,48 @@
+"""Paddle control bits shared by input handling, recording and replay.
+
+Left is the W/S paddle and right the Up/Down paddle in every game.
+"""
+# Paddle sides: Hyper-Pong's opponent and Pro Ping-Pong's player 1 play LEFT
+LEFT = "left"
+RIGHT = "right"
+
+LEFT_UP = 1 << 0
+LEFT_DOWN = 1 << 1
+RIGHT_UP = 1 << 2
+RIGHT_DOWN = 1 << 3
+
+# Control bits each side may set
+SIDE_BITS = {
+    LEFT: (LEFT_UP, LEFT_DOWN),
+    RIGHT: (RIGHT_UP, RIGHT_DOWN),
+}
+
+
+def pack(left_up, left_down, right_up, right_down):
+    """Packs four held/released flags into one control mask."""
+    return (
+        (LEFT_UP if left_up else 0)
+        | (LEFT_DOWN if left_down else 0)
+        | (RIGHT_UP if right_up else 0)
+        | (RIGHT_DOWN if right_down else 0)
+    )
+
+
+def unpack(mask):
+    """Returns (left_up, left_down, right_up, right_down) for a control mask."""
+    return (
+        bool(mask & LEFT_UP),
+        bool(mask & LEFT_DOWN),
+        bool(mask & RIGHT_UP),
+        bool(mask & RIGHT_DOWN),
+    )
+
+
+def direction(mask, up_bit, down_bit):
+    """Net paddle direction (-1 up, 0 still, 1 down) of one side's bits in a mask."""
+    return (1 if mask & down_bit else 0) - (1 if mask & up_bit else 0)
+
+
+def from_direction(direction, up_bit, down_bit):
+    """The bits of one side holding its paddle `direction` (-1, 0 or 1)."""
+    return up_bit if direction < 0 else down_bit if direction > 0 else 0
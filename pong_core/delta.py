@@ -0,0 +1,36 @@
+"""Field-by-field delta encoding, shared by the netcode and the spectator stream.
+
+A snapshot is a tuple with one value per entry of a field table, a sequence
+of (name, struct.Struct) pairs. A delta carries a bit mask of the fields
+that differ from a base snapshot the receiver already holds, followed by
+only those fields packed in table order. Each protocol frames the mask and
+the fields with its own header.
+"""
+
+
+def all_fields(fields):
+    """The mask that sends every field of the table."""
+    return (1 << len(fields)) - 1
+
+
+def changed_mask(snapshot, base):
+    """Mask of the fields where `snapshot` differs from `base`."""
+    mask = 0
+    for index, (value, old) in enumerate(zip(snapshot, base)):
+        if value != old:
+            mask |= 1 << index
+    return mask
+
+
+def pack_fields(fields, mask, snapshot):
+    """The fields of `snapshot` selected by `mask`, packed in table order."""
+    return b"".join(field.pack(snapshot[index]) for index, (_, field) in enumerate(fields) if mask & (1 << index))
+
+
+def unpack_fields(fields, mask, data, offset, values):
+    """Reads the fields in `mask` from `data` at `offset` into the `values` list; returns the end offset."""
+    for index, (_, field) in enumerate(fields):
+        if mask & (1 << index):
+            values[index] = field.unpack_from(data, offset)[0]
+            offset += field.size
+    return offset
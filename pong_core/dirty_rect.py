@@ -0,0 +1,77 @@
+"""Dirty-rectangle rendering on top of a static background layer.
+
+Instead of clearing and redrawing the whole window and calling
+`pygame.display.flip()`, the renderer remembers where every object was drawn
+last frame. Only objects whose rect (or content token) changed are erased from
+the background layer and repainted, and only those regions are pushed with
+`pygame.display.update(rects)`.
+"""
+import pygame
+
+
+class DirtyRectRenderer:
+    """Tracks object rects between frames and updates only what changed."""
+
+    def __init__(self, screen, background):
+        self.screen = screen
+        self.background = background
+        self._objects = {}  # key -> (rect, token) drawn last frame
+        self._pending = []
+        self._full_redraw = True
+
+    def invalidate(self):
+        """Forces the next `present` to repaint and flip the whole window."""
+        self._full_redraw = True
+
+    def set_background(self, background):
+        self.background = background
+        self.invalidate()
+
+    def draw(self, key, rect, paint, token=None):
+        """Queues one object for this frame.
+
+        `paint` is a Surface to blit at `rect` or a callable `paint(screen, rect)`.
+        `token` identifies the content (e.g. the score string) so an object whose
+        rect stays put but whose content changed is still repainted.
+        """
+        self._pending.append((key, pygame.Rect(rect), paint, token))
+
+    def _paint(self, rect, paint):
+        if isinstance(paint, pygame.Surface):
+            self.screen.blit(paint, rect)
+        else:
+            paint(self.screen, rect)
+
+    def present(self):
+        """Repaints the queued objects and pushes the changed regions to the display."""
+        pending, self._pending = self._pending, []
+        objects = {key: (rect, token) for key, rect, _, token in pending}
+
+        if self._full_redraw:
+            self._full_redraw = False
+            self.screen.blit(self.background, (0, 0))
+            for _, rect, paint, _ in pending:
+                self._paint(rect, paint)
+            self._objects = objects
+            pygame.display.flip()
+            return [self.screen.get_rect()]
+
+        # Erase the old position of everything that moved, changed or vanished
+        erased = [
+            old_rect for key, (old_rect, old_token) in self._objects.items()
+            if objects.get(key) != (old_rect, old_token)
+        ]
+        moved = [rect for key, rect, _, token in pending if self._objects.get(key) != (rect, token)]
+        for rect in erased:
+            self.screen.blit(self.background, rect, rect)
+
+        # Repaint in submission order so overlapping objects keep their layering
+        regions = erased + moved
+        for key, rect, paint, token in pending:
+            if self._objects.get(key) != (rect, token) or rect.collidelist(regions) != -1:
+                self._paint(rect, paint)
+
+        self._objects = objects
+        if regions:
+            pygame.display.update(regions)
+        return regions
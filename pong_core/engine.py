@@ -0,0 +1,201 @@
+"""Hyper-Pong game engine without a display.
+
+`GameEngine` holds the whole state of one ppg.py match in `__slots__`
+attributes and advances it with `step`, so it can be imported and run in
+tests, benchmarks and worker processes. Rendering lives in
+`pong_core.renderer`; ppg.py is the interactive entry point over both.
+"""
+import random
+
+from pong_core.collision import sweep_box
+from pong_core.rules import HYPER_PONG
+from pong_core.scoring import check_game_won, check_match_won
+
+
+# --- Game State ---
+class GameState:
+    START_MENU = 0
+    PLAYING = 1
+    GAME_OVER = 2
+
+
+# --- Step Events (bit flags returned by GameEngine.step) ---
+WALL_BOUNCE = 1
+PADDLE_HIT = 2
+POINT_SCORED = 4
+SET_WON = 8
+MATCH_WON = 16
+
+PLAYER_NAME = "Player 1"  # Right paddle, arrow keys
+OPPONENT_NAME = "Player 2"  # Left paddle, W/S keys
+
+
+class GameEngine:
+    """State and rules of one Hyper-Pong match, one 60 FPS tick per `step`."""
+
+    __slots__ = (
+        "rules", "rng", "swept", "state", "match_winner", "ticks",
+        "ball_x", "ball_y", "ball_speed_x", "ball_speed_y", "ball_size",
+        "player_x", "player_y", "opponent_x", "opponent_y",
+        "player_score", "opponent_score", "player_sets", "opponent_sets",
+    )
+
+    def __init__(self, rules=HYPER_PONG, seed=None, swept=False):
+        self.rules = rules
+        self.rng = random.Random(seed)
+        self.swept = swept
+        self.state = GameState.START_MENU
+        self.match_winner = ""
+        self.ticks = 0
+
+        # Game Objects
+        self.ball_size = rules.ball_radius * 2
+        self.player_x = rules.screen_width - rules.paddle_margin - rules.paddle_width
+        self.opponent_x = rules.paddle_margin
+        self.player_y = self.opponent_y = rules.screen_height // 2 - rules.paddle_height // 2
+        self.ball_x = rules.screen_width // 2 - rules.ball_radius
+        self.ball_y = rules.screen_height // 2 - rules.ball_radius
+        self.ball_speed_x = self.ball_speed_y = 0
+
+        self.player_score = self.opponent_score = 0
+        self.player_sets = self.opponent_sets = 0
+
+    # --- Game Functions ---
+    def ball_reset(self):
+        """Resets the ball to the center with a random direction."""
+        rules = self.rules
+        self.ball_x = rules.screen_width // 2 - self.ball_size // 2
+        self.ball_y = rules.screen_height // 2 - self.ball_size // 2
+        self.ball_speed_y = rules.ball_speed_y_start * self.rng.choice((1, -1))
+        self.ball_speed_x = rules.ball_speed_x_start * self.rng.choice((1, -1))
+
+    def reset_game(self):
+        """Resets scores and sets for a new match."""
+        self.player_score = self.opponent_score = 0
+        self.player_sets = self.opponent_sets = 0
+        self.match_winner = ""
+        self.ball_reset()
+
+    def start_match(self, seed=None):
+        """Starts a new match, as the menu's Start Game button does.
+
+        A `seed` makes every serve direction of the match reproducible.
+        """
+        if seed is not None:
+            self.rng.seed(seed)
+        self.reset_game()
+        self.state = GameState.PLAYING
+
+    def _collides(self, paddle_x, paddle_y):
+        """`Rect.colliderect` between the ball and a paddle."""
+        rules = self.rules
+        return (
+            self.ball_x < paddle_x + rules.paddle_width
+            and self.ball_x + self.ball_size > paddle_x
+            and self.ball_y < paddle_y + rules.paddle_height
+            and self.ball_y + self.ball_size > paddle_y
+        )
+
+    def _edge_bounce(self, paddle_y, front_gap):
+        """The colliderect edge heuristics: reflect off the front face or a corner."""
+        rules = self.rules
+        tolerance = rules.edge_tolerance
+        if abs(front_gap) < tolerance:
+            self.ball_speed_x *= -1
+        elif abs(self.ball_y + self.ball_size - paddle_y) < tolerance and self.ball_speed_y > 0:
+            self.ball_speed_y *= -1
+        elif abs(self.ball_y - (paddle_y + rules.paddle_height)) < tolerance and self.ball_speed_y < 0:
+            self.ball_speed_y *= -1
+
+    def _sweep_ball(self):
+        """Moves the ball, bouncing at the exact point it meets a paddle."""
+        rules = self.rules
+        contact = None
+        for paddle_x, paddle_y in ((self.player_x, self.player_y), (self.opponent_x, self.opponent_y)):
+            hit = sweep_box(
+                self.ball_x, self.ball_y, self.ball_size, self.ball_size,
+                self.ball_speed_x, self.ball_speed_y,
+                paddle_x, paddle_y, rules.paddle_width, rules.paddle_height,
+            )
+            if hit is not None and (contact is None or hit.time < contact.time):
+                contact = hit
+        if contact is None:
+            self.ball_x += self.ball_speed_x
+            self.ball_y += self.ball_speed_y
+            return 0
+
+        # Rounded, not truncated: a move of 4.9999 (float error) or -4.6 is 5 or -5 pixels
+        self.ball_x += round(self.ball_speed_x * contact.time)
+        self.ball_y += round(self.ball_speed_y * contact.time)
+        if contact.normal_x:
+            self.ball_speed_x = contact.normal_x * abs(self.ball_speed_x)
+        else:
+            self.ball_speed_y = contact.normal_y * abs(self.ball_speed_y)
+        return PADDLE_HIT
+
+    def step(self, player_dir, opponent_dir):
+        """Advances the match by one tick and returns the step event flags.
+
+        `player_dir` and `opponent_dir` are the net paddle directions (-1 up,
+        0 still, 1 down), i.e. the KEYDOWN/KEYUP speed divided by PADDLE_SPEED.
+        """
+        if self.state != GameState.PLAYING:
+            return 0
+        rules = self.rules
+        size = self.ball_size
+        events = 0
+        self.ticks += 1
+
+        # Ball movement
+        if self.swept:
+            events |= self._sweep_ball()
+        else:
+            self.ball_x += self.ball_speed_x
+            self.ball_y += self.ball_speed_y
+
+        # Ball collision: Top and Bottom walls
+        if self.ball_y <= 0 or self.ball_y + size >= rules.screen_height:
+            events |= WALL_BOUNCE
+            self.ball_speed_y *= -1
+
+        # Ball collision: Paddles
+        if not self.swept:
+            if self._collides(self.player_x, self.player_y):
+                self._edge_bounce(self.player_y, self.ball_x + size - self.player_x)
+                events |= PADDLE_HIT
+            if self._collides(self.opponent_x, self.opponent_y):
+                self._edge_bounce(
+                    self.opponent_y, self.ball_x - (self.opponent_x + rules.paddle_width)
+                )
+                events |= PADDLE_HIT
+
+        # Score checking
+        if self.ball_x <= 0:
+            self.player_score += 1
+            events |= POINT_SCORED
+            self.ball_reset()
+        if self.ball_x + size >= rules.screen_width:
+            self.opponent_score += 1
+            events |= POINT_SCORED
+            self.ball_reset()
+
+        # Check for set win
+        if check_game_won(self.player_score, self.opponent_score, rules.winning_score):
+            if self.player_score > self.opponent_score:
+                self.player_sets += 1
+            else:
+                self.opponent_sets += 1
+            self.player_score, self.opponent_score = 0, 0
+            events |= SET_WON
+
+            # Check for match win
+            if check_match_won(self.player_sets, self.opponent_sets, rules.sets_to_win_match):
+                self.match_winner = PLAYER_NAME if self.player_sets > self.opponent_sets else OPPONENT_NAME
+                self.state = GameState.GAME_OVER
+                events |= MATCH_WON
+
+        # Paddle movement and boundaries
+        max_y = rules.screen_height - rules.paddle_height
+        self.player_y = min(max(self.player_y + player_dir * rules.paddle_speed, 0), max_y)
+        self.opponent_y = min(max(self.opponent_y + opponent_dir * rules.paddle_speed, 0), max_y)
+        return events
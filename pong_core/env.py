@@ -0,0 +1,261 @@
+"""Vectorized Pro Ping-Pong environment for training paddle AIs.
+
+`VectorPongEnv` holds N independent matches in NumPy arrays and advances all
+of them with one `step(actions)`, Gym-style. The per-tick rules are those of
+`pong_core.pro_pong.Match` (ping_pong_cursor.py's `run_game` at its 60 FPS
+physics rate, rect collision): the angle-based `bounce` off the paddles with
+`angle_multiplier`, the speed ramp up to `ball_speed_max`, serve and
+anti-vibration cooldowns, win-by-2 sets and best-of matches.
+
+Observations are one contiguous float32 array of shape (N, len(OBS_FIELDS));
+actions are an (N, 2) integer array of -1 (up), 0 or 1 (down) for the left
+and right paddle, so one policy can play both sides (self-play).
+
+    python -m pong_core.env --games 4096 --steps 2000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from pong_core.rules import PRO_PONG
+
+OBS_FIELDS = (
+    "ball_x", "ball_y", "ball_dx", "ball_dy", "left_y", "right_y",
+    "score_left", "score_right", "sets_left", "sets_right", "serve_cooldown",
+)
+
+NO_WINNER = 0
+LEFT_WINS = 1
+RIGHT_WINS = 2
+
+SERVE_FRAMES = 60
+HIT_COOLDOWN_FRAMES = 4
+
+
+class VectorPongEnv:
+    """N Pro Ping-Pong matches stepped in lock-step, with auto-reset."""
+
+    def __init__(self, n_games, rules=PRO_PONG, max_ticks=None):
+        self.n = int(n_games)
+        self.rules = rules
+        self.max_ticks = max_ticks
+        self.sets_to_win = rules.best_of // 2 + 1
+
+        self.play_y = rules.top_bar_h
+        self.play_bottom = rules.window_height
+        self.left_x = rules.paddle_margin
+        self.right_x = rules.window_width - rules.paddle_margin - rules.paddle_width
+        play_h = self.play_bottom - self.play_y
+        self.paddle_start_y = float(self.play_y + (play_h - rules.paddle_height) // 2)
+
+        n = self.n
+        self.ball_x = np.zeros(n)
+        self.ball_y = np.zeros(n)
+        self.ball_dx = np.zeros(n)
+        self.ball_dy = np.zeros(n)
+        self.left_y = np.zeros(n)
+        self.right_y = np.zeros(n)
+        self.score_left = np.zeros(n, np.int16)
+        self.score_right = np.zeros(n, np.int16)
+        self.sets_left = np.zeros(n, np.int16)
+        self.sets_right = np.zeros(n, np.int16)
+        self.serve_cooldown = np.zeros(n, np.int16)
+        self.hit_cooldown = np.zeros(n, np.int16)
+        self.ticks = np.zeros(n, np.int64)
+
+        self._obs = np.zeros((n, len(OBS_FIELDS)), np.float32)
+        self._rewards = np.zeros((n, 2), np.float32)
+
+    # --- Gym-style API ---
+    def reset(self):
+        """Starts a fresh match in every slot; returns (observations, info)."""
+        self._reset(np.ones(self.n, bool))
+        return self._observe(), {}
+
+    def step(self, actions):
+        """Advances every match by one tick.
+
+        Returns (observations, rewards, terminated, truncated, info). Rewards
+        are (N, 2): +1 to the side that won a point, -1 to the other. Finished
+        matches are reset before returning, so their observation is already
+        the next match's first; `info["winner"]` tells who won the one that
+        ended. The observation and reward arrays are reused by the next
+        step; copy them to keep them.
+        """
+        actions = np.asarray(actions)
+        self._move_paddles(actions[:, 0], actions[:, 1])
+        self._move_ball()
+        scored_left, scored_right, over = self._check_score()
+        self.ticks += 1
+
+        rewards = self._rewards
+        rewards[:, 0] = scored_left
+        rewards[:, 0] -= scored_right
+        rewards[:, 1] = -rewards[:, 0]
+
+        winner = np.where(over, np.where(self.sets_left > self.sets_right, LEFT_WINS, RIGHT_WINS), NO_WINNER)
+        truncated = ~over & (self.ticks >= self.max_ticks) if self.max_ticks else np.zeros(self.n, bool)
+        self._reset(over | truncated)
+        return self._observe(), rewards, over, truncated, {"winner": winner.astype(np.int8)}
+
+    # --- Match rules, vectorized ---
+    def _reset(self, mask):
+        if not mask.any():
+            return
+        for array in (self.score_left, self.score_right, self.sets_left, self.sets_right, self.ticks):
+            array[mask] = 0
+        self.left_y[mask] = self.paddle_start_y
+        self.right_y[mask] = self.paddle_start_y
+        self._serve(mask, True)
+
+    def _serve(self, mask, scored_by_left):
+        """`Match.serve` for every game in `mask`; the ball heads to whoever lost the point."""
+        rules = self.rules
+        self.ball_x[mask] = float(rules.window_width // 2)
+        self.ball_y[mask] = float(self.play_y + (self.play_bottom - self.play_y) // 2)
+        speed = np.where(scored_by_left, rules.ball_speed_initial, -rules.ball_speed_initial)
+        self.ball_dx[mask] = speed[mask] if np.ndim(speed) else speed
+        self.ball_dy[mask] = 3.0
+        self.serve_cooldown[mask] = SERVE_FRAMES
+        self.hit_cooldown[mask] = 0
+
+    def _move_paddles(self, left, right):
+        rules = self.rules
+        speed = rules.paddle_speed
+        lowest = self.play_bottom - rules.paddle_height
+        for paddle_y, action in ((self.left_y, left), (self.right_y, right)):
+            paddle_y -= speed * ((action < 0) & (paddle_y > self.play_y))
+            paddle_y += speed * ((action > 0) & (paddle_y < lowest))
+
+    def _move_ball(self):
+        rules = self.rules
+        size = rules.ball_size
+        serving = self.serve_cooldown > 0
+        self.serve_cooldown -= serving
+        moving = ~serving
+        self.ball_x += self.ball_dx * moving
+        self.ball_y += self.ball_dy * moving
+
+        # Wall Collision
+        top = self.ball_y <= self.play_y
+        bottom = ~top & (self.ball_y >= self.play_bottom - size)
+        self.ball_y[top] = float(self.play_y)
+        self.ball_y[bottom] = float(self.play_bottom - size)
+        np.negative(self.ball_dy, out=self.ball_dy, where=top | bottom)
+
+        # Paddle Collision: colliderect on the int() rects Match.rects builds
+        cooling = self.hit_cooldown > 0
+        self.hit_cooldown -= cooling
+        ready = self.hit_cooldown == 0
+        ball_x, ball_y = np.trunc(self.ball_x), np.trunc(self.ball_y)
+        hit_left = ready & (self.ball_dx < 0) & self._collides(ball_x, ball_y, self.left_x, self.left_y)
+        hit_right = ready & (self.ball_dx > 0) & self._collides(ball_x, ball_y, self.right_x, self.right_y)
+        hit = hit_left | hit_right
+        if not hit.any():
+            return
+
+        # Angle-based return: the further from the paddle center, the steeper
+        paddle_y = np.where(hit_left, self.left_y, self.right_y)
+        direction = np.where(hit_left, 1.0, -1.0)
+        dy_max = rules.ball_dy_max
+        diff = (self.ball_y + size / 2.0) - (paddle_y + rules.paddle_height / 2.0)
+        target_dy = np.clip(diff * rules.angle_multiplier * 2.0, -dy_max, dy_max)
+        new_dy = np.clip(0.6 * self.ball_dy + 0.4 * target_dy, -dy_max, dy_max)
+        new_dx = direction * np.clip(np.abs(self.ball_dx) + 0.3, rules.ball_speed_initial, rules.ball_speed_max)
+        np.copyto(self.ball_dy, new_dy, where=hit)
+        np.copyto(self.ball_dx, new_dx, where=hit)
+        self.ball_x[hit_left] = float(self.left_x + rules.paddle_width + 2)
+        self.ball_x[hit_right] = float(self.right_x - size - 2)
+        self.hit_cooldown[hit] = HIT_COOLDOWN_FRAMES
+
+    def _collides(self, ball_x, ball_y, paddle_x, paddle_y):
+        rules = self.rules
+        paddle_y = np.trunc(paddle_y)
+        return (
+            (ball_x < paddle_x + rules.paddle_width)
+            & (ball_x + rules.ball_size > paddle_x)
+            & (ball_y < paddle_y + rules.paddle_height)
+            & (ball_y + rules.ball_size > paddle_y)
+        )
+
+    def _check_score(self):
+        rules = self.rules
+        width = rules.window_width
+        scored_left = self.ball_x > width
+        scored_right = self.ball_x < 0
+        out = scored_left | scored_right
+        self.score_left += scored_left
+        self.score_right += scored_right
+
+        # Win by 2
+        leader = np.maximum(self.score_left, self.score_right)
+        margin = np.abs(self.score_left - self.score_right)
+        won = out & (leader >= rules.score_limit) & (margin >= 2)
+        set_left = won & (self.score_left > self.score_right)
+        self.sets_left += set_left
+        self.sets_right += won & ~set_left
+        self.score_left[won] = 0
+        self.score_right[won] = 0
+
+        over = won & ((self.sets_left >= self.sets_to_win) | (self.sets_right >= self.sets_to_win))
+        self._serve(out & ~over, scored_left)
+        return scored_left, scored_right, over
+
+    def _observe(self):
+        obs = self._obs
+        for column, array in enumerate((
+            self.ball_x, self.ball_y, self.ball_dx, self.ball_dy, self.left_y, self.right_y,
+            self.score_left, self.score_right, self.sets_left, self.sets_right, self.serve_cooldown,
+        )):
+            obs[:, column] = array
+        return obs
+
+
+# --- Policies ---
+def tracking_actions(obs, reaction=1.0, rng=None, rules=PRO_PONG):
+    """Both paddles toward the ball's center, from observations alone."""
+    ball_center = obs[:, 1] + rules.ball_size / 2
+    paddles = obs[:, 4:6] + rules.paddle_height / 2
+    offset = ball_center[:, None] - paddles
+    actions = np.where(np.abs(offset) > rules.paddle_speed, np.sign(offset), 0).astype(np.int8)
+    if reaction < 1.0:
+        actions *= (rng or np.random.default_rng()).random(actions.shape) < reaction
+    return actions
+
+
+def random_actions(obs, rng):
+    """Uniformly random actions for both paddles."""
+    return rng.integers(-1, 2, size=(len(obs), 2), dtype=np.int8)
+
+
+POLICIES = {
+    "random": random_actions,
+    "tracking": lambda obs, rng: tracking_actions(obs, 0.8, rng),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure VectorPongEnv throughput.")
+    parser.add_argument("--games", type=int, default=4096)
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    args = parser.parse_args(argv)
+
+    env = VectorPongEnv(args.games)
+    policy = POLICIES[args.policy]
+    rng = np.random.default_rng(args.seed)
+    obs, _ = env.reset()
+    finished = 0
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        obs, _, terminated, _, _ = env.step(policy(obs, rng))
+        finished += int(np.count_nonzero(terminated))
+    elapsed = time.perf_counter() - start
+    game_steps = args.games * args.steps
+    print(f"{game_steps} game steps in {elapsed:.2f}s ({game_steps / elapsed:,.0f}/s), {finished} matches finished")
+
+
+if __name__ == "__main__":
+    main()
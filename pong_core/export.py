@@ -0,0 +1,346 @@
+"""Offscreen match rendering to raw video frames.
+
+Replays a recorded input log (or plays an AI-vs-AI match) as fast as the
+machine allows and draws every frame with the games' own drawing code: the
+`draw_table` of ping_pong_cursor.py for Pro Ping-Pong and
+`HyperPongRenderer` for Hyper-Pong. Frames are drawn on an offscreen
+`pygame.Surface`, so no window is opened. Each frame is handed to the sink
+as a memoryview of the surface's pixel buffer, never as a `tostring()`
+copy. Frames can go to:
+
+    --pipe PATH|-     raw frames to a file, FIFO or stdout for an external encoder
+    --encode OUT.mp4  raw frames to an ffmpeg child process
+    --ring PATH       a memory-mapped ring of frame slots (see `FrameRing`)
+
+    python -m pong_core.export match.rec --height 1080 --pipe - | \\
+        ffmpeg -f rawvideo -pix_fmt bgr0 -s 1542x1080 -r 60 -i - highlights.mp4
+
+The pixel format and frame size are printed on stderr before the first frame.
+"""
+import argparse
+import mmap
+import os
+import random
+import shutil
+import struct
+import subprocess
+import sys
+import time
+
+import pygame
+
+from pong_core.ai import AIS, make_ai, track_ball
+from pong_core.controls import LEFT, RIGHT
+from pong_core.engine import GameEngine, GameState
+from pong_core.pro_pong import Match
+from pong_core.renderer import HyperPongRenderer
+from pong_core.replay import GAME_HYPER_PONG, GAME_NAMES, GAME_PRO_PONG, replay_ticks
+from pong_core.rules import HYPER_PONG, PRO_PONG
+from pong_core.startup import font_cache, load_script
+
+FPS = 60
+HOLD_SECONDS = 1.0  # The final frame of each match stays on screen this long
+DEFAULT_MAX_TICKS = 60 * 60 * 30
+PRO_PONG_REACTION = 0.5  # Share of ticks the simulated Pro Ping-Pong paddles react on
+
+
+def pixel_format(surface):
+    """ffmpeg's name for the byte order of a 32-bit surface, e.g. "bgr0" or "rgba"."""
+    if surface.get_bytesize() != 4:
+        raise ValueError("frames must be 32 bits per pixel")
+    channels = ["0"] * 4
+    for channel, mask, shift in zip("rgba", surface.get_masks(), surface.get_shifts()):
+        if mask:
+            channels[shift // 8] = channel
+    if sys.byteorder == "big":
+        channels.reverse()
+    return "".join(channels)
+
+
+# --- Frame sources: (game, match, over) per tick ---
+def simulate_ticks(game, left_ai, right_ai, seed=0, max_ticks=DEFAULT_MAX_TICKS):
+    """Plays one AI-vs-AI match; yields (game, match, over) after every tick.
+
+    Hyper-Pong uses the `pong_core.ai` registry. Those AIs drive a
+    `GameEngine`, so in Pro Ping-Pong both paddles instead follow the ball's
+    center on a PRO_PONG_REACTION share of ticks, and `left_ai` and
+    `right_ai` are ignored.
+    """
+    rng = random.Random(seed)
+    if game == GAME_HYPER_PONG:
+        engine = GameEngine(HYPER_PONG)
+        engine.start_match(seed)
+        left, right = make_ai(left_ai, seed), make_ai(right_ai, seed + 1)
+        for _ in range(max_ticks):
+            engine.step(right(engine, RIGHT), left(engine, LEFT))
+            over = engine.state != GameState.PLAYING
+            yield game, engine, over
+            if over:
+                return
+        return
+
+    match = Match(PRO_PONG)
+    for _ in range(max_ticks):
+        over = match.step(*track_ball(match, LEFT, rng, PRO_PONG_REACTION),
+                          *track_ball(match, RIGHT, rng, PRO_PONG_REACTION))
+        yield game, match, over
+        if over:
+            return
+
+
+# --- Drawing ---
+class FrameRenderer:
+    """Draws matches with the games' own code onto a native-size offscreen surface.
+
+    With `height` set, every frame is also scaled into a preallocated output
+    surface of that height, so scaling makes no allocation per frame either.
+    """
+
+    def __init__(self, game, height=None):
+        pygame.font.init()
+        self.game = game
+        if game == GAME_PRO_PONG:
+            self.script = load_script("pro-pong")
+            size = (PRO_PONG.window_width, PRO_PONG.window_height)
+            self.font = font_cache.get("Arial", 28)
+        else:
+            size = (HYPER_PONG.screen_width, HYPER_PONG.screen_height)
+        self.canvas = pygame.Surface(size, 0, 32)
+        self.frame = self.canvas
+        if height and height != size[1]:
+            width = round(size[0] * height / size[1]) // 2 * 2  # Encoders want even sizes
+            self.frame = pygame.Surface((width, height), 0, self.canvas)
+        if game == GAME_HYPER_PONG:
+            self.renderer = HyperPongRenderer(self.canvas, HYPER_PONG)
+
+    def draw(self, match):
+        """Draws one frame of `match` and returns the output surface."""
+        if self.game == GAME_PRO_PONG:
+            script = self.script
+            labels = script.score_labels(self.font, f"{match.score_a} - {match.score_b}", match.sets_a, match.sets_b)
+            script.draw_table(self.canvas, labels, *match.rects())
+        else:
+            self.renderer.draw(match)
+        if self.frame is not self.canvas:
+            pygame.transform.smoothscale(self.canvas, self.frame.get_size(), self.frame)
+        return self.frame
+
+
+def export(ticks, sink, height=None, fps=FPS):
+    """Renders the matches in `ticks` at `fps` and writes every frame to `sink`.
+
+    Returns (frames, seconds). Matches advancing faster than `fps` (Pro
+    Ping-Pong recorded at 120 or 240 Hz) are sampled once per frame.
+    """
+    renderer = None
+    frames, start = 0, time.perf_counter()
+    hold = round(HOLD_SECONDS * fps)
+    tick = 0
+    for game, match, over in ticks:
+        if renderer is None:
+            renderer = FrameRenderer(game, height)
+            surface = renderer.frame
+            sink.open(surface.get_width(), surface.get_height(), surface.get_pitch(), pixel_format(surface), fps)
+        # Frame boundaries on the match's own clock
+        physics_hz = getattr(match, "physics_hz", FPS)
+        tick += 1
+        if not over and tick * fps // physics_hz == (tick - 1) * fps // physics_hz:
+            continue
+        surface = renderer.draw(match)
+        for _ in range(hold if over else 1):
+            buffer = surface.get_buffer()  # Locks the surface until released
+            with memoryview(buffer) as view:
+                sink.write(view)
+            del buffer
+            frames += 1
+        if over:
+            tick = 0
+    sink.close()
+    return frames, time.perf_counter() - start
+
+
+# --- Sinks ---
+class PipeSink:
+    """Writes raw frames back to back to a binary file object (stdout, a FIFO, a file)."""
+
+    def __init__(self, out):
+        self.out = out
+
+    def open(self, width, height, pitch, pix_fmt, fps):
+        print(f"frames: {width}x{height} {pix_fmt} at {fps} fps", file=sys.stderr)
+
+    def write(self, view):
+        self.out.write(view)
+
+    def close(self):
+        self.out.flush()
+        if self.out is not sys.stdout.buffer:
+            self.out.close()
+
+
+class EncoderSink(PipeSink):
+    """Pipes raw frames into an ffmpeg child process encoding `path`."""
+
+    def __init__(self, path, ffmpeg="ffmpeg"):
+        super().__init__(None)
+        self.path = path
+        self.ffmpeg = ffmpeg
+        self.process = None
+
+    def open(self, width, height, pitch, pix_fmt, fps):
+        super().open(width, height, pitch, pix_fmt, fps)
+        self.process = subprocess.Popen(
+            [self.ffmpeg, "-loglevel", "error", "-y", "-f", "rawvideo", "-pix_fmt", pix_fmt,
+             "-s", f"{width}x{height}", "-r", str(fps), "-i", "-", "-pix_fmt", "yuv420p", self.path],
+            stdin=subprocess.PIPE,
+        )
+        self.out = self.process.stdin
+
+    def close(self):
+        if self.process is not None:
+            self.out.close()
+            self.process.wait()
+
+
+# Ring layout: a 4 KiB header page, then `slots` frames of `frame_size` bytes.
+# The writer bumps `written` after filling slot written % slots; a reader bumps
+# `read` when it is done with a slot. The writer waits while the ring is full.
+RING_MAGIC = b"PONGVID1"
+RING_HEADER = struct.Struct("<8sIIIIII8s")  # magic, width, height, pitch, fps, slots, frame_size, pix_fmt
+RING_COUNTERS = struct.Struct("<QQB")  # written, read, done
+RING_COUNTERS_OFFSET = 64
+RING_DATA_OFFSET = mmap.PAGESIZE
+
+
+class FrameRing:
+    """A memory-mapped ring of frame slots shared with an encoder process."""
+
+    def __init__(self, path, slots=8):
+        self.path = path
+        self.slots = slots
+        self.map = None
+
+    # Writer side (the exporter's sink)
+    def open(self, width, height, pitch, pix_fmt, fps):
+        self.frame_size = pitch * height
+        with open(self.path, "w+b") as out:
+            out.truncate(RING_DATA_OFFSET + self.slots * self.frame_size)
+            self.map = mmap.mmap(out.fileno(), 0)
+        RING_HEADER.pack_into(self.map, 0, RING_MAGIC, width, height, pitch, fps, self.slots, self.frame_size,
+                              pix_fmt.encode())
+        RING_COUNTERS.pack_into(self.map, RING_COUNTERS_OFFSET, 0, 0, 0)
+        print(f"frames: {width}x{height} {pix_fmt} at {fps} fps in {self.path}", file=sys.stderr)
+
+    def write(self, view):
+        written, read, _ = RING_COUNTERS.unpack_from(self.map, RING_COUNTERS_OFFSET)
+        while written - read >= self.slots:
+            time.sleep(0.001)  # Ring full: wait for the reader to free a slot
+            read = RING_COUNTERS.unpack_from(self.map, RING_COUNTERS_OFFSET)[1]
+        offset = RING_DATA_OFFSET + (written % self.slots) * self.frame_size
+        self.map[offset:offset + self.frame_size] = view
+        struct.pack_into("<Q", self.map, RING_COUNTERS_OFFSET, written + 1)
+
+    def close(self):
+        if self.map is not None:
+            struct.pack_into("<B", self.map, RING_COUNTERS_OFFSET + 16, 1)
+            self.map.flush()
+            self.map.close()
+            self.map = None
+
+    # Reader side
+    @classmethod
+    def attach(cls, path):
+        """Opens an existing ring for reading; returns it with its header fields set."""
+        ring = cls(path)
+        with open(path, "r+b") as src:
+            ring.map = mmap.mmap(src.fileno(), 0)
+        magic, ring.width, ring.height, ring.pitch, ring.fps, ring.slots, ring.frame_size, pix_fmt = (
+            RING_HEADER.unpack_from(ring.map, 0)
+        )
+        if magic != RING_MAGIC:
+            raise ValueError(f"{path} is not a frame ring")
+        ring.pix_fmt = pix_fmt.rstrip(b"\0").decode()
+        return ring
+
+    def frames(self, poll=0.001):
+        """Yields each frame as a memoryview into the ring until the writer is done.
+
+        A view is only valid until the next frame is requested, when its slot
+        is handed back to the writer.
+        """
+        data = memoryview(self.map)
+        while True:
+            written, read, done = RING_COUNTERS.unpack_from(self.map, RING_COUNTERS_OFFSET)
+            if read == written:
+                if done:
+                    return
+                time.sleep(poll)
+                continue
+            offset = RING_DATA_OFFSET + (read % self.slots) * self.frame_size
+            view = data[offset:offset + self.frame_size]
+            yield view
+            view.release()
+            struct.pack_into("<Q", self.map, RING_COUNTERS_OFFSET + 8, read + 1)
+
+
+class NullSink:
+    """Discards frames; measures drawing throughput alone."""
+
+    def open(self, width, height, pitch, pix_fmt, fps):
+        pass
+
+    def write(self, view):
+        pass
+
+    def close(self):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a replayed or simulated match to raw video frames.")
+    parser.add_argument("log", nargs="?", help="input log recorded with --record (see pong_core.replay)")
+    parser.add_argument("--simulate", choices=sorted(GAME_NAMES.values()),
+                        help="play an AI-vs-AI match of this game instead of replaying a log")
+    parser.add_argument("--ai", action="append", choices=sorted(AIS),
+                        help="left then right Hyper-Pong AI for --simulate (default: sluggish vs sluggish)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--seconds", type=float, help="stop a simulated match after this much play")
+    parser.add_argument("--height", type=int, help="output height, e.g. 1080 (default: the game's window size)")
+    parser.add_argument("--fps", type=int, default=FPS)
+    sinks = parser.add_mutually_exclusive_group(required=True)
+    sinks.add_argument("--pipe", metavar="PATH", help="write raw frames to PATH, or - for stdout")
+    sinks.add_argument("--encode", metavar="OUT", help="encode to OUT with ffmpeg")
+    sinks.add_argument("--ring", metavar="PATH", help="publish frames in a memory-mapped ring file")
+    sinks.add_argument("--null", action="store_true", help="draw frames but discard them (throughput test)")
+    parser.add_argument("--slots", type=int, default=8, help="frames held by --ring")
+    args = parser.parse_args(argv)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Frames are drawn offscreen, never in a window
+
+    if args.simulate:
+        left, right = (args.ai or []) + ["sluggish"] * (2 - len(args.ai or []))
+        game = {name: game_id for game_id, name in GAME_NAMES.items()}[args.simulate]
+        max_ticks = round(args.seconds * FPS) if args.seconds else DEFAULT_MAX_TICKS
+        ticks = simulate_ticks(game, left, right, args.seed, max_ticks)
+    elif args.log:
+        ticks = replay_ticks(args.log)
+    else:
+        parser.error("give an input log or --simulate GAME")
+
+    if args.encode:
+        if shutil.which("ffmpeg") is None:
+            parser.error("--encode needs ffmpeg on PATH; use --pipe to feed another encoder")
+        sink = EncoderSink(args.encode)
+    elif args.ring:
+        sink = FrameRing(args.ring, args.slots)
+    elif args.null:
+        sink = NullSink()
+    else:
+        sink = PipeSink(sys.stdout.buffer if args.pipe == "-" else open(args.pipe, "wb"))
+
+    frames, elapsed = export(ticks, sink, args.height, args.fps)
+    print(f"{frames} frames in {elapsed:.2f}s ({frames / elapsed:.0f} fps, "
+          f"{frames / args.fps / elapsed:.1f}x real time)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Adaptive render quality for machines that cannot hold the frame rate.
+
+`QualityGovernor` watches how long recent frames took to process, not
+counting the time `clock.tick` sleeps (`Clock.get_rawtime()`). When the
+90th percentile of the last `window` frames uses more than `high` of the
+frame budget, it turns off the most expensive render feature still on. When
+it falls under `low`, it turns the last one back on. After every change it
+waits `cooldown` frames, so one change is measured before the next.
+
+Features are named by the games, most expensive first, e.g. Hyper-Pong's
+
+    ("gradient", "antialias")   gradient to solid color, then bitmap text
+
+Only drawing changes. Physics runs from a `FixedTimestep`, so a slow frame
+runs more physics steps and the game speed does not change.
+"""
+from collections import deque
+
+QUALITY_MODES = ("auto", "high", "low")
+
+
+class QualityGovernor:
+    """Steps render features down under load and back up when there is headroom."""
+
+    def __init__(self, features, fps=60, mode="auto", window=30, high=0.85, low=0.5, cooldown=60):
+        self.features = tuple(features)  # Dropped first to last, restored last to first
+        self.budget = 1.0 / fps
+        self.mode = mode
+        self.samples = deque(maxlen=window)
+        self.high = high
+        self.low = low
+        self.cooldown = cooldown
+        self.wait = 0
+        self.changes = 0
+        self.level = len(self.features) if mode == "low" else 0  # Features turned off
+
+    def enabled(self, feature):
+        return self.features.index(feature) >= self.level
+
+    def load(self):
+        """90th percentile frame work over the window, as a share of the frame budget."""
+        ordered = sorted(self.samples)
+        return ordered[int(len(ordered) * 0.9)] / self.budget
+
+    def frame(self, work):
+        """Records one frame's work in seconds; returns True when the quality level changed."""
+        if self.mode != "auto":
+            return False
+        samples = self.samples
+        samples.append(work)
+        if self.wait:
+            self.wait -= 1
+            return False
+        if len(samples) < samples.maxlen:
+            return False
+        load = self.load()
+        if load > self.high and self.level < len(self.features):
+            self.level += 1
+        elif load < self.low and self.level > 0:
+            self.level -= 1
+        else:
+            return False
+        samples.clear()
+        self.wait = self.cooldown
+        self.changes += 1
+        return True
@@ -0,0 +1,209 @@
+"""Paddle input sources that produce `pong_core.controls` masks.
+
+A source's `poll()` returns the control mask for the next physics tick.
+Sources that read pygame events also take `handle_event(event)`:
+
+    KeyboardSource  W/S and Up/Down from KEYDOWN/KEYUP events
+    AISource        a `pong_core.ai` AI driving one side of a `GameEngine`
+    ReplaySource    the inputs of one match in a `pong_core.replay` log
+    NetworkSource   a `pong_core.net` server player's queued inputs
+    MailboxSource   a controller process writing a `pong_core.shared_state` mailbox
+
+`Inputs` combines several sources, each usually owning one side's bits.
+The keyboard mask is kept from events rather than by polling
+`pygame.key.get_pressed()` each frame. A KEYUP lost while the window was
+unfocused cannot leave a paddle moving, because losing focus releases
+every key and regaining it rereads the keyboard once. Nothing else reads
+SDL's keyboard state, so headless runs never touch it.
+
+Every mask change is stamped with `time.perf_counter()`. `Inputs.latency`
+is the delay from the newest change to the physics tick that first used it.
+"""
+import time
+
+import pygame
+
+from pong_core import controls
+from pong_core.ai import make_ai
+from pong_core.controls import LEFT, RIGHT, SIDE_BITS
+
+# Keys of every game: W/S move the left paddle, Up/Down the right one
+KEYMAP = {
+    pygame.K_w: controls.LEFT_UP,
+    pygame.K_s: controls.LEFT_DOWN,
+    pygame.K_UP: controls.RIGHT_UP,
+    pygame.K_DOWN: controls.RIGHT_DOWN,
+}
+
+APPINPUTFOCUS = 2  # ACTIVEEVENT state bit for keyboard focus
+MAILBOX_TIMEOUT = 30  # Ticks a controller's direction is held without a new message
+
+
+class InputSource:
+    """A control mask and the time it last changed."""
+
+    def __init__(self):
+        self.mask = 0
+        self.changed_at = 0.0
+
+    def set(self, mask):
+        if mask != self.mask:
+            self.mask = mask
+            self.changed_at = time.perf_counter()
+
+    def handle_event(self, event):
+        """Updates the mask from a pygame event; returns True if the event was consumed."""
+        return False
+
+    def poll(self):
+        return self.mask
+
+
+class KeyboardSource(InputSource):
+    """Held keys as control bits, kept from events and resynced on focus changes."""
+
+    def __init__(self, keymap=KEYMAP, sides=(LEFT, RIGHT)):
+        super().__init__()
+        bits = sum(bit for side in sides for bit in SIDE_BITS[side])
+        self.keymap = {key: bit for key, bit in keymap.items() if bit & bits}
+
+    def handle_event(self, event):
+        kind = event.type
+        if kind == pygame.KEYDOWN or kind == pygame.KEYUP:
+            bit = self.keymap.get(event.key)
+            if bit is None:
+                return False
+            self.set(self.mask | bit if kind == pygame.KEYDOWN else self.mask & ~bit)
+            return True
+        if kind == pygame.ACTIVEEVENT and event.state & APPINPUTFOCUS:
+            self.refocus(event.gain)
+        elif kind == pygame.WINDOWFOCUSLOST:
+            self.refocus(False)
+        elif kind == pygame.WINDOWFOCUSGAINED:
+            self.refocus(True)
+        return False
+
+    def refocus(self, gained):
+        """Releases every key on focus loss; rereads the keyboard on focus gain."""
+        if not gained:
+            self.set(0)
+            return
+        pressed = pygame.key.get_pressed()
+        self.set(sum(bit for key, bit in self.keymap.items() if pressed[key]))
+
+
+class AISource(InputSource):
+    """An AI from the `pong_core.ai` registry steering one side of a `GameEngine`."""
+
+    def __init__(self, engine, side, ai="predictive-medium", seed=None):
+        super().__init__()
+        self.engine = engine
+        self.side = side
+        self.ai = make_ai(ai, seed) if isinstance(ai, str) else ai
+        self.bits = SIDE_BITS[side]
+
+    def poll(self):
+        self.set(controls.from_direction(self.ai(self.engine, self.side), *self.bits))
+        return self.mask
+
+
+class ReplaySource(InputSource):
+    """Plays back the inputs of one match in a replay log, one tick per `poll`."""
+
+    def __init__(self, path, match_index=0):
+        from pong_core.replay import GAME_PRO_PONG, read_log
+
+        super().__init__()
+        records = read_log(path)
+        _, self.game = next(records)
+        self.runs = []  # (mask, ticks) of the chosen match
+        matches = -1
+        for record in records:
+            if record[0] == "match":
+                matches += 1
+            elif record[0] == "input" and matches == match_index:
+                inputs, run = record[1], record[2]
+                if self.game == GAME_PRO_PONG:
+                    mask = inputs[0]
+                else:  # Hyper-Pong logs (player, opponent) directions
+                    mask = (controls.from_direction(inputs[0], *SIDE_BITS[RIGHT])
+                            | controls.from_direction(inputs[1], *SIDE_BITS[LEFT]))
+                self.runs.append((mask, run))
+        self.runs.reverse()
+        self.left = 0
+        self.done = not self.runs
+
+    def poll(self):
+        if self.left == 0:
+            if not self.runs:
+                self.done = True
+                self.set(0)
+                return 0
+            mask, self.left = self.runs.pop()
+            self.set(mask)
+        self.left -= 1
+        return self.mask
+
+
+class NetworkSource(InputSource):
+    """A remote player's inputs as queued by a `pong_core.net` server `Player`."""
+
+    def __init__(self, player):
+        super().__init__()
+        self.player = player
+
+    def poll(self):
+        self.set(self.player.next_input())
+        return self.mask
+
+
+class MailboxSource(InputSource):
+    """A controller process steering one paddle through a `SharedState` mailbox."""
+
+    def __init__(self, shared, side):
+        super().__init__()
+        self.shared = shared
+        self.bits = SIDE_BITS[side]
+        self.seq = 0
+        self.idle = 0
+
+    def poll(self):
+        seq, direction = self.shared.mailbox()
+        if seq != self.seq:
+            self.seq = seq
+            self.idle = 0
+            self.set(controls.from_direction(direction, *self.bits))
+            self.shared.acknowledge(seq)
+        else:
+            self.idle += 1
+            if self.idle >= MAILBOX_TIMEOUT:
+                self.set(0)
+        return self.mask
+
+
+class Inputs:
+    """Several sources combined into one control mask per physics tick."""
+
+    def __init__(self, *sources):
+        self.sources = sources
+        self.used_at = 0.0  # Stamp of the newest change a tick has used
+        self.latency = 0.0
+
+    def handle_event(self, event):
+        consumed = False
+        for source in self.sources:
+            consumed = source.handle_event(event) or consumed
+        return consumed
+
+    def poll(self):
+        """The combined mask for this physics tick."""
+        mask = 0
+        changed_at = self.used_at
+        for source in self.sources:
+            mask |= source.poll()
+            if source.changed_at > changed_at:
+                changed_at = source.changed_at
+        if changed_at > self.used_at:
+            self.used_at = changed_at
+            self.latency = time.perf_counter() - changed_at
+        return mask
@@ -0,0 +1,542 @@
+"""Networked Pro Ping-Pong: an authoritative asyncio UDP server and its client.
+
+The server runs every match's `Match` physics (ping_pong_cursor.py rules) at
+a fixed tick in one event loop, so a single process hosts many matches. Each
+client sends its own paddle's control bits, numbered per client tick, and
+repeats the last few unacknowledged ones in every packet so a lost datagram
+costs nothing. The server answers every tick with the match state encoded as
+a delta against the last state that client acknowledged.
+
+Clients predict their own paddle by applying their input immediately. When a
+state arrives they take the server's paddle position and re-apply the inputs
+the server has not processed yet (reconciliation); the ball and the other
+paddle are drawn as the server sent them.
+
+Packets (little-endian):
+
+    JOIN     tag, match id (u32)
+    WELCOME  tag, match id (u32), side (u8: 0 left, 1 right), physics Hz (u16)
+    REJECT   tag, match id (u32)
+    INPUT    tag, state ack (u32), first seq (u32), count (u8), count control masks
+    LEAVE    tag
+    STATE    tag, tick (u32), base tick (u32), input ack (u32), field mask (u16), changed fields
+
+Everything can be tried on one machine, with simulated latency and loss:
+
+    python -m pong_core.net bots --matches 50 --latency 0.05 --jitter 0.02 --loss 0.1
+    python -m pong_core.net server --port 50007
+"""
+import argparse
+import asyncio
+import random
+import socket
+import struct
+import time
+
+from pong_core import controls
+from pong_core.ai import track_ball
+from pong_core.controls import LEFT, RIGHT, SIDE_BITS
+from pong_core.delta import all_fields, changed_mask, pack_fields, unpack_fields
+from pong_core.pro_pong import Match
+from pong_core.rules import PRO_PONG
+
+DEFAULT_PORT = 50007
+SIDES = (LEFT, RIGHT)  # Wire order of the side byte
+
+# --- Packets ---
+JOIN = 1
+WELCOME = 2
+REJECT = 3
+INPUT = 4
+LEAVE = 5
+STATE = 6
+
+JOIN_PACKET = struct.Struct("<BI")
+WELCOME_PACKET = struct.Struct("<BIBH")
+REJECT_PACKET = struct.Struct("<BI")
+INPUT_HEADER = struct.Struct("<BIIB")
+STATE_HEADER = struct.Struct("<BIIIH")
+
+FULL = 0xFFFFFFFF  # Base tick of a state that carries every field
+
+# --- Match status (the last state field) ---
+WAITING = 0
+PLAYING = 1
+OVER = 2
+ABANDONED = 3  # A player left or timed out before the match was won
+ENDED = (OVER, ABANDONED)
+
+# State fields in wire order; a delta sends only the ones set in its mask
+FIELDS = (
+    ("ball_x", struct.Struct("<f")),
+    ("ball_y", struct.Struct("<f")),
+    ("ball_dx", struct.Struct("<f")),
+    ("ball_dy", struct.Struct("<f")),
+    ("p1_y", struct.Struct("<f")),
+    ("p2_y", struct.Struct("<f")),
+    ("score_a", struct.Struct("<B")),
+    ("score_b", struct.Struct("<B")),
+    ("sets_a", struct.Struct("<B")),
+    ("sets_b", struct.Struct("<B")),
+    ("status", struct.Struct("<B")),
+)
+ALL_FIELDS = all_fields(FIELDS)
+STATUS = len(FIELDS) - 1
+
+HISTORY = 64  # Ticks of states kept as delta bases (about a second at 60 Hz)
+REDUNDANCY = 8  # Unacknowledged inputs repeated in every INPUT packet
+MAX_QUEUED = 4  # Inputs buffered per player before old ones are skipped
+PLAYER_TIMEOUT = 5.0  # Seconds of silence before a player is dropped
+OVER_LINGER = 2.0  # Seconds an ended match keeps sending its final state
+
+
+def encode_state(tick, snapshot, input_ack, base_tick=FULL, base=None):
+    """A STATE packet holding the fields of `snapshot` that differ from `base`."""
+    if base is None:
+        base_tick, mask = FULL, ALL_FIELDS
+    else:
+        mask = changed_mask(snapshot, base)
+    return STATE_HEADER.pack(STATE, tick, base_tick, input_ack, mask) + pack_fields(FIELDS, mask, snapshot)
+
+
+def decode_state(data, bases):
+    """Returns (tick, snapshot, input_ack), or None when the delta's base is unknown."""
+    _, tick, base_tick, input_ack, mask = STATE_HEADER.unpack_from(data)
+    if base_tick == FULL:
+        values = [None] * len(FIELDS)
+    else:
+        base = bases.get(base_tick)
+        if base is None:
+            return None
+        values = list(base)
+    unpack_fields(FIELDS, mask, data, STATE_HEADER.size, values)
+    if None in values:
+        return None
+    return tick, tuple(values), input_ack
+
+
+class LossyTransport:
+    """Wraps a datagram transport's `sendto` with simulated latency, jitter and loss.
+
+    Jitter also reorders packets, as a real network does.
+    """
+
+    def __init__(self, transport, latency=0.0, jitter=0.0, loss=0.0, seed=None):
+        self.transport = transport
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.sent = self.dropped = self.bytes_sent = 0
+
+    def sendto(self, data, addr=None):
+        if self.loss and self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        self.sent += 1
+        self.bytes_sent += len(data)
+        delay = self.latency + (self.rng.uniform(0.0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, self._send, data, addr)
+        else:
+            self._send(data, addr)
+
+    def _send(self, data, addr):
+        if not self.transport.is_closing():
+            self.transport.sendto(data, addr)
+
+    def close(self):
+        self.transport.close()
+
+
+# --- Server ---
+class Player:
+    """One connected client: its side, queued inputs and acknowledgements."""
+
+    __slots__ = ("addr", "room", "side", "inputs", "acked", "bits", "state_ack", "last_heard")
+
+    def __init__(self, addr, room, side, now):
+        self.addr = addr
+        self.room = room
+        self.side = side
+        self.inputs = {}  # seq -> control mask, not applied yet
+        self.acked = 0  # Last input seq applied by the server
+        self.bits = 0  # Held controls, repeated while no new input arrives
+        self.state_ack = None  # Last state tick the client has decoded
+        self.last_heard = now
+
+    def queue(self, first_seq, masks):
+        allowed = SIDE_BITS[self.side][0] | SIDE_BITS[self.side][1]
+        for offset, mask in enumerate(masks):
+            seq = first_seq + offset
+            if seq > self.acked:
+                self.inputs[seq] = mask & allowed
+
+    def next_input(self):
+        """The control mask for this tick: the oldest queued input, else the held one."""
+        while len(self.inputs) > MAX_QUEUED:
+            # The client got ahead (a burst after a stall): skip rather than lag
+            del self.inputs[min(self.inputs)]
+        if self.inputs:
+            seq = min(self.inputs)
+            self.bits = self.inputs.pop(seq)
+            self.acked = seq
+        return self.bits
+
+
+class Room:
+    """One match on the server, with up to two players."""
+
+    __slots__ = ("match_id", "match", "players", "tick", "history", "status", "over_ticks")
+
+    def __init__(self, match_id, rules, physics_hz, collision):
+        self.match_id = match_id
+        self.match = Match(rules, physics_hz, collision)
+        self.players = {}  # side -> Player
+        self.tick = 0
+        self.history = {}  # tick -> snapshot
+        self.status = WAITING
+        self.over_ticks = 0
+
+    def snapshot(self):
+        match = self.match
+        return tuple(getattr(match, name) for name, _ in FIELDS[:STATUS]) + (self.status,)
+
+    def step(self):
+        if self.status == PLAYING:
+            mask = self.players[LEFT].next_input() | self.players[RIGHT].next_input()
+            if self.match.step(*controls.unpack(mask)):
+                self.status = OVER
+        elif self.status in ENDED:
+            self.over_ticks += 1
+        self.tick += 1
+        self.history[self.tick] = self.snapshot()
+        self.history.pop(self.tick - HISTORY, None)
+
+    def state_for(self, player):
+        base = self.history.get(player.state_ack) if player.state_ack is not None else None
+        return encode_state(self.tick, self.history[self.tick], player.acked, player.state_ack, base)
+
+
+class PongServer(asyncio.DatagramProtocol):
+    """Authoritative server for any number of concurrent matches."""
+
+    def __init__(self, rules=PRO_PONG, physics_hz=None, collision="rect",
+                 latency=0.0, jitter=0.0, loss=0.0, seed=None):
+        self.rules = rules
+        self.physics_hz = physics_hz or rules.fps
+        self.collision = collision
+        self.network = dict(latency=latency, jitter=jitter, loss=loss, seed=seed)
+        self.transport = None
+        self.rooms = {}
+        self.players = {}  # addr -> Player
+        self.ticks = 0
+
+    def connection_made(self, transport):
+        self.transport = LossyTransport(transport, **self.network)
+
+    def datagram_received(self, data, addr):
+        if not data:
+            return
+        now = time.monotonic()
+        tag = data[0]
+        player = self.players.get(addr)
+        if player is not None:
+            player.last_heard = now
+
+        if tag == JOIN and len(data) >= JOIN_PACKET.size:
+            _, match_id = JOIN_PACKET.unpack_from(data)
+            self.join(addr, match_id, now)
+        elif tag == INPUT and player is not None and len(data) >= INPUT_HEADER.size:
+            _, state_ack, first_seq, count = INPUT_HEADER.unpack_from(data)
+            if state_ack:
+                player.state_ack = state_ack
+            player.queue(first_seq, data[INPUT_HEADER.size:INPUT_HEADER.size + count])
+        elif tag == LEAVE and player is not None:
+            self.drop(player)
+
+    def join(self, addr, match_id, now):
+        player = self.players.get(addr)
+        if player is None:
+            room = self.rooms.get(match_id)
+            if room is None:
+                room = self.rooms[match_id] = Room(match_id, self.rules, self.physics_hz, self.collision)
+            free = [side for side in SIDES if side not in room.players]
+            if not free or room.status != WAITING:
+                self.transport.sendto(REJECT_PACKET.pack(REJECT, match_id), addr)
+                return
+            player = self.players[addr] = Player(addr, room, free[0], now)
+            room.players[player.side] = player
+            if len(room.players) == 2:
+                room.status = PLAYING
+        # Also answers a repeated JOIN whose WELCOME was lost
+        side = SIDES.index(player.side)
+        self.transport.sendto(WELCOME_PACKET.pack(WELCOME, match_id, side, self.physics_hz), addr)
+
+    def drop(self, player):
+        """Removes a player; a match under way ends as abandoned."""
+        room = player.room
+        del self.players[player.addr]
+        room.players.pop(player.side, None)
+        if room.status == PLAYING:
+            room.status = ABANDONED
+        if not room.players:
+            self.rooms.pop(room.match_id, None)
+
+    def tick(self):
+        """Steps every match once and sends each player its state."""
+        self.ticks += 1
+        linger = int(OVER_LINGER * self.physics_hz)
+        for room in list(self.rooms.values()):
+            room.step()
+            for player in room.players.values():
+                self.transport.sendto(room.state_for(player), player.addr)
+            if room.status in ENDED and room.over_ticks >= linger:
+                for player in list(room.players.values()):
+                    self.drop(player)
+        if self.ticks % self.physics_hz == 0:
+            now = time.monotonic()
+            for player in [p for p in self.players.values() if now - p.last_heard > PLAYER_TIMEOUT]:
+                self.drop(player)
+
+    async def run(self, stop=None):
+        """Ticks at `physics_hz` until `stop` (an asyncio.Event) is set."""
+        loop = asyncio.get_running_loop()
+        dt = 1.0 / self.physics_hz
+        next_tick = loop.time()
+        while stop is None or not stop.is_set():
+            self.tick()
+            next_tick += dt
+            delay = next_tick - loop.time()
+            if delay < -0.25:
+                next_tick = loop.time()  # Fell far behind: resume, don't burst
+            await asyncio.sleep(max(0.0, delay))
+
+
+# --- Client ---
+class NetClient:
+    """Client-side state of one networked match, independent of any socket.
+
+    Feed received datagrams to `receive`; send what `join_packet` and
+    `input_packet` return. `match` holds the latest server state with the
+    local paddle predicted ahead of it, ready for `match.rects()`.
+    """
+
+    def __init__(self, match_id, rules=PRO_PONG):
+        self.match_id = match_id
+        self.rules = rules
+        self.side = None
+        self.rejected = False
+        self.match = Match(rules)
+        self.status = WAITING
+        self.seq = 0
+        self.pending = []  # (seq, mask) sent but not yet applied by the server
+        self.state_tick = 0
+        self.states = {}  # tick -> snapshot, the bases for the server's deltas
+        self.states_received = self.bytes_received = self.corrections = 0
+
+    def join_packet(self):
+        return JOIN_PACKET.pack(JOIN, self.match_id)
+
+    def leave_packet(self):
+        return bytes((LEAVE,))
+
+    def input_packet(self, up, down):
+        """Predicts one tick of the local paddle and returns the INPUT packet for it."""
+        up_bit, down_bit = SIDE_BITS[self.side]
+        mask = (up_bit if up else 0) | (down_bit if down else 0)
+        self.seq += 1
+        self.pending.append((self.seq, mask))
+        del self.pending[:-HISTORY]  # Server unreachable: keep the tail only
+        self.match.move_paddles(*controls.unpack(mask))
+
+        recent = self.pending[-REDUNDANCY:]
+        header = INPUT_HEADER.pack(INPUT, self.state_tick, recent[0][0], len(recent))
+        return header + bytes(mask for _, mask in recent)
+
+    def receive(self, data):
+        if not data:
+            return
+        self.bytes_received += len(data)
+        tag = data[0]
+        if tag == WELCOME and len(data) >= WELCOME_PACKET.size:
+            _, match_id, side, physics_hz = WELCOME_PACKET.unpack_from(data)
+            if self.side is None and match_id == self.match_id:
+                self.side = SIDES[side]
+                self.match = Match(self.rules, physics_hz)
+        elif tag == REJECT:
+            self.rejected = True
+        elif tag == STATE and len(data) >= STATE_HEADER.size and self.side is not None:
+            decoded = decode_state(data, self.states)
+            if decoded is not None and decoded[0] > self.state_tick:
+                self.apply_state(*decoded)
+
+    def apply_state(self, tick, snapshot, input_ack):
+        """Adopts a server state, then re-applies the inputs it has not seen yet."""
+        self.states_received += 1
+        self.state_tick = tick
+        states = self.states
+        states[tick] = snapshot
+        # Not just tick - HISTORY: states lost on the way never arrive to be evicted
+        for old in [old for old in states if old <= tick - HISTORY]:
+            del states[old]
+
+        own = "p1_y" if self.side == LEFT else "p2_y"
+        predicted = getattr(self.match, own)
+        for (name, _), value in zip(FIELDS[:STATUS], snapshot):
+            setattr(self.match, name, value)
+        self.status = snapshot[STATUS]
+
+        self.pending = [(seq, mask) for seq, mask in self.pending if seq > input_ack]
+        for _, mask in self.pending:
+            self.match.move_paddles(*controls.unpack(mask))
+        if abs(getattr(self.match, own) - predicted) > 1e-3:
+            self.corrections += 1
+        self.match.snap()
+
+
+class UdpClient:
+    """Non-blocking socket for a `NetClient` inside a frame loop (no asyncio)."""
+
+    def __init__(self, client, host, port):
+        self.client = client
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.sock.connect((host, port))
+
+    def send(self, data):
+        try:
+            self.sock.send(data)
+        except OSError:
+            pass  # Unreachable server: the next packet tries again
+
+    def poll(self):
+        """Feeds every datagram that has arrived to the client."""
+        while True:
+            try:
+                data = self.sock.recv(2048)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return  # ICMP port unreachable and the like
+            self.client.receive(data)
+
+    def close(self):
+        self.sock.close()
+
+
+# --- Bots (asyncio clients, for load and latency testing) ---
+class _ClientProtocol(asyncio.DatagramProtocol):
+    def __init__(self, client):
+        self.client = client
+
+    def datagram_received(self, data, addr):
+        self.client.receive(data)
+
+
+async def run_bot(host, port, match_id, seconds, latency=0.0, jitter=0.0, loss=0.0, seed=None):
+    """Plays one side of a match until it ends or `seconds` pass; returns the client."""
+    loop = asyncio.get_running_loop()
+    client = NetClient(match_id)
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _ClientProtocol(client), remote_addr=(host, port)
+    )
+    link = LossyTransport(transport, latency, jitter, loss, seed)
+    rng = random.Random(seed)
+    deadline = loop.time() + seconds
+    next_tick = loop.time()
+    ticks = frozen = 0
+    try:
+        while loop.time() < deadline and client.status not in ENDED and not client.rejected:
+            if client.side is None:
+                if ticks % 15 == 0:
+                    link.sendto(client.join_packet())
+            else:
+                up, down = track_ball(client.match, client.side)
+                if frozen or rng.random() < 0.02:
+                    # Now and then stop for half a second, so points get scored
+                    frozen = frozen - 1 if frozen else 30
+                    up = down = False
+                link.sendto(client.input_packet(up, down))
+            ticks += 1
+            next_tick += 1.0 / client.match.physics_hz
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        link.sendto(client.leave_packet())
+    finally:
+        await asyncio.sleep(latency + jitter)  # Let delayed packets go out
+        transport.close()
+    return client
+
+
+async def run_bots(matches, seconds, port=0, latency=0.0, jitter=0.0, loss=0.0, seed=0):
+    """Runs a local server and two bots per match; returns (server, clients)."""
+    loop = asyncio.get_running_loop()
+    server = PongServer(latency=latency, jitter=jitter, loss=loss, seed=seed)
+    transport, _ = await loop.create_datagram_endpoint(lambda: server, local_addr=("127.0.0.1", port))
+    port = transport.get_extra_info("sockname")[1]
+    stop = asyncio.Event()
+    ticking = asyncio.create_task(server.run(stop))
+    try:
+        clients = await asyncio.gather(*(
+            run_bot("127.0.0.1", port, match_id, seconds, latency, jitter, loss, seed + 2 * match_id + side)
+            for match_id in range(1, matches + 1) for side in range(2)
+        ))
+    finally:
+        stop.set()
+        await ticking
+        transport.close()
+    return server, clients
+
+
+async def serve(host, port, physics_hz=None, collision="rect", latency=0.0, jitter=0.0, loss=0.0):
+    loop = asyncio.get_running_loop()
+    server = PongServer(physics_hz=physics_hz, collision=collision,
+                        latency=latency, jitter=jitter, loss=loss)
+    transport, _ = await loop.create_datagram_endpoint(lambda: server, local_addr=(host, port))
+    print(f"serving Pro Ping-Pong on {host}:{port} at {server.physics_hz} Hz")
+    try:
+        await server.run()
+    finally:
+        transport.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Networked Pro Ping-Pong server and load test.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    server_cmd = commands.add_parser("server", help="run an authoritative match server")
+    server_cmd.add_argument("--host", default="0.0.0.0")
+    server_cmd.add_argument("--port", type=int, default=DEFAULT_PORT)
+    server_cmd.add_argument("--physics-hz", type=int, default=None)
+    server_cmd.add_argument("--collision", choices=("rect", "swept"), default="rect")
+    bots_cmd = commands.add_parser("bots", help="local server plus bot clients, with statistics")
+    bots_cmd.add_argument("--matches", type=int, default=10)
+    bots_cmd.add_argument("--seconds", type=float, default=10.0)
+    bots_cmd.add_argument("--seed", type=int, default=0)
+    for command in (server_cmd, bots_cmd):
+        command.add_argument("--latency", type=float, default=0.0, help="one-way delay added per packet (s)")
+        command.add_argument("--jitter", type=float, default=0.0, help="extra random delay, up to this (s)")
+        command.add_argument("--loss", type=float, default=0.0, help="fraction of packets dropped")
+    args = parser.parse_args(argv)
+
+    if args.command == "server":
+        asyncio.run(serve(args.host, args.port, args.physics_hz, args.collision,
+                          args.latency, args.jitter, args.loss))
+        return
+
+    server, clients = asyncio.run(
+        run_bots(args.matches, args.seconds, 0, args.latency, args.jitter, args.loss, args.seed)
+    )
+    states = sum(client.states_received for client in clients)
+    received = sum(client.bytes_received for client in clients)
+    sent = server.transport.sent
+    finished = sum(client.status == OVER for client in clients) // 2
+    print(f"{args.matches} matches, {len(clients)} clients, {server.ticks} server ticks "
+          f"({server.ticks / args.seconds:.1f}/s), {finished} finished")
+    print(f"server sent {sent} packets ({server.transport.bytes_sent / max(sent, 1):.1f} B avg), "
+          f"dropped {server.transport.dropped}")
+    print(f"clients decoded {states} states ({received / max(states, 1):.1f} B/state incl. handshakes), "
+          f"{sum(client.corrections for client in clients)} prediction corrections")
+
+
+if __name__ == "__main__":
+    main()
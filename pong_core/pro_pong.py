@@ -0,0 +1,193 @@
+"""Pro Ping-Pong match physics without a display.
+
+`Match` is the physics of `run_game` in ping_pong_cursor.py, stepped one
+fixed tick at a time so it can run under the interactive loop, in replays and
+in headless tools alike. Speeds and cooldowns are tuned per frame at
+`rules.fps`; at other physics rates they are scaled so a second of play
+looks the same at 60, 120 or 240 Hz.
+"""
+import pygame
+
+from pong_core.collision import sweep_box
+from pong_core.rules import PRO_PONG
+from pong_core.scoring import check_game_won, check_match_won
+from pong_core.timestep import lerp
+
+# Collision: "rect" overlap test per tick, "swept" exact time of impact
+COLLISION_MODES = ("rect", "swept")
+
+
+def clamp(value, low, high):
+    return max(low, min(high, value))
+
+
+class Match:
+    """Ball, paddles, scores and cooldowns of one match, stepped at a fixed rate."""
+
+    __slots__ = (
+        "rules", "physics_hz", "scale", "swept", "sets_to_win",
+        "play_y", "play_bottom", "left_x", "right_x",
+        "ball_x", "ball_y", "ball_dx", "ball_dy", "p1_y", "p2_y",
+        "score_a", "score_b", "sets_a", "sets_b",
+        "serve_cooldown", "paddle_hit_cooldown", "prev",
+    )
+
+    def __init__(self, rules=PRO_PONG, physics_hz=None, collision="rect"):
+        self.rules = rules
+        self.physics_hz = physics_hz or rules.fps
+        self.scale = rules.fps / self.physics_hz
+        self.swept = (collision == "swept")
+        self.sets_to_win = rules.best_of // 2 + 1
+
+        self.play_y = rules.top_bar_h
+        self.play_bottom = rules.window_height
+        self.left_x = rules.paddle_margin
+        self.right_x = rules.window_width - rules.paddle_margin - rules.paddle_width
+
+        # Setup Positions
+        play_h = self.play_bottom - self.play_y
+        self.p1_y = float(self.play_y + (play_h - rules.paddle_height) // 2)
+        self.p2_y = float(self.play_y + (play_h - rules.paddle_height) // 2)
+        self.score_a, self.score_b = 0, 0
+        self.sets_a, self.sets_b = 0, 0
+        self.serve(scored_by_a=True)
+
+    def frames(self, count):
+        """Converts a cooldown in frames at `rules.fps` to physics ticks."""
+        return int(round(count / self.scale))
+
+    def serve(self, scored_by_a):
+        """Resets the ball to the center, heading toward the player who lost the point."""
+        rules = self.rules
+        self.ball_x = float(rules.window_width // 2)
+        self.ball_y = float(self.play_y + (self.play_bottom - self.play_y) // 2)
+        self.ball_dx = float(rules.ball_speed_initial if scored_by_a else -rules.ball_speed_initial)
+        self.ball_dy = 3.0
+        self.serve_cooldown, self.paddle_hit_cooldown = self.frames(60), 0
+        self.snap()
+
+    def snap(self):
+        """Drops interpolation history so the next frame draws the current state."""
+        self.prev = (self.ball_x, self.ball_y, self.p1_y, self.p2_y)
+
+    def step(self, p1_up, p1_down, p2_up, p2_down):
+        """Advances one physics tick; returns True once a player has won the match."""
+        self.prev = (self.ball_x, self.ball_y, self.p1_y, self.p2_y)
+        self.move_paddles(p1_up, p1_down, p2_up, p2_down)
+        self.move_ball()
+        return self.check_score()
+
+    def move_paddles(self, p1_up, p1_down, p2_up, p2_down):
+        speed = self.rules.paddle_speed * self.scale
+        lowest = self.play_bottom - self.rules.paddle_height
+        # Player 1 (Left)
+        if p1_up and self.p1_y > self.play_y: self.p1_y -= speed
+        if p1_down and self.p1_y < lowest: self.p1_y += speed
+        # Player 2 (Right)
+        if p2_up and self.p2_y > self.play_y: self.p2_y -= speed
+        if p2_down and self.p2_y < lowest: self.p2_y += speed
+
+    def move_ball(self):
+        rules = self.rules
+        if self.serve_cooldown > 0:
+            self.serve_cooldown -= 1
+        elif self.swept:
+            self.sweep_ball(self.ball_dx * self.scale, self.ball_dy * self.scale)
+        else:
+            self.ball_x += self.ball_dx * self.scale
+            self.ball_y += self.ball_dy * self.scale
+
+        # Wall Collision
+        if self.ball_y <= self.play_y:
+            self.ball_y = float(self.play_y)
+            self.ball_dy *= -1
+        elif self.ball_y >= (self.play_bottom - rules.ball_size):
+            self.ball_y = float(self.play_bottom - rules.ball_size)
+            self.ball_dy *= -1
+
+        if self.swept:
+            return
+
+        # Rects for collision
+        rect_p1, rect_p2, rect_ball = self.rects()
+
+        if self.paddle_hit_cooldown > 0: self.paddle_hit_cooldown -= 1
+
+        # Paddle Collision Logic
+        if self.paddle_hit_cooldown == 0:
+            # Left Paddle
+            if self.ball_dx < 0 and rect_ball.colliderect(rect_p1):
+                self.bounce(self.p1_y, 1)
+                self.ball_x = float(rect_p1.right + 2)
+                self.paddle_hit_cooldown = self.frames(4) # Anti-vibration cooldown
+
+            # Right Paddle
+            elif self.ball_dx > 0 and rect_ball.colliderect(rect_p2):
+                self.bounce(self.p2_y, -1)
+                self.ball_x = float(rect_p2.left - rules.ball_size - 2)
+                self.paddle_hit_cooldown = self.frames(4)
+
+    def sweep_ball(self, move_x, move_y):
+        """Moves the ball, stopping at the exact time it touches the paddle ahead of it.
+
+        No tunneling at high speed and no double hits, so no cooldown is needed.
+        """
+        rules = self.rules
+        if move_x < 0:
+            paddle_x, paddle_y, direction = self.left_x, self.p1_y, 1
+        else:
+            paddle_x, paddle_y, direction = self.right_x, self.p2_y, -1
+        contact = sweep_box(self.ball_x, self.ball_y, rules.ball_size, rules.ball_size, move_x, move_y,
+                            paddle_x, int(paddle_y), rules.paddle_width, rules.paddle_height)
+        if contact is None:
+            self.ball_x += move_x
+            self.ball_y += move_y
+            return
+
+        self.ball_x += move_x * contact.time
+        self.ball_y += move_y * contact.time
+        if contact.normal_x:
+            self.bounce(paddle_y, direction)
+        else:
+            # Clipped the paddle's top or bottom edge: deflect vertically
+            self.ball_dy = contact.normal_y * abs(self.ball_dy)
+
+    def bounce(self, paddle_y, direction):
+        """Angle-based return: the further from the paddle center, the steeper."""
+        rules = self.rules
+        diff = (self.ball_y + rules.ball_size / 2.0) - (paddle_y + rules.paddle_height / 2.0)
+        target_dy = clamp(diff * rules.angle_multiplier * 2.0, -rules.ball_dy_max, rules.ball_dy_max)
+        self.ball_dy = clamp(0.6 * self.ball_dy + 0.4 * target_dy, -rules.ball_dy_max, rules.ball_dy_max)
+        self.ball_dx = direction * clamp(abs(self.ball_dx) + 0.3, rules.ball_speed_initial, rules.ball_speed_max)
+
+    def check_score(self):
+        width = self.rules.window_width
+        if not (self.ball_x < 0 or self.ball_x > width):
+            return False
+        scored_by_a = (self.ball_x > width)
+        if scored_by_a: self.score_a += 1
+        else: self.score_b += 1
+
+        if check_game_won(self.score_a, self.score_b, self.rules.score_limit):
+            if self.score_a > self.score_b: self.sets_a += 1
+            else: self.sets_b += 1
+            self.score_a, self.score_b = 0, 0
+            if check_match_won(self.sets_a, self.sets_b, self.sets_to_win): return True
+
+        # Reset Ball State
+        self.serve(scored_by_a)
+        return False
+
+    def rects(self, alpha=1.0):
+        """Paddle and ball rects, interpolated `alpha` of the way from the last tick."""
+        rules = self.rules
+        ball_x, ball_y, p1_y, p2_y = self.ball_x, self.ball_y, self.p1_y, self.p2_y
+        if alpha < 1.0:
+            prev_x, prev_y, prev_p1, prev_p2 = self.prev
+            ball_x, ball_y = lerp(prev_x, ball_x, alpha), lerp(prev_y, ball_y, alpha)
+            p1_y, p2_y = lerp(prev_p1, p1_y, alpha), lerp(prev_p2, p2_y, alpha)
+        return (
+            pygame.Rect(self.left_x, int(p1_y), rules.paddle_width, rules.paddle_height),
+            pygame.Rect(self.right_x, int(p2_y), rules.paddle_width, rules.paddle_height),
+            pygame.Rect(int(ball_x), int(ball_y), rules.ball_size, rules.ball_size),
+        )
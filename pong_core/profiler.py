@@ -0,0 +1,140 @@
+"""Opt-in frame-time profiler with an on-screen overlay.
+
+The game loop calls `begin_frame()`, then `lap(phase)` after each numbered
+section (events, input, physics, ...), then `end_frame()`. Each lap adds the
+time since the previous lap to that phase, and every phase keeps the last
+`capacity` frames in a fixed ring buffer, so the cost per frame is a clock
+read and an array store. Percentiles are only computed when the overlay is
+refreshed or the report is exported.
+"""
+import json
+import time
+from array import array
+
+import pygame
+
+from pong_core.startup import font_cache
+
+OVERLAY_KEY = pygame.K_F3
+OVERLAY_BG = (0, 0, 0, 170)
+OVERLAY_TEXT = (200, 255, 200)
+OVERLAY_FONT = ("monospace", 14)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """Per-phase timers with p50/p95/p99 over the most recent frames."""
+
+    def __init__(self, phases, capacity=600, refresh_frames=30):
+        self.phases = list(phases)
+        self.capacity = capacity
+        self.refresh_frames = refresh_frames
+        self.overlay = False
+        self.frames = 0
+        self._index = 0
+        self._last = 0.0
+        self._frame_start = 0.0
+        self._buffers = {phase: array("d", bytes(8 * capacity)) for phase in self.phases + ["frame"]}
+        self._font = None
+        self._overlay_surface = None
+        self._overlay_frame = -1
+
+    def begin_frame(self):
+        self._index = self.frames % self.capacity
+        for buffer in self._buffers.values():
+            buffer[self._index] = 0.0
+        self._frame_start = self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Charges the time since the previous lap to `phase` (accumulates within a frame)."""
+        now = time.perf_counter()
+        self._buffers[phase][self._index] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        self._buffers["frame"][self._index] = time.perf_counter() - self._frame_start
+        self.frames += 1
+
+    def handle_event(self, event):
+        """Toggles the overlay on F3; returns True when the event was consumed."""
+        if event.type == pygame.KEYDOWN and event.key == OVERLAY_KEY:
+            self.overlay = not self.overlay
+            return True
+        return False
+
+    def summary(self):
+        """Returns {phase: {"p50_ms", "p95_ms", "p99_ms", "mean_ms"}} over the buffered frames."""
+        count = min(self.frames, self.capacity)
+        stats = {}
+        for phase, buffer in self._buffers.items():
+            values = sorted(buffer[:count])
+            stats[phase] = {
+                "p50_ms": percentile(values, 0.50) * 1000,
+                "p95_ms": percentile(values, 0.95) * 1000,
+                "p99_ms": percentile(values, 0.99) * 1000,
+                "mean_ms": (sum(values) / count * 1000) if count else 0.0,
+            }
+        return stats
+
+    def overlay_surface(self):
+        """The overlay as a translucent surface, re-rendered every `refresh_frames` frames."""
+        if not self.overlay:
+            return None
+        if self._font is None:
+            self._font = font_cache.get(*OVERLAY_FONT)
+        font = self._font
+        if self._overlay_surface is None or self.frames - self._overlay_frame >= self.refresh_frames:
+            lines = [f"{'phase':<9}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+            for phase, stat in self.summary().items():
+                lines.append(
+                    f"{phase:<9}{stat['p50_ms']:>7.2f}{stat['p95_ms']:>7.2f}{stat['p99_ms']:>7.2f}"
+                )
+            rendered = [font.render(line, True, OVERLAY_TEXT) for line in lines]
+            line_h = font.get_linesize()
+            width = max(surface.get_width() for surface in rendered) + 12
+            self._overlay_surface = pygame.Surface((width, line_h * len(rendered) + 12), pygame.SRCALPHA)
+            self._overlay_surface.fill(OVERLAY_BG)
+            for row, surface in enumerate(rendered):
+                self._overlay_surface.blit(surface, (6, 6 + row * line_h))
+            self._overlay_frame = self.frames
+        return self._overlay_surface
+
+    def export(self, path):
+        """Writes the percentile report as JSON."""
+        report = {"frames": self.frames, "window": min(self.frames, self.capacity), "phases": self.summary()}
+        with open(path, "w") as out:
+            json.dump(report, out, indent=2)
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off; every call is a no-op."""
+
+    overlay = False
+
+    def begin_frame(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def handle_event(self, event):
+        return False
+
+    def overlay_surface(self):
+        return None
+
+    def export(self, path):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,142 @@
+"""Hyper-Pong drawing, separate from the game engine.
+
+`HyperPongRenderer` draws a `GameEngine` onto any surface: the ppg.py window
+or an offscreen surface. It needs `pygame.font` initialized, nothing else.
+"""
+import functools
+
+import pygame
+
+from pong_core.background import GradientCache
+from pong_core.engine import GameState
+from pong_core.rules import HYPER_PONG
+from pong_core.sprites import Theme, atlas_cache
+from pong_core.text_cache import text_cache
+
+# --- Colors ---
+BG_COLOR_TOP = pygame.Color('#2c3e50')
+BG_COLOR_BOTTOM = pygame.Color('#34495e')
+BG_COLOR = BG_COLOR_TOP  # Solid background when the gradient is turned off
+UI_COLOR = pygame.Color('#ecf0f1')
+PADDLE_COLOR = pygame.Color('#1abc9c')
+BALL_COLOR = pygame.Color('#f1c40f')
+ACCENT_COLOR = pygame.Color('#e74c3c')
+
+
+def hyper_pong_theme(rules=HYPER_PONG):
+    """Hyper-Pong's rounded paddles, ball and 1-pixel center line as a sprite `Theme`."""
+    return Theme(
+        "hyper-pong",
+        (rules.paddle_width, rules.paddle_height), tuple(PADDLE_COLOR), 10,
+        rules.ball_radius * 2, tuple(BALL_COLOR),
+        (1, rules.screen_height), tuple(UI_COLOR), rules.screen_height, rules.screen_height,
+    )
+
+
+class HyperPongRenderer:
+    """Draws the start menu, the playing field and the game-over screen."""
+
+    def __init__(self, surface, rules=HYPER_PONG):
+        self.surface = surface
+        self.rules = rules
+        width, height = rules.screen_width, rules.screen_height
+        self.start_button = pygame.Rect(width / 2 - 125, height - 200, 250, 60)
+        self.theme = hyper_pong_theme(rules)
+        self.net_pos = (width // 2, 0)
+        # Built once per window size and color pair instead of 720 lines per frame
+        self.gradient_cache = GradientCache(maxsize=4)
+        # Render features a `pong_core.governor.QualityGovernor` may turn off
+        self.gradient = True
+        self.antialias = True
+
+    # --- Fonts (loaded on first use: the menu never needs the score font) ---
+    @functools.cached_property
+    def title_font(self):
+        return pygame.font.Font(pygame.font.get_default_font(), 80)
+
+    @functools.cached_property
+    def score_font(self):
+        return pygame.font.Font(pygame.font.get_default_font(), 50)
+
+    @functools.cached_property
+    def ui_font(self):
+        return pygame.font.Font(pygame.font.get_default_font(), 30)
+
+    @functools.cached_property
+    def instructions_font(self):
+        return pygame.font.Font(pygame.font.get_default_font(), 20)
+
+    # --- Helper Functions ---
+    def draw_gradient_background(self):
+        """Draws a vertical gradient background (a solid one with `gradient` off)."""
+        if self.gradient:
+            self.gradient_cache.draw(self.surface, BG_COLOR_TOP, BG_COLOR_BOTTOM)
+        else:
+            self.surface.fill(BG_COLOR)
+
+    def draw_text(self, text, font, color, center_pos):
+        """Renders and centers text on the screen."""
+        text_surface = text_cache.render(font, text, self.antialias, color)
+        text_rect = text_surface.get_rect(center=center_pos)
+        self.surface.blit(text_surface, text_rect)
+
+    # --- Screens ---
+    def draw(self, engine):
+        """Draws the whole frame for the engine's current game state."""
+        self.draw_gradient_background()
+        if engine.state == GameState.START_MENU:
+            self.draw_menu()
+        elif engine.state == GameState.PLAYING:
+            self.draw_playing(engine)
+        elif engine.state == GameState.GAME_OVER:
+            self.draw_game_over(engine)
+
+    def draw_menu(self):
+        center_x = self.rules.screen_width / 2
+        # Title
+        self.draw_text("Hyper-Pong", self.title_font, UI_COLOR, (center_x, 150))
+
+        # Instructions
+        self.draw_text("Player 1: UP/DOWN Arrows", self.instructions_font, UI_COLOR, (center_x, 300))
+        self.draw_text("Player 2: W/S Keys", self.instructions_font, UI_COLOR, (center_x, 340))
+
+        # Rules
+        sets = self.rules.sets_to_win_match
+        self.draw_text(f"First to {self.rules.winning_score} points wins a set.", self.instructions_font, UI_COLOR, (center_x, 420))
+        self.draw_text("You must win by 2 points.", self.instructions_font, UI_COLOR, (center_x, 450))
+        self.draw_text(f"Best of {sets * 2 - 1} sets wins the match.", self.instructions_font, UI_COLOR, (center_x, 480))
+
+        # Start Button
+        pygame.draw.rect(self.surface, ACCENT_COLOR, self.start_button, border_radius=15)
+        self.draw_text("Start Game", self.ui_font, UI_COLOR, self.start_button.center)
+
+    def draw_playing(self, engine):
+        rules = self.rules
+        width = rules.screen_width
+        surface = self.surface
+
+        # --- Drawing game elements ---
+        # Net, paddles and ball come pre-rendered from the theme's sprite atlas
+        player_paddle = pygame.Rect(engine.player_x, engine.player_y, rules.paddle_width, rules.paddle_height)
+        opponent_paddle = pygame.Rect(engine.opponent_x, engine.opponent_y, rules.paddle_width, rules.paddle_height)
+        ball = pygame.Rect(engine.ball_x, engine.ball_y, engine.ball_size, engine.ball_size)
+        atlas_cache.get(self.theme).draw(surface, (
+            ("net", self.net_pos),
+            ("paddle", player_paddle.topleft),
+            ("paddle", opponent_paddle.topleft),
+            ("ball", ball.topleft),
+        ))
+
+        # Scores
+        self.draw_text(f"{engine.opponent_score}", self.score_font, UI_COLOR, (width / 4, 50))
+        self.draw_text(f"{engine.player_score}", self.score_font, UI_COLOR, (width * 3 / 4, 50))
+
+        # Sets
+        self.draw_text(f"Sets: {engine.opponent_sets}", self.ui_font, UI_COLOR, (width / 4, 100))
+        self.draw_text(f"Sets: {engine.player_sets}", self.ui_font, UI_COLOR, (width * 3 / 4, 100))
+
+    def draw_game_over(self, engine):
+        center_x = self.rules.screen_width / 2
+        self.draw_text("Match Over", self.title_font, UI_COLOR, (center_x, 200))
+        self.draw_text(f"{engine.match_winner} Wins!", self.score_font, ACCENT_COLOR, (center_x, 350))
+        self.draw_text("Click anywhere to return to the main menu", self.ui_font, UI_COLOR, (center_x, 500))
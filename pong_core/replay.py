@@ -0,0 +1,257 @@
+"""Deterministic input recording and headless replay.
+
+A log is an append-only binary stream: an 8-byte magic, one byte naming the
+game, then records. Inputs are run-length encoded, so a long rally with the
+same keys held costs a few bytes, and the recorder writes through a fixed
+file buffer so memory never grows with session length.
+
+    MATCH  tag, seed (u64), physics_hz (u16), flags (u8)
+    INPUT  tag, run length (varint), per-tick inputs (game-specific struct)
+    END    tag
+
+The seed reproduces every `ball_reset` direction; together with the per-tick
+inputs that is enough to re-simulate a match exactly:
+
+    python -m pong_core.replay match.rec
+"""
+import argparse
+import os
+import struct
+import time
+
+from pong_core import controls
+from pong_core.engine import GameEngine, GameState
+from pong_core.pro_pong import Match
+from pong_core.rules import HYPER_PONG, PRO_PONG
+
+MAGIC = b"PONGREC1"
+
+# --- Games ---
+GAME_PRO_PONG = 1  # ping_pong_cursor.py: one control mask per tick
+GAME_HYPER_PONG = 2  # ppg.py: net (player_dir, opponent_dir) per tick
+GAME_NAMES = {GAME_PRO_PONG: "pro-pong", GAME_HYPER_PONG: "hyper-pong"}
+PAYLOADS = {GAME_PRO_PONG: struct.Struct("<B"), GAME_HYPER_PONG: struct.Struct("<bb")}
+
+# --- Records ---
+MATCH = 1
+INPUT = 2
+END = 3
+MATCH_INFO = struct.Struct("<QHB")
+FLAG_SWEPT = 1
+
+
+def _write_varint(out, value):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.write(bytes((byte | 0x80,)))
+        else:
+            out.write(bytes((byte,)))
+            return
+
+
+def _read_varint(src):
+    shift = result = 0
+    while True:
+        byte = src.read(1)
+        if not byte:
+            raise EOFError("truncated varint")
+        result |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return result
+        shift += 7
+
+
+# --- Recording ---
+class InputRecorder:
+    """Streams per-tick inputs of one or more matches into a log file."""
+
+    def __init__(self, path, game, buffer_size=64 * 1024):
+        self.game = game
+        self.payload = PAYLOADS[game]
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not is_new:
+            with open(path, "rb") as existing:
+                header = existing.read(len(MAGIC) + 1)
+            if header != MAGIC + bytes((game,)):
+                raise ValueError(f"{path} is not a {GAME_NAMES[game]} input log")
+        self._file = open(path, "ab", buffering=buffer_size)
+        if is_new:
+            self._file.write(MAGIC + bytes((game,)))
+        self._inputs = None
+        self._run = 0
+
+    def start_match(self, seed=0, physics_hz=60, swept=False):
+        self._flush_run()
+        self._file.write(bytes((MATCH,)))
+        self._file.write(MATCH_INFO.pack(seed, physics_hz, FLAG_SWEPT if swept else 0))
+
+    def record(self, *inputs):
+        """Logs the inputs applied on one physics tick."""
+        if inputs == self._inputs:
+            self._run += 1
+            return
+        self._flush_run()
+        self._inputs, self._run = inputs, 1
+
+    def _flush_run(self):
+        if self._run:
+            self._file.write(bytes((INPUT,)))
+            _write_varint(self._file, self._run)
+            self._file.write(self.payload.pack(*self._inputs))
+        self._inputs, self._run = None, 0
+
+    def end_match(self):
+        self._flush_run()
+        self._file.write(bytes((END,)))
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._flush_run()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# --- Reading ---
+def read_log(path):
+    """Yields the records of a log, starting with ("game", game_id).
+
+    Then ("match", seed, physics_hz, flags), ("input", inputs, run) and ("end",)
+    in file order. A log cut short by a crash yields everything up to the
+    damaged record.
+    """
+    with open(path, "rb") as src:
+        header = src.read(len(MAGIC) + 1)
+        if len(header) != len(MAGIC) + 1 or not header.startswith(MAGIC):
+            raise ValueError(f"{path} is not a Ping-Pong input log")
+        game = header[-1]
+        payload = PAYLOADS[game]
+        yield ("game", game)
+
+        while True:
+            tag = src.read(1)
+            if not tag:
+                return
+            try:
+                if tag[0] == MATCH:
+                    data = src.read(MATCH_INFO.size)
+                    if len(data) < MATCH_INFO.size:
+                        return
+                    yield ("match",) + MATCH_INFO.unpack(data)
+                elif tag[0] == INPUT:
+                    run = _read_varint(src)
+                    data = src.read(payload.size)
+                    if len(data) < payload.size:
+                        return
+                    yield ("input", payload.unpack(data), run)
+                elif tag[0] == END:
+                    yield ("end",)
+                else:
+                    raise ValueError(f"unknown record tag {tag[0]} in {path}")
+            except EOFError:
+                return
+
+
+# --- Replay ---
+def _new_match(game, seed, physics_hz, flags):
+    swept = bool(flags & FLAG_SWEPT)
+    if game == GAME_PRO_PONG:
+        return Match(PRO_PONG, physics_hz, "swept" if swept else "rect")
+    engine = GameEngine(HYPER_PONG, swept=swept)
+    engine.start_match(seed)
+    return engine
+
+
+def _step(game, match, inputs):
+    """Steps one tick; returns True when the match is over."""
+    if game == GAME_PRO_PONG:
+        return match.step(*controls.unpack(inputs[0]))
+    match.step(*inputs)
+    return match.state != GameState.PLAYING
+
+
+def _result(game, match, ticks, finished):
+    if game == GAME_PRO_PONG:
+        sets, score = (match.sets_a, match.sets_b), (match.score_a, match.score_b)
+    else:
+        # Left paddle first, as the scores are drawn on screen
+        sets, score = (match.opponent_sets, match.player_sets), (match.opponent_score, match.player_score)
+    return {"ticks": ticks, "finished": finished, "sets": sets, "score": score}
+
+
+def replay(path):
+    """Re-simulates every match in a log at full speed; returns one result dict per match."""
+    records = read_log(path)
+    _, game = next(records)
+    results = []
+    match, ticks, finished = None, 0, False
+    for record in records:
+        kind = record[0]
+        if kind == "match":
+            match, ticks, finished = _new_match(game, *record[1:]), 0, False
+        elif kind == "input" and match is not None and not finished:
+            inputs, run = record[1], record[2]
+            for _ in range(run):
+                ticks += 1
+                if _step(game, match, inputs):
+                    finished = True
+                    break
+        elif kind == "end" and match is not None:
+            results.append(_result(game, match, ticks, finished))
+            match = None
+    if match is not None:
+        results.append(_result(game, match, ticks, finished))  # Log cut short mid-match
+    return results
+
+
+def replay_ticks(path):
+    """Re-simulates a log one tick at a time, for tools that watch the match as it plays.
+
+    Yields (game, match, over) after every tick, where `match` is the
+    `Match` or `GameEngine` of the current recorded match (a new object per
+    match) and `over` is True on the tick that ends it.
+    """
+    records = read_log(path)
+    _, game = next(records)
+    match, finished = None, False
+    for record in records:
+        kind = record[0]
+        if kind == "match":
+            match, finished = _new_match(game, *record[1:]), False
+        elif kind == "input" and match is not None and not finished:
+            inputs, run = record[1], record[2]
+            for _ in range(run):
+                finished = _step(game, match, inputs)
+                yield game, match, finished
+                if finished:
+                    break
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded Ping-Pong input log headlessly.")
+    parser.add_argument("log")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = replay(args.log)
+    elapsed = time.perf_counter() - start
+    for number, result in enumerate(results, 1):
+        state = "finished" if result["finished"] else "unfinished"
+        print(
+            f"match {number}: {state} after {result['ticks']} ticks, "
+            f"sets {result['sets'][0]}-{result['sets'][1]}, "
+            f"score {result['score'][0]}-{result['score'][1]}"
+        )
+    total = sum(result["ticks"] for result in results)
+    print(f"{len(results)} match(es), {total} ticks in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
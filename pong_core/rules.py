@@ -0,0 +1,119 @@
+"""Gameplay constants for each game, shared by the scripts and the headless tools."""
+from collections import namedtuple
+
+# -----------------------------------------------------------------------------
+# HYPER-PONG (ping_pong_game_geminiCLI/ppg.py)
+# -----------------------------------------------------------------------------
+HyperPongRules = namedtuple(
+    "HyperPongRules",
+    [
+        "screen_width",
+        "screen_height",
+        "paddle_width",
+        "paddle_height",
+        "paddle_margin",
+        "ball_radius",
+        "paddle_speed",
+        "ball_speed_x_start",
+        "ball_speed_y_start",
+        "winning_score",
+        "sets_to_win_match",
+        "edge_tolerance",
+    ],
+)
+
+HYPER_PONG = HyperPongRules(
+    screen_width=960,
+    screen_height=720,
+    paddle_width=15,
+    paddle_height=160,
+    paddle_margin=30,
+    ball_radius=10,
+    paddle_speed=8,
+    ball_speed_x_start=8,
+    ball_speed_y_start=8,
+    winning_score=11,
+    sets_to_win_match=2,  # Best of 3
+    edge_tolerance=10,  # The abs(...) < 10 paddle edge checks
+)
+
+
+# -----------------------------------------------------------------------------
+# BASIC PONG (ping_pong_game_geminiCLI/ping_pong_gemini.py)
+# -----------------------------------------------------------------------------
+BasicRules = namedtuple(
+    "BasicRules",
+    [
+        "screen_width",
+        "screen_height",
+        "paddle_width",
+        "paddle_height",
+        "paddle_margin",
+        "ball_radius",
+        "paddle_speed",
+        "ball_speed_x",
+        "ball_speed_y",
+    ],
+)
+
+BASIC = BasicRules(
+    screen_width=800,
+    screen_height=600,
+    paddle_width=10,
+    paddle_height=140,
+    paddle_margin=20,
+    ball_radius=7,
+    paddle_speed=7,  # Also the opponent AI's tracking speed
+    ball_speed_x=7,
+    ball_speed_y=7,
+)  # Endless rally: points are counted, but there are no sets or match end
+
+
+# -----------------------------------------------------------------------------
+# PRO PING-PONG (ping_pong_game_cursor/ping_pong_cursor.py)
+# -----------------------------------------------------------------------------
+ProPongRules = namedtuple(
+    "ProPongRules",
+    [
+        "window_width",
+        "window_height",
+        "fps",
+        "top_bar_h",
+        "paddle_width",
+        "paddle_height",
+        "paddle_speed",
+        "paddle_margin",
+        "ball_size",
+        "ball_speed_initial",
+        "ball_speed_max",
+        "angle_multiplier",
+        "ball_dy_max",
+        "score_limit",
+        "best_of",
+    ],
+)
+
+PRO_PONG = ProPongRules(
+    window_width=800,
+    window_height=560,
+    fps=60,  # Speeds and cooldowns are tuned per frame at this rate
+    top_bar_h=60,
+    paddle_width=12,
+    paddle_height=90,
+    paddle_speed=10.0,
+    paddle_margin=30,
+    ball_size=12,
+    ball_speed_initial=5.0,
+    ball_speed_max=12.0,
+    angle_multiplier=0.12,  # Lower intensity for smoother vertical bounce
+    ball_dy_max=7.0,
+    score_limit=11,
+    best_of=5,
+)
+
+
+def override(rules, **changes):
+    """Returns a copy of `rules` with fields replaced, keeping each field's type."""
+    return rules._replace(
+        **{name: type(getattr(rules, name))(value) for name, value in changes.items()}
+    )
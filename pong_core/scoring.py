@@ -0,0 +1,17 @@
+"""Point, set and match rules shared by the game cores.
+
+Pro Ping-Pong (`pong_core.pro_pong.Match`), Hyper-Pong
+(`pong_core.engine.GameEngine`) and the batch and vectorized simulators all
+play sets to a score limit, won by 2, and matches to a number of sets.
+"""
+
+
+def check_game_won(score_a, score_b, score_limit):
+    """Win by 2 rule implementation: True once the leader has `score_limit` and a 2-point margin."""
+    if (score_a >= score_limit or score_b >= score_limit) and abs(score_a - score_b) >= 2:
+        return True
+    return False
+
+
+def check_match_won(sets_a, sets_b, sets_to_win):
+    return sets_a >= sets_to_win or sets_b >= sets_to_win
@@ -0,0 +1,262 @@
+"""Live game state in a memory-mapped file, for analytics and bot processes.
+
+With `--shared-state PATH` a game appends one fixed-layout record per tick to
+a ring of `slots` records in PATH (`SharedState`). Other processes map the
+file (`SharedStateReader`) and read records in place, with no locks and no
+syscalls per tick. The writer never waits for readers. A reader more than
+`slots` ticks behind skips ahead and counts the ticks it missed.
+
+Each record carries its sequence number. The writer zeroes it, writes the
+record, then sets the new number. A reader takes a record only if the number
+is the one it expects both before and after copying, so a half-written
+record is never returned.
+
+The file also holds an input mailbox. An external controller writes a paddle
+direction with a new sequence number every tick, and the game's
+`pong_core.inputs.MailboxSource` applies it to the left paddle (Hyper-Pong's
+opponent) on the next physics tick. It acknowledges the number and the
+record it applied it at. A direction not refreshed for MAILBOX_TIMEOUT ticks
+is released, so a crashed controller cannot leave the paddle moving.
+
+    python ppg.py --shared-state /dev/shm/pong.state
+    python -m pong_core.shared_state watch /dev/shm/pong.state
+    python -m pong_core.shared_state bot /dev/shm/pong.state
+"""
+import argparse
+import mmap
+import struct
+import time
+from collections import namedtuple
+
+from pong_core.ai import chase
+from pong_core.net import OVER, PLAYING
+from pong_core.replay import GAME_HYPER_PONG, GAME_NAMES, GAME_PRO_PONG
+from pong_core.rules import HYPER_PONG, PRO_PONG
+from pong_core.spectate import HYPER_PONG_STATUS
+
+# Layout: a header page (header, counters, mailbox, acknowledgement), then the ring.
+STATE_MAGIC = b"PONGSTA1"
+STATE_HEADER = struct.Struct("<8sBxxxII")  # magic, game, slots, record size
+COUNTERS = struct.Struct("<QB")  # written, done
+COUNTERS_OFFSET = 64
+MAILBOX = struct.Struct("<Qb")  # seq, direction (-1, 0, 1): written by the controller
+MAILBOX_OFFSET = 128
+MAILBOX_ACK = struct.Struct("<QQ")  # mailbox seq applied, record seq it was applied at
+MAILBOX_ACK_OFFSET = 192
+DATA_OFFSET = mmap.PAGESIZE
+
+RECORD = struct.Struct("<QBBBBBB2x6f")
+SEQ = struct.Struct("<Q")
+Record = namedtuple("Record", (
+    "seq", "game", "status", "score_left", "score_right", "sets_left", "sets_right",
+    "ball_x", "ball_y", "ball_dx", "ball_dy", "left_y", "right_y",
+))
+
+DEFAULT_SLOTS = 256  # About four seconds of ticks at 60 Hz
+
+
+def pro_pong_state(match, status=PLAYING):
+    """(game, status, scores, sets, ball, paddles) of a `Match`, in RECORD order after seq."""
+    return (GAME_PRO_PONG, status, match.score_a, match.score_b, match.sets_a, match.sets_b,
+            match.ball_x, match.ball_y, match.ball_dx, match.ball_dy, match.p1_y, match.p2_y)
+
+
+def hyper_pong_state(engine):
+    """The same for a `GameEngine`, left (opponent) paddle first."""
+    return (GAME_HYPER_PONG, HYPER_PONG_STATUS[engine.state], engine.opponent_score, engine.player_score,
+            engine.opponent_sets, engine.player_sets, engine.ball_x, engine.ball_y,
+            engine.ball_speed_x, engine.ball_speed_y, engine.opponent_y, engine.player_y)
+
+
+def record_dtype():
+    """A NumPy structured dtype matching RECORD, for zero-copy views of the ring."""
+    import numpy as np
+
+    return np.dtype({
+        "names": list(Record._fields),
+        "formats": ["<u8"] + ["u1"] * 6 + ["<f4"] * 6,
+        "offsets": [0, 8, 9, 10, 11, 12, 13, 16, 20, 24, 28, 32, 36],
+        "itemsize": RECORD.size,
+    })
+
+
+# --- Game side ---
+class SharedState:
+    """Writes one record per tick into the ring and serves the input mailbox."""
+
+    def __init__(self, path, game, slots=DEFAULT_SLOTS):
+        self.path = path
+        self.slots = slots
+        self.written = 0
+        with open(path, "w+b") as out:
+            out.truncate(DATA_OFFSET + slots * RECORD.size)
+            self.map = mmap.mmap(out.fileno(), 0)
+        STATE_HEADER.pack_into(self.map, 0, STATE_MAGIC, game, slots, RECORD.size)
+
+    def publish(self, state):
+        """Appends one record; `state` is what `pro_pong_state` or `hyper_pong_state` returns."""
+        seq = self.written + 1
+        offset = DATA_OFFSET + self.written % self.slots * RECORD.size
+        data = self.map
+        SEQ.pack_into(data, offset, 0)  # Readers skip the slot while it is rewritten
+        RECORD.pack_into(data, offset, 0, *state)
+        SEQ.pack_into(data, offset, seq)
+        SEQ.pack_into(data, COUNTERS_OFFSET, seq)
+        self.written = seq
+
+    def mailbox(self):
+        """(seq, direction) last written by a controller."""
+        return MAILBOX.unpack_from(self.map, MAILBOX_OFFSET)
+
+    def acknowledge(self, seq):
+        MAILBOX_ACK.pack_into(self.map, MAILBOX_ACK_OFFSET, seq, self.written)
+
+    def close(self):
+        if self.map is not None:
+            struct.pack_into("<B", self.map, COUNTERS_OFFSET + 8, 1)
+            self.map.close()
+            self.map = None
+
+
+# --- Reader side ---
+class SharedStateReader:
+    """Maps a game's state file; reads records in place and writes the mailbox."""
+
+    def __init__(self, path):
+        with open(path, "r+b") as src:
+            self.map = mmap.mmap(src.fileno(), 0)
+        magic, self.game, self.slots, record_size = STATE_HEADER.unpack_from(self.map, 0)
+        if magic != STATE_MAGIC or record_size != RECORD.size:
+            raise ValueError(f"{path} is not a game state file")
+        self.next_seq = 1
+        self.missed = 0
+
+    def written(self):
+        return COUNTERS.unpack_from(self.map, COUNTERS_OFFSET)
+
+    def read(self, seq):
+        """Record `seq` if it is still in the ring and intact, else None."""
+        offset = DATA_OFFSET + (seq - 1) % self.slots * RECORD.size
+        record = RECORD.unpack_from(self.map, offset)
+        if record[0] != seq or SEQ.unpack_from(self.map, offset)[0] != seq:
+            return None  # Overwritten (or being rewritten) by a newer tick
+        return Record._make(record)
+
+    def latest(self):
+        """The newest record, or None before the first tick."""
+        while True:
+            written, _ = self.written()
+            if written == 0:
+                return None
+            record = self.read(written)
+            if record is not None:
+                return record
+
+    def poll(self):
+        """Every record published since the last poll, oldest first; skips ahead if it fell behind."""
+        written, _ = self.written()
+        if written - self.next_seq >= self.slots - 1:
+            skip_to = written - self.slots // 2
+            self.missed += skip_to - self.next_seq
+            self.next_seq = skip_to
+        records = []
+        while self.next_seq <= written:
+            record = self.read(self.next_seq)
+            if record is None:
+                break  # Lapped mid-read: pick up from here on the next poll
+            records.append(record)
+            self.next_seq += 1
+        return records
+
+    def history(self):
+        """The whole ring as a NumPy record array viewing the mapping (unordered, not a copy)."""
+        import numpy as np
+
+        return np.frombuffer(self.map, record_dtype(), self.slots, DATA_OFFSET)
+
+    def send(self, direction):
+        """Steers the game's mailbox paddle (-1 up, 0 still, 1 down) from the next tick on."""
+        seq = MAILBOX.unpack_from(self.map, MAILBOX_OFFSET)[0] + 1
+        struct.pack_into("<b", self.map, MAILBOX_OFFSET + 8, direction)
+        SEQ.pack_into(self.map, MAILBOX_OFFSET, seq)
+        return seq
+
+    def acknowledged(self):
+        """(mailbox seq, record seq) the game last applied."""
+        return MAILBOX_ACK.unpack_from(self.map, MAILBOX_ACK_OFFSET)
+
+    def close(self):
+        self.map.close()
+
+
+# --- Tools ---
+def follow(reader, on_record, poll=0.001, seconds=None):
+    """Calls `on_record` for each new record until the game closes the file (or `seconds` pass)."""
+    end = None if seconds is None else time.monotonic() + seconds
+    while end is None or time.monotonic() < end:
+        records = reader.poll()
+        for record in records:
+            on_record(record)
+        if not records:
+            if reader.written()[1]:
+                return
+            time.sleep(poll)
+
+
+def watch(path, seconds=None):
+    """Prints a line of live analytics per second of game time."""
+    reader = SharedStateReader(path)
+    hz = 60
+    stats = {"ticks": 0, "hits": 0, "speed": 0.0, "dx": 0.0}
+
+    def on_record(record):
+        stats["ticks"] += 1
+        if record.ball_dx * stats["dx"] < 0:
+            stats["hits"] += 1
+        stats["dx"] = record.ball_dx
+        stats["speed"] = max(stats["speed"], abs(record.ball_dx))
+        if record.seq % hz == 0:
+            print(f"tick {record.seq}: {record.score_left}-{record.score_right} "
+                  f"sets {record.sets_left}-{record.sets_right}, {stats['hits']} direction changes, "
+                  f"top speed {stats['speed']:.1f}, {reader.missed} ticks missed")
+
+    print(f"watching {GAME_NAMES[reader.game]} in {path}")
+    follow(reader, on_record, seconds=seconds)
+    reader.close()
+
+
+def run_bot(path, seconds=None):
+    """Steers the left paddle toward the ball through the mailbox, one message per tick."""
+    reader = SharedStateReader(path)
+    sent = [0]
+    if reader.game == GAME_HYPER_PONG:
+        ball, paddle, speed = HYPER_PONG.ball_radius * 2, HYPER_PONG.paddle_height, HYPER_PONG.paddle_speed
+    else:
+        ball, paddle, speed = PRO_PONG.ball_size, PRO_PONG.paddle_height, PRO_PONG.paddle_speed
+
+    def on_record(record):
+        if record.status == OVER:
+            return
+        reader.send(chase(record.ball_y, ball, record.left_y, paddle, speed))
+        sent[0] += 1
+
+    follow(reader, on_record, seconds=seconds)
+    applied, at = reader.acknowledged()
+    print(f"{sent[0]} commands sent, last applied: #{applied} at tick {at}")
+    reader.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Read a game's shared state file, or steer its mailbox paddle.")
+    parser.add_argument("command", choices=("watch", "bot"))
+    parser.add_argument("path", help="the file given to --shared-state")
+    parser.add_argument("--seconds", type=float, default=None, help="stop after this long")
+    args = parser.parse_args(argv)
+    if args.command == "watch":
+        watch(args.path, args.seconds)
+    else:
+        run_bot(args.path, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Lazy procedural sound effects.
+
+Tones are synthesized the first time they are played, not at import, and the
+mixer is only initialized then too. Each buffer is memoized per (frequency,
+duration, volume, sample rate) and can be persisted as raw PCM in a cache
+directory, which later runs map straight into `pygame.mixer.Sound` without
+importing NumPy. A disabled bank (headless and batch runs) never touches
+the audio device.
+"""
+import mmap
+import os
+
+import pygame
+
+# Requested mixer format; the device may grant a different sample rate
+MIXER_SETTINGS = dict(frequency=22050, size=-16, channels=2, buffer=4096)
+
+
+def synthesize_tone(frequency, duration, volume, sample_rate, bits=16, channels=2):
+    """Returns raw interleaved PCM bytes for a decaying sine wave."""
+    import numpy as np  # Only needed when a tone is not cached yet
+
+    n_samples = int(round(duration * sample_rate))
+    max_sample = 2**(bits - 1) - 1
+    t = np.linspace(0., duration, n_samples, endpoint=False)
+
+    # Simple sine wave with a simple decay envelope
+    wave = np.sin(2 * np.pi * frequency * t)
+    wave *= np.exp(-t * 5)
+
+    samples = (wave * max_sample * volume).astype(np.int16)
+    return np.repeat(samples[:, None], channels, axis=1).tobytes()
+
+
+class Tone:
+    """Handle for one sound effect; synthesized on its first `play`."""
+
+    __slots__ = ("bank", "frequency", "duration", "volume")
+
+    def __init__(self, bank, frequency, duration, volume):
+        self.bank = bank
+        self.frequency = frequency
+        self.duration = duration
+        self.volume = volume
+
+    def play(self):
+        sound = self.bank.sound(self.frequency, self.duration, self.volume)
+        if sound is not None:
+            sound.play()
+
+
+class ToneBank:
+    """Memoized, optionally disk-backed store of synthesized tones."""
+
+    def __init__(self, enabled=True, cache_dir=None, mixer_settings=MIXER_SETTINGS):
+        self.enabled = enabled
+        self.cache_dir = cache_dir
+        self.mixer_settings = mixer_settings
+        self._sounds = {}
+
+    def tone(self, frequency, duration, volume=0.1):
+        """Returns a lazy `Tone`; nothing is synthesized until it is played."""
+        return Tone(self, frequency, duration, volume)
+
+    def _mixer_format(self):
+        """Initializes the mixer on first use; returns (rate, bits, channels) or None."""
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init(**self.mixer_settings)
+            except pygame.error:
+                # No audio device (servers, CI): keep playing silently
+                self.enabled = False
+                return None
+        frequency, size, channels = pygame.mixer.get_init()
+        return frequency, abs(size), channels
+
+    def sound(self, frequency, duration, volume=0.1):
+        """Returns the `pygame.mixer.Sound` for a tone, building it at most once."""
+        if not self.enabled:
+            return None
+        mixer_format = self._mixer_format()
+        if mixer_format is None:
+            return None
+        key = (frequency, duration, volume) + mixer_format
+        sound = self._sounds.get(key)
+        if sound is None:
+            sound = self._sounds[key] = pygame.mixer.Sound(buffer=self._pcm(key))
+        return sound
+
+    def _pcm(self, key):
+        """Raw PCM for `key`, mapped from the disk cache when available."""
+        frequency, duration, volume, rate, bits, channels = key
+        if self.cache_dir is None:
+            return synthesize_tone(frequency, duration, volume, rate, bits, channels)
+
+        name = f"tone_{frequency}_{duration}_{volume}_{rate}_{bits}_{channels}.pcm"
+        path = os.path.join(self.cache_dir, name)
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, "rb") as pcm_file:
+                # Sound() copies the samples; the map itself is never copied in Python
+                return memoryview(mmap.mmap(pcm_file.fileno(), 0, access=mmap.ACCESS_READ))
+
+        pcm = synthesize_tone(frequency, duration, volume, rate, bits, channels)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as pcm_file:
+            pcm_file.write(pcm)
+        os.replace(temp_path, path)  # Atomic, so concurrent runs never read half a file
+        return pcm
@@ -0,0 +1,422 @@
+"""Live spectating: one game publishes, a hub fans the match out to many viewers.
+
+The game sends each tick's state as one small UDP datagram to a local hub
+(`SpectatorFeed`). Sending is non-blocking and a failed send is forgotten,
+so the authoritative game loop never waits on a spectator. The hub
+(`SpectatorHub`) keeps one asyncio TCP stream per read-only viewer and
+sends each viewer the fields that changed since the last state it was sent.
+Viewers that share a base share the encoded bytes.
+
+A viewer that stops reading fills its socket. Once more than `skip_bytes`
+are waiting to be sent the hub skips ticks for it, and the next delta it
+gets covers the gap. After `drop_ticks` skipped ticks in a row the hub
+disconnects it. Either way the other viewers and the game are unaffected.
+
+Viewer stream messages: u16 length, then
+
+    STATE  tag, tick (u32), field mask (u16), changed fields
+
+Publishing, watching and a load test with stalled viewers:
+
+    python -m pong_core.spectate hub
+    python ping_pong_game_cursor/ping_pong_cursor.py --spectate 127.0.0.1:50009
+    python -m pong_core.spectate watch 127.0.0.1:50008
+    python -m pong_core.spectate load --viewers 300 --slow 10
+"""
+import argparse
+import asyncio
+import socket
+import struct
+import time
+
+from pong_core.delta import all_fields, changed_mask, pack_fields, unpack_fields
+from pong_core.engine import GameState
+from pong_core.net import OVER, PLAYING, WAITING
+from pong_core.replay import GAME_HYPER_PONG, GAME_NAMES, GAME_PRO_PONG
+
+VIEWER_PORT = 50008
+FEED_PORT = 50009
+
+# --- Messages ---
+FEED = 1  # Game -> hub datagram: tag, seq (u32), full snapshot
+STATE = 2  # Hub -> viewer stream message
+
+FIELDS = (
+    ("game", struct.Struct("<B")),
+    ("status", struct.Struct("<B")),
+    ("ball_x", struct.Struct("<f")),
+    ("ball_y", struct.Struct("<f")),
+    ("left_y", struct.Struct("<f")),
+    ("right_y", struct.Struct("<f")),
+    ("score_left", struct.Struct("<B")),
+    ("score_right", struct.Struct("<B")),
+    ("sets_left", struct.Struct("<B")),
+    ("sets_right", struct.Struct("<B")),
+)
+ALL_FIELDS = all_fields(FIELDS)
+FEED_PACKET = struct.Struct("<BI" + "".join(field.format[1:] for _, field in FIELDS))
+STATE_HEADER = struct.Struct("<BIH")
+LENGTH = struct.Struct("<H")
+
+SKIP_BYTES = 4 * 1024  # Unsent bytes before a viewer misses ticks
+DROP_TICKS = 300  # Ticks missed in a row before a viewer is disconnected
+HUB_SNDBUF = 16 * 1024  # Kernel send buffer per viewer, so lag shows up in seconds
+VIEWER_BACKLOG = 1024  # Pending connections, for a lobby's worth of screens joining at once
+REORDER_WINDOW = 64  # Feed datagrams this far behind the newest are dropped as late
+
+
+def pro_pong_snapshot(match, status=PLAYING):
+    """A `pong_core.pro_pong.Match` as a spectator snapshot."""
+    return (GAME_PRO_PONG, status, match.ball_x, match.ball_y, match.p1_y, match.p2_y,
+            match.score_a, match.score_b, match.sets_a, match.sets_b)
+
+
+HYPER_PONG_STATUS = {GameState.START_MENU: WAITING, GameState.PLAYING: PLAYING, GameState.GAME_OVER: OVER}
+
+
+def hyper_pong_snapshot(engine):
+    """A `pong_core.engine.GameEngine` as a spectator snapshot (left paddle first)."""
+    return (GAME_HYPER_PONG, HYPER_PONG_STATUS[engine.state], engine.ball_x, engine.ball_y,
+            engine.opponent_y, engine.player_y, engine.opponent_score, engine.player_score,
+            engine.opponent_sets, engine.player_sets)
+
+
+def encode_state(tick, snapshot, base=None):
+    """A length-prefixed STATE message with the fields of `snapshot` that differ from `base`."""
+    mask = ALL_FIELDS if base is None else changed_mask(snapshot, base)
+    payload = STATE_HEADER.pack(STATE, tick, mask) + pack_fields(FIELDS, mask, snapshot)
+    return LENGTH.pack(len(payload)) + payload
+
+
+# --- Game side ---
+class SpectatorFeed:
+    """Publishes one snapshot per tick to a hub; never blocks the game loop."""
+
+    def __init__(self, address):
+        host, _, port = address.rpartition(":")
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.sock.connect((host or "127.0.0.1", int(port or FEED_PORT)))
+        self.seq = 0
+        self.sent = self.failed = 0
+
+    def publish(self, snapshot):
+        self.seq += 1
+        try:
+            self.sock.send(FEED_PACKET.pack(FEED, self.seq, *snapshot))
+            self.sent += 1
+        except OSError:
+            self.failed += 1  # Hub down or its queue full: the next tick tries again
+
+    def close(self):
+        self.sock.close()
+
+
+# --- Hub ---
+class Viewer:
+    __slots__ = ("transport", "base", "skipped")
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.base = None  # Last snapshot sent; None sends every field
+        self.skipped = 0  # Ticks missed in a row
+
+
+class SpectatorHub(asyncio.DatagramProtocol):
+    """Receives a game's feed and streams it to every connected viewer."""
+
+    def __init__(self, skip_bytes=SKIP_BYTES, drop_ticks=DROP_TICKS):
+        self.skip_bytes = skip_bytes
+        self.drop_ticks = drop_ticks
+        self.viewers = set()
+        self.seq = 0
+        self.tick = 0
+        self.snapshot = None
+        self.feed_received = self.frames_sent = self.bytes_sent = self.skipped = self.dropped = 0
+
+    # Feed (UDP)
+    def datagram_received(self, data, addr):
+        if len(data) != FEED_PACKET.size or data[0] != FEED:
+            return
+        values = FEED_PACKET.unpack(data)
+        seq = values[1]
+        if 0 <= self.seq - seq < REORDER_WINDOW:
+            return  # Late or duplicate datagram; a much older seq is a restarted game
+        self.seq = seq
+        self.feed_received += 1
+        self.tick += 1
+        self.snapshot = values[2:]
+        self.broadcast()
+
+    def broadcast(self):
+        """Sends the current snapshot to every viewer, one encoding per distinct base."""
+        snapshot, tick = self.snapshot, self.tick
+        encoded = {}
+        for viewer in list(self.viewers):
+            transport = viewer.transport
+            if transport.is_closing():
+                self.viewers.discard(viewer)
+                continue
+            if transport.get_write_buffer_size() > self.skip_bytes:
+                viewer.skipped += 1
+                self.skipped += 1
+                if viewer.skipped >= self.drop_ticks:
+                    self.dropped += 1
+                    self.viewers.discard(viewer)
+                    transport.abort()
+                continue
+            viewer.skipped = 0
+            key = id(viewer.base)  # Viewers sent the same tick hold the same tuple
+            data = encoded.get(key)
+            if data is None:
+                data = encoded[key] = encode_state(tick, snapshot, viewer.base)
+            transport.write(data)
+            viewer.base = snapshot
+            self.frames_sent += 1
+            self.bytes_sent += len(data)
+
+    def close(self):
+        """Hangs up on every viewer."""
+        for viewer in self.viewers:
+            viewer.transport.close()
+        self.viewers.clear()
+
+    # Viewers (TCP)
+    async def handle_viewer(self, reader, writer):
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, HUB_SNDBUF)
+        viewer = Viewer(writer.transport)
+        self.viewers.add(viewer)
+        try:
+            while await reader.read(1024):
+                pass  # Read-only: anything a viewer sends is ignored
+        except ConnectionError:
+            pass
+        finally:
+            self.viewers.discard(viewer)
+            writer.close()
+
+
+async def start_hub(host="127.0.0.1", viewer_port=VIEWER_PORT, feed_port=FEED_PORT, feed_host="127.0.0.1",
+                    **options):
+    """Starts a hub; returns (hub, feed transport, viewer server).
+
+    Viewers connect on `host`. The feed is bound to `feed_host` on its own,
+    loopback by default, since anyone who can reach it can publish game state.
+    """
+    loop = asyncio.get_running_loop()
+    hub = SpectatorHub(**options)
+    feed, _ = await loop.create_datagram_endpoint(lambda: hub, local_addr=(feed_host, feed_port))
+    server = await asyncio.start_server(hub.handle_viewer, host, viewer_port, backlog=VIEWER_BACKLOG)
+    return hub, feed, server
+
+
+# --- Viewer side ---
+class SpectatorClient:
+    """Decodes a hub's viewer stream, independent of any socket."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.tick = 0
+        self.snapshot = None
+        self.states_received = self.bytes_received = 0
+
+    def receive(self, data):
+        """Feeds stream bytes; returns the number of complete states applied."""
+        self.bytes_received += len(data)
+        buffer = self.buffer
+        buffer += data
+        applied = offset = 0
+        while len(buffer) - offset >= LENGTH.size:
+            (length,) = LENGTH.unpack_from(buffer, offset)
+            end = offset + LENGTH.size + length
+            if len(buffer) < end:
+                break
+            self.apply(memoryview(buffer)[offset + LENGTH.size:end])
+            applied += 1
+            offset = end
+        del buffer[:offset]
+        return applied
+
+    def apply(self, payload):
+        tag, tick, mask = STATE_HEADER.unpack_from(payload)
+        if tag != STATE:
+            return
+        values = list(self.snapshot) if self.snapshot is not None else [0] * len(FIELDS)
+        unpack_fields(FIELDS, mask, payload, STATE_HEADER.size, values)
+        self.tick = tick
+        self.snapshot = tuple(values)
+        self.states_received += 1
+
+
+def match_from_snapshot(snapshot, match=None):
+    """A `Match` or `GameEngine` holding a snapshot's positions and scores, for the renderers."""
+    game, status, ball_x, ball_y, left_y, right_y, score_left, score_right, sets_left, sets_right = snapshot
+    if game == GAME_PRO_PONG:
+        from pong_core.pro_pong import Match
+
+        match = match if isinstance(match, Match) else Match()
+        match.ball_x, match.ball_y, match.p1_y, match.p2_y = ball_x, ball_y, left_y, right_y
+        match.score_a, match.score_b, match.sets_a, match.sets_b = score_left, score_right, sets_left, sets_right
+        match.snap()
+        return match
+
+    from pong_core.engine import OPPONENT_NAME, PLAYER_NAME, GameEngine
+
+    engine = match if isinstance(match, GameEngine) else GameEngine()
+    engine.state = {status: state for state, status in HYPER_PONG_STATUS.items()}[status]
+    engine.ball_x, engine.ball_y, engine.opponent_y, engine.player_y = ball_x, ball_y, left_y, right_y
+    engine.opponent_score, engine.player_score = score_left, score_right
+    engine.opponent_sets, engine.player_sets = sets_left, sets_right
+    engine.match_winner = PLAYER_NAME if sets_right > sets_left else OPPONENT_NAME
+    return engine
+
+
+def watch(address):
+    """Opens a window showing the hub's match, drawn by the game's own renderer."""
+    import pygame
+
+    from pong_core.export import FrameRenderer
+    from pong_core.startup import init_pygame
+
+    init_pygame()
+
+    host, _, port = address.rpartition(":")
+    sock = socket.create_connection((host or "127.0.0.1", int(port or VIEWER_PORT)))
+    sock.setblocking(False)
+    client = SpectatorClient()
+    screen = None
+    renderer = match = None
+    clock = pygame.time.Clock()
+    try:
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    return
+            try:
+                while True:
+                    data = sock.recv(65536)
+                    if not data:
+                        return  # Hub closed the stream
+                    client.receive(data)
+            except BlockingIOError:
+                pass
+            if client.snapshot is not None:
+                game = client.snapshot[0]
+                if renderer is None or renderer.game != game:
+                    renderer = FrameRenderer(game)
+                    screen = pygame.display.set_mode(renderer.canvas.get_size())
+                    pygame.display.set_caption(f"Spectating {GAME_NAMES[game]}")
+                match = match_from_snapshot(client.snapshot, match)
+                screen.blit(renderer.draw(match), (0, 0))
+                pygame.display.flip()
+            clock.tick(60)
+    finally:
+        sock.close()
+        pygame.quit()
+
+
+# --- Load test ---
+async def run_viewer(port, slow, done):
+    """One viewer until the hub hangs up; a slow one reads nothing, like a frozen lobby screen."""
+    client = SpectatorClient()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if slow:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    sock.setblocking(False)
+    await asyncio.get_running_loop().sock_connect(sock, ("127.0.0.1", port))
+    reader, writer = await asyncio.open_connection(sock=sock)
+    try:
+        if slow:
+            await done.wait()
+        else:
+            while data := await reader.read(65536):
+                client.receive(data)
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+    return client
+
+
+async def run_load(viewers, slow, seconds, hz=60, **options):
+    """A hub, a simulated Pro Ping-Pong feed at `hz` and `viewers` viewers on loopback."""
+    from pong_core.export import simulate_ticks
+
+    hub, feed_transport, server = await start_hub("127.0.0.1", 0, 0, **options)
+    viewer_port = server.sockets[0].getsockname()[1]
+    feed = SpectatorFeed(f"127.0.0.1:{feed_transport.get_extra_info('sockname')[1]}")
+    done = asyncio.Event()
+    tasks = [asyncio.create_task(run_viewer(viewer_port, number < slow, done)) for number in range(viewers)]
+    while len(hub.viewers) < viewers:
+        await asyncio.sleep(0.01)
+
+    loop = asyncio.get_running_loop()
+    worst = 0.0
+    next_tick = loop.time()
+    for tick, (_, match, over) in enumerate(simulate_ticks(GAME_PRO_PONG, None, None)):
+        start = time.perf_counter()
+        feed.publish(pro_pong_snapshot(match, OVER if over else PLAYING))
+        worst = max(worst, time.perf_counter() - start)
+        if over or tick + 1 >= seconds * hz:
+            break
+        next_tick += 1.0 / hz
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+    await asyncio.sleep(0.1)  # Let the hub send the last tick
+    hub.close()
+    done.set()
+    clients = await asyncio.gather(*tasks)
+    feed.close()
+    feed_transport.close()
+    server.close()
+    return hub, feed, clients, worst
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Spectator hub, viewer and load test.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    hub_cmd = commands.add_parser("hub", help="fan a game's feed out to viewers")
+    hub_cmd.add_argument("--host", default="0.0.0.0", help="viewer interface")
+    hub_cmd.add_argument("--port", type=int, default=VIEWER_PORT, help="viewer TCP port")
+    hub_cmd.add_argument("--feed-port", type=int, default=FEED_PORT, help="UDP port games publish to")
+    hub_cmd.add_argument("--feed-host", default="127.0.0.1",
+                         help="feed interface (loopback: only games on this machine can publish)")
+    watch_cmd = commands.add_parser("watch", help="show a hub's match in a window")
+    watch_cmd.add_argument("address", nargs="?", default=f"127.0.0.1:{VIEWER_PORT}")
+    load_cmd = commands.add_parser("load", help="local hub, simulated feed and many viewers")
+    load_cmd.add_argument("--viewers", type=int, default=300)
+    load_cmd.add_argument("--slow", type=int, default=10, help="viewers that never read")
+    load_cmd.add_argument("--seconds", type=float, default=10.0)
+    load_cmd.add_argument("--hz", type=float, default=60.0, help="feed ticks per second")
+    for command in (hub_cmd, load_cmd):
+        command.add_argument("--skip-bytes", type=int, default=SKIP_BYTES)
+        command.add_argument("--drop-ticks", type=int, default=DROP_TICKS)
+    args = parser.parse_args(argv)
+
+    if args.command == "watch":
+        watch(args.address)
+        return
+    options = dict(skip_bytes=args.skip_bytes, drop_ticks=args.drop_ticks)
+    if args.command == "hub":
+        async def serve():
+            hub, feed, server = await start_hub(args.host, args.port, args.feed_port, args.feed_host, **options)
+            print(f"viewers on {args.host}:{args.port}, feed on {args.feed_host}:{args.feed_port}")
+            async with server:
+                await server.serve_forever()
+        asyncio.run(serve())
+        return
+
+    hub, feed, clients, worst = asyncio.run(run_load(args.viewers, args.slow, args.seconds, args.hz, **options))
+    fast = clients[args.slow:]
+    states = sum(client.states_received for client in fast)
+    received = sum(client.bytes_received for client in fast)
+    print(f"feed: {feed.sent} ticks published, {feed.failed} failed sends, slowest publish {worst * 1e6:.0f} us")
+    print(f"hub: {hub.feed_received} ticks in, {hub.frames_sent} frames out "
+          f"({hub.bytes_sent / max(hub.frames_sent, 1):.1f} B avg), {hub.skipped} skipped, {hub.dropped} viewers dropped")
+    print(f"{len(fast)} reading viewers: {states / max(len(fast), 1):.0f} states each, "
+          f"{received / max(states, 1):.1f} B/state")
+
+
+if __name__ == "__main__":
+    main()
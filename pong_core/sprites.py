@@ -0,0 +1,120 @@
+"""Pre-rendered paddle, ball and net sprites.
+
+The games drew their paddles (`draw.rect`, rounded in Hyper-Pong), ball
+(`draw.ellipse`) and net (`aaline`, or a rect per dash) with draw primitives
+every frame. A `SpriteAtlas` rasterizes a `Theme`'s shapes once into two
+sheets in the display's pixel format: `convert()` for sprites that cover
+their whole rect and `convert_alpha()` for the rest. A frame then draws all
+of them with one `Surface.blits` call. The output is pixel for pixel the
+same as the primitives' (none of these shapes is anti-aliased: an `aaline`
+on a whole pixel column is a 1-pixel rect).
+
+`atlas_cache.get(theme)` builds each theme's atlas once per display format.
+"""
+from collections import namedtuple
+
+import pygame
+
+Theme = namedtuple("Theme", (
+    "name",
+    "paddle_size", "paddle_color", "paddle_radius",  # radius 0: square corners
+    "ball_size", "ball_color",
+    "net_size", "net_color", "net_dash", "net_period",  # dash == period: a solid line
+))
+
+PADDING = 1  # Gap between sprites on a sheet
+
+
+def paddle_sprite(theme):
+    alpha = theme.paddle_radius > 0
+    surface = pygame.Surface(theme.paddle_size, pygame.SRCALPHA if alpha else 0, 32)
+    pygame.draw.rect(surface, theme.paddle_color, surface.get_rect(), border_radius=theme.paddle_radius)
+    return surface, alpha
+
+
+def ball_sprite(theme):
+    surface = pygame.Surface((theme.ball_size, theme.ball_size), pygame.SRCALPHA, 32)
+    pygame.draw.ellipse(surface, theme.ball_color, surface.get_rect())
+    return surface, True
+
+
+def net_sprite(theme):
+    width, height = theme.net_size
+    alpha = theme.net_dash < theme.net_period
+    surface = pygame.Surface((width, height), pygame.SRCALPHA if alpha else 0, 32)
+    for y in range(0, height, theme.net_period):
+        pygame.draw.rect(surface, theme.net_color, (0, y, width, theme.net_dash))
+    return surface, alpha
+
+
+SPRITES = {"paddle": paddle_sprite, "ball": ball_sprite, "net": net_sprite}
+
+
+class SpriteAtlas:
+    """A theme's sprites packed side by side on an opaque and an alpha sheet."""
+
+    def __init__(self, theme):
+        self.theme = theme
+        display = pygame.display.get_surface()
+        sprites = {name: build(theme) for name, build in SPRITES.items()}
+        self.sheets = {}
+        self.areas = {}  # name -> (sheet, area on the sheet)
+        for alpha in (False, True):
+            names = [name for name, (_, is_alpha) in sprites.items() if is_alpha == alpha]
+            if not names:
+                continue
+            width = sum(sprites[name][0].get_width() + PADDING for name in names)
+            height = max(sprites[name][0].get_height() for name in names)
+            sheet = pygame.Surface((width, height), pygame.SRCALPHA if alpha else 0, 32)
+            x = 0
+            for name in names:
+                surface = sprites[name][0]
+                sheet.blit(surface, (x, 0))
+                self.areas[name] = pygame.Rect((x, 0), surface.get_size())
+                x += surface.get_width() + PADDING
+            if display is not None:  # Offscreen use (no window) keeps plain 32-bit sheets
+                sheet = sheet.convert_alpha() if alpha else sheet.convert()
+            for name in names:
+                self.areas[name] = (sheet, self.areas[name])
+            self.sheets[alpha] = sheet
+        self.sprites = {name: sheet.subsurface(area) for name, (sheet, area) in self.areas.items()}
+
+    def sprite(self, name):
+        """One sprite as a subsurface of its sheet, e.g. for `DirtyRectRenderer.draw`."""
+        return self.sprites[name]
+
+    def draw(self, surface, placements):
+        """Blits (name, topleft) pairs onto `surface` in one `Surface.blits` call."""
+        areas = self.areas
+        surface.blits([(areas[name][0], dest, areas[name][1]) for name, dest in placements], doreturn=False)
+
+
+def display_format():
+    """The window's pixel format, or None without one."""
+    display = pygame.display.get_surface()
+    if display is None:
+        return None
+    return display.get_bitsize(), display.get_masks()
+
+
+class AtlasCache:
+    """One `SpriteAtlas` per (theme, display format), rebuilt if the window format changes."""
+
+    def __init__(self):
+        self._atlases = {}
+
+    def get(self, theme):
+        key = (theme, display_format())
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = self._atlases[key] = SpriteAtlas(theme)
+        return atlas
+
+    def clear(self):
+        self._atlases.clear()
+
+    def __len__(self):
+        return len(self._atlases)
+
+
+atlas_cache = AtlasCache()
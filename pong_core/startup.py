@@ -0,0 +1,118 @@
+"""Fast start-up: only the pygame subsystems a game needs, and cached fonts.
+
+`pygame.init()` opens every subsystem, including the audio device and
+joysticks, and `pygame.font.SysFont` scans every installed font (via
+`fc-list` on Linux) the first time it is called. `init_pygame` starts just the
+display and font modules; the mixer is left to `pong_core.sound.ToneBank`,
+which opens it when the first tone plays. `FontCache` resolves each system
+font name once and can keep the resolved paths in a JSON file, so later runs
+load fonts without scanning at all.
+
+`load_script` imports one of the game scripts as a module, without running
+its main loop, for tools that reuse a game's own drawing code.
+"""
+import importlib.util
+import json
+import os
+
+import pygame
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+SCRIPTS = {
+    "pro-pong": os.path.join(ROOT, "ping_pong_game_cursor", "ping_pong_cursor.py"),
+    "hyper-pong": os.path.join(ROOT, "ping_pong_game_geminiCLI", "ppg.py"),
+    "basic": os.path.join(ROOT, "ping_pong_game_geminiCLI", "ping_pong_gemini.py"),
+}
+
+
+def load_script(game):
+    """Imports a game script by path without running its main loop."""
+    spec = importlib.util.spec_from_file_location(f"_script_{game.replace('-', '_')}", SCRIPTS[game])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def init_pygame(mixer=False):
+    """Initializes the display and font modules (and the mixer on request)."""
+    pygame.display.init()
+    pygame.font.init()
+    if mixer:
+        pygame.mixer.init()
+
+
+class FontCache:
+    """Memoized `SysFont` replacement with an optional on-disk path cache."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self._paths = None  # "name|bold|italic" -> font file (None: pygame's default font)
+        self._fonts = {}
+
+    def _load(self):
+        self._paths = {}
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path) as src:
+                    self._paths = json.load(src)
+            except (OSError, ValueError):
+                self._paths = {}  # Unreadable cache: resolve again and rewrite it
+
+    def _save(self):
+        if not self.path:
+            return
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(temp_path, "w") as out:
+                json.dump(self._paths, out)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass  # Read-only disk: keep the in-memory lookups only
+
+    def resolve(self, name, bold=False, italic=False):
+        """Returns the font file `SysFont(name, bold, italic)` would use, or None."""
+        if self._paths is None:
+            self._load()
+        key = f"{name}|{int(bold)}|{int(italic)}"
+        if key in self._paths:
+            path = self._paths[key]
+            if path is None or os.path.exists(path):
+                return path
+        path = pygame.font.match_font(name, bold, italic)
+        self._paths[key] = path
+        self._save()
+        return path
+
+    def get(self, name, size, bold=False, italic=False):
+        """Returns a `pygame.font.Font` like `SysFont(name, size, bold, italic)`, loaded once.
+
+        A style the family has no file for is synthesized, as `SysFont` does;
+        `name=None` gives pygame's default font.
+        """
+        key = (name, size, bool(bold), bool(italic))
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+
+        path = plain = None
+        if name is not None:
+            path = self.resolve(name, bold, italic)
+            plain = self.resolve(name) if bold or italic else path
+        font = pygame.font.Font(path, size)
+        # The lookup falls back to the regular file when the style is missing
+        styled = path is not None and path != plain
+        if bold and not styled:
+            font.set_bold(True)
+        if italic and not styled:
+            font.set_italic(True)
+        self._fonts[key] = font
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+
+
+# Shared by all games; set PONG_FONT_CACHE to keep resolved paths across runs
+font_cache = FontCache(os.environ.get("PONG_FONT_CACHE"))
@@ -0,0 +1,356 @@
+"""Persistent match statistics in an append-only SQLite file.
+
+Games report paddle hits, points and match results to a `StatsRecorder`.
+These calls only append to a list. Each finished rally is handed as one
+batch to a background thread, which inserts the raw rows and updates the
+summary tables in the same transaction. The frame loop never waits on disk,
+and `StatsStore` answers win rates, rally records and distributions from the
+summaries without rescanning the history:
+
+    matches          one row per match: game, winner, sets, start/end time
+    rallies          one row per point: hits, ticks, scorer, ball speed
+    hits             one row per paddle hit: side, offset from paddle center
+    summary          per game: match, win, rally and hit totals, longest rally
+    speed_histogram  per game: points by ball speed at the score (1 px/tick buckets)
+    hit_histogram    per game and side: hits by offset (tenths of half a paddle)
+
+    python -m pong_core.stats pong_stats.db
+"""
+import argparse
+import math
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+
+from pong_core.controls import LEFT, RIGHT
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY, game TEXT NOT NULL, started REAL, ended REAL,
+    winner TEXT, sets_left INTEGER, sets_right INTEGER
+);
+CREATE TABLE IF NOT EXISTS rallies (
+    match_id INTEGER NOT NULL, hits INTEGER, ticks INTEGER, scorer TEXT, speed REAL
+);
+CREATE TABLE IF NOT EXISTS hits (match_id INTEGER NOT NULL, side TEXT, offset REAL);
+CREATE TABLE IF NOT EXISTS summary (
+    game TEXT PRIMARY KEY, matches INTEGER DEFAULT 0, finished INTEGER DEFAULT 0,
+    left_wins INTEGER DEFAULT 0, right_wins INTEGER DEFAULT 0, rallies INTEGER DEFAULT 0,
+    hits INTEGER DEFAULT 0, rally_ticks INTEGER DEFAULT 0, longest_rally INTEGER DEFAULT 0,
+    speed_sum REAL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS speed_histogram (
+    game TEXT, bucket INTEGER, count INTEGER, PRIMARY KEY (game, bucket)
+);
+CREATE TABLE IF NOT EXISTS hit_histogram (
+    game TEXT, side TEXT, bucket INTEGER, count INTEGER, PRIMARY KEY (game, side, bucket)
+);
+"""
+
+
+def connect(path):
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode=WAL")  # Readers never block the writer
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+# --- Writing ---
+class StatsRecorder:
+    """Collects one game's events and writes them in batches on a background thread."""
+
+    def __init__(self, path, game):
+        self.path = path
+        self.game = game
+        connect(path).close()  # Create the schema before the first batch
+        self._queue = queue.Queue()
+        self._batch = []
+        self._match_id = None  # This recorder's match number; SQLite assigns the row id
+        self._matches = 0
+        self._rally_hits = 0
+        self._row_ids = {}  # Writer thread: match number -> matches.id
+        self.failed_batches = 0
+        self._writer = threading.Thread(target=self._write_loop, name="stats-writer", daemon=True)
+        self._writer.start()
+
+    # Called from the game loop: appends only
+    def start_match(self):
+        if self._match_id is not None:
+            self.end_match(None)
+        self._matches += 1
+        self._match_id = self._matches
+        self._batch.append(("start", (self._match_id, self.game, time.time())))
+        self._rally_hits = 0
+
+    def hit(self, side, offset):
+        """A paddle hit; `offset` is the ball center's distance from the paddle center
+        in half paddle heights (-1 top edge, 1 bottom edge)."""
+        if self._match_id is not None:
+            self._rally_hits += 1
+            self._batch.append(("hit", (self._match_id, side, offset)))
+
+    def point(self, scorer, ticks, speed):
+        """A rally ended: `scorer` won it after `ticks` ticks, the ball moving at `speed`."""
+        if self._match_id is not None:
+            self._batch.append(("rally", (self._match_id, self._rally_hits, ticks, scorer, speed)))
+            self._rally_hits = 0
+            self.flush()
+
+    def end_match(self, winner, sets_left=0, sets_right=0):
+        """Records the result; `winner` None marks a match abandoned before the end."""
+        if self._match_id is None:
+            return
+        self._batch.append(("match", (self._match_id, time.time(), winner, sets_left, sets_right)))
+        self._match_id = None
+        self.flush()
+
+    def flush(self):
+        if self._batch:
+            self._queue.put(self._batch)
+            self._batch = []
+
+    def close(self):
+        """Writes everything still pending and stops the writer thread."""
+        self.end_match(None)
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+
+    # Writer thread
+    def _write_loop(self):
+        db = connect(self.path)
+        try:
+            while True:
+                batch = self._queue.get()
+                if batch is None:
+                    return
+                # Coalesce whatever else is already queued into one transaction
+                batches = [batch]
+                stop = False
+                while not self._queue.empty():
+                    more = self._queue.get()
+                    if more is None:
+                        stop = True
+                        break
+                    batches.append(more)
+                coalesced = [event for batch in batches for event in batch]
+                if len(batches) == 1 or self._commit(db, coalesced) is not None:
+                    # One at a time, so a failing batch is lost alone
+                    for batch in batches:
+                        error = self._commit(db, batch)
+                        if error is not None:
+                            # Lose the batch, not the writer thread: later batches still get written
+                            self.failed_batches += 1
+                            print(f"stats: lost {len(batch)} events: {error}", file=sys.stderr)
+                if stop:
+                    return
+        finally:
+            db.close()
+
+    def _commit(self, db, batch):
+        """Writes events in one transaction; returns the error if it was rolled back."""
+        try:
+            with db:
+                row_ids = self._write(db, batch)
+        except (sqlite3.Error, ValueError, TypeError) as error:
+            return error
+        # Only once committed: a rolled-back start has no row for later events to point at
+        self._row_ids.update(row_ids)
+        return None
+
+    def _write(self, db, batch):
+        """Writes one batch; returns the row ids of the matches it started."""
+        rows = {"start": [], "hit": [], "rally": [], "match": []}
+        for kind, row in batch:
+            rows[kind].append(row)
+        row_ids = {}
+        for match, game, started in rows["start"]:
+            cursor = db.execute("INSERT INTO matches (game, started) VALUES (?, ?)", (game, started))
+            row_ids[match] = cursor.lastrowid
+
+        def with_row_id(kind):
+            # Events of a match whose start was lost in a failed batch are dropped with it
+            known = []
+            for row in rows[kind]:
+                row_id = row_ids.get(row[0]) or self._row_ids.get(row[0])
+                if row_id is not None:
+                    known.append((row_id,) + row[1:])
+            return known
+
+        hits, rallies, matches = with_row_id("hit"), with_row_id("rally"), with_row_id("match")
+        db.executemany("INSERT INTO hits VALUES (?, ?, ?)", hits)
+        db.executemany("INSERT INTO rallies VALUES (?, ?, ?, ?, ?)", rallies)
+        db.executemany("UPDATE matches SET ended = ?, winner = ?, sets_left = ?, sets_right = ? WHERE id = ?",
+                       [row[1:] + row[:1] for row in matches])
+
+        # Incremental summaries, so queries never rescan the raw tables
+        game = self.game
+        db.execute("INSERT OR IGNORE INTO summary (game) VALUES (?)", (game,))
+        db.execute(
+            """UPDATE summary SET matches = matches + ?, finished = finished + ?,
+                   left_wins = left_wins + ?, right_wins = right_wins + ?,
+                   rallies = rallies + ?, hits = hits + ?, rally_ticks = rally_ticks + ?,
+                   longest_rally = MAX(longest_rally, ?), speed_sum = speed_sum + ?
+               WHERE game = ?""",
+            (
+                len(matches),
+                sum(row[2] is not None for row in matches),
+                sum(row[2] == LEFT for row in matches),
+                sum(row[2] == RIGHT for row in matches),
+                len(rallies),
+                len(hits),
+                sum(row[2] for row in rallies),
+                max((row[1] for row in rallies), default=0),
+                sum(row[4] for row in rallies),
+                game,
+            ),
+        )
+        speeds = Counter(int(row[4]) for row in rallies)
+        db.executemany(
+            """INSERT INTO speed_histogram VALUES (?, ?, ?)
+               ON CONFLICT (game, bucket) DO UPDATE SET count = count + excluded.count""",
+            [(game, bucket, count) for bucket, count in speeds.items()],
+        )
+        offsets = Counter((row[1], math.floor(row[2] * 10)) for row in hits)
+        db.executemany(
+            """INSERT INTO hit_histogram VALUES (?, ?, ?, ?)
+               ON CONFLICT (game, side, bucket) DO UPDATE SET count = count + excluded.count""",
+            [(game, side, bucket, count) for (side, bucket), count in offsets.items()],
+        )
+        return row_ids
+
+
+# --- Game adapters: turn per-tick state changes into recorder events ---
+class ProPongObserver:
+    """Feeds a `pong_core.pro_pong.Match` into a recorder; call after every tick."""
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+        self._last = None
+        self._ticks = 0
+
+    def __call__(self, match):
+        rules = match.rules
+        points = (match.score_a, match.score_b, match.sets_a, match.sets_b)
+        last, self._last = self._last, (points, match.ball_dx, math.hypot(match.ball_dx, match.ball_dy))
+        self._ticks += 1
+        if last is None:
+            return
+        last_points, last_dx, last_speed = last
+        if points != last_points:
+            left_scored = points[0] > last_points[0] or points[2] > last_points[2]
+            self.recorder.point(LEFT if left_scored else RIGHT, self._ticks, last_speed)
+            self._ticks = 0
+        elif (match.ball_dx > 0) != (last_dx > 0):
+            side = LEFT if match.ball_dx > 0 else RIGHT
+            paddle_y = match.p1_y if side == LEFT else match.p2_y
+            offset = (match.ball_y + rules.ball_size / 2) - (paddle_y + rules.paddle_height / 2)
+            self.recorder.hit(side, offset / (rules.paddle_height / 2))
+
+
+class HyperPongObserver:
+    """Feeds a `pong_core.engine.GameEngine` into a recorder; call with each step's events."""
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+        self._last = None
+        self._speed = 0.0  # Before the step; the point resets the ball
+        self._ticks = 0
+
+    def __call__(self, engine, events):
+        from pong_core.engine import PADDLE_HIT, POINT_SCORED
+
+        rules = engine.rules
+        points = (engine.opponent_score, engine.player_score, engine.opponent_sets, engine.player_sets)
+        last, self._last = self._last, (points, self._speed)
+        self._speed = math.hypot(engine.ball_speed_x, engine.ball_speed_y)
+        self._ticks += 1
+        if events & PADDLE_HIT:
+            # The ball now heads away from the paddle that hit it
+            side = LEFT if engine.ball_speed_x > 0 else RIGHT
+            paddle_y = engine.opponent_y if side == LEFT else engine.player_y
+            offset = (engine.ball_y + engine.ball_size / 2) - (paddle_y + rules.paddle_height / 2)
+            self.recorder.hit(side, offset / (rules.paddle_height / 2))
+        if events & POINT_SCORED and last is not None:
+            last_points, speed = last
+            left_scored = points[0] > last_points[0] or points[2] > last_points[2]
+            self.recorder.point(LEFT if left_scored else RIGHT, self._ticks, speed)
+            self._ticks = 0
+
+
+# --- Reading ---
+class StatsStore:
+    """Read side: answers from the summary tables and indexed lookups."""
+
+    def __init__(self, path):
+        self.db = connect(path)
+
+    def summary(self, game):
+        row = self.db.execute(
+            """SELECT matches, finished, left_wins, right_wins, rallies, hits, rally_ticks,
+                      longest_rally, speed_sum FROM summary WHERE game = ?""",
+            (game,),
+        ).fetchone()
+        if row is None:
+            return None
+        matches, finished, left_wins, right_wins, rallies, hits, rally_ticks, longest, speed_sum = row
+        return {
+            "matches": matches,
+            "finished": finished,
+            "left_win_rate": left_wins / finished if finished else 0.0,
+            "right_win_rate": right_wins / finished if finished else 0.0,
+            "rallies": rallies,
+            "hits_per_rally": hits / rallies if rallies else 0.0,
+            "ticks_per_rally": rally_ticks / rallies if rallies else 0.0,
+            "longest_rally": longest,
+            "mean_speed_at_score": speed_sum / rallies if rallies else 0.0,
+            "speed_histogram": dict(self.db.execute(
+                "SELECT bucket, count FROM speed_histogram WHERE game = ? ORDER BY bucket", (game,)
+            ).fetchall()),
+        }
+
+    def hit_histogram(self, game, side):
+        """{offset bucket: hits}; bucket b covers offsets [b/10, (b+1)/10) of half a paddle."""
+        return dict(self.db.execute(
+            "SELECT bucket, count FROM hit_histogram WHERE game = ? AND side = ? ORDER BY bucket",
+            (game, side),
+        ).fetchall())
+
+    def last_match(self, game):
+        """(winner, sets_left, sets_right) of the latest finished match, or None."""
+        return self.db.execute(
+            """SELECT winner, sets_left, sets_right FROM matches
+               WHERE game = ? AND winner IS NOT NULL ORDER BY id DESC LIMIT 1""",
+            (game,),
+        ).fetchone()
+
+    def games(self):
+        return [row[0] for row in self.db.execute("SELECT game FROM summary ORDER BY game")]
+
+    def close(self):
+        self.db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize recorded Ping-Pong match statistics.")
+    parser.add_argument("db")
+    args = parser.parse_args(argv)
+
+    store = StatsStore(args.db)
+    for game in store.games():
+        summary = store.summary(game)
+        print(f"{game}: {summary['matches']} matches ({summary['finished']} finished), "
+              f"left wins {summary['left_win_rate']:.0%}, right wins {summary['right_win_rate']:.0%}")
+        print(f"  {summary['rallies']} rallies, {summary['hits_per_rally']:.1f} hits and "
+              f"{summary['ticks_per_rally']:.0f} ticks per rally, longest {summary['longest_rally']} hits")
+        print(f"  ball speed at score: mean {summary['mean_speed_at_score']:.1f} px/tick, "
+              + ", ".join(f"{bucket}: {count}" for bucket, count in summary["speed_histogram"].items()))
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Cache of rendered text surfaces.
+
+Score, set and menu labels change a few times per minute but were rasterized
+with `font.render` every frame. `TextCache.render` takes the same arguments as
+`Font.render` and only calls it when the (font, text, color, antialias) key is
+new, so a changed score is the only thing that triggers a re-render.
+"""
+from collections import OrderedDict
+
+
+class TextCache:
+    """Bounded LRU of text surfaces with hit/miss counters."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, antialias, color):
+        """Returns `font.render(text, antialias, color)`, reusing earlier surfaces."""
+        key = (font, text, tuple(color), bool(antialias))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def invalidate(self, font=None):
+        """Drops every cached surface, or only those rendered with `font`."""
+        if font is None:
+            self._surfaces.clear()
+            return
+        for key in [key for key in self._surfaces if key[0] is font]:
+            del self._surfaces[key]
+
+    def stats(self):
+        """Returns hit/miss counters and the current size as a dict."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._surfaces),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+# One cache shared by every label in a process
+text_cache = TextCache()
@@ -0,0 +1,42 @@
+"""Fixed-timestep accumulator.
+
+Physics runs at a constant rate no matter how fast frames are drawn: each
+rendered frame adds its real duration to the accumulator and the game runs
+enough whole physics steps to reach (or just pass) the current time. Drawn
+positions are then interpolated between the last two physics states by
+`alpha`, so a steady 60 FPS frame at 60 Hz draws exactly the latest state.
+"""
+import math
+
+
+def lerp(start, end, alpha):
+    return start + (end - start) * alpha
+
+
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed physics steps."""
+
+    def __init__(self, hz, max_frame_time=0.25):
+        self.hz = hz
+        self.dt = 1.0 / hz
+        # A frame longer than this (window drag, breakpoint) is truncated rather
+        # than replayed in one burst of steps.
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """Adds `frame_time` seconds and returns how many steps to run now."""
+        self.accumulator += min(frame_time, self.max_frame_time)
+        # Small epsilon so 1/60 s frames at 60 Hz do not round up to two steps
+        steps = max(0, math.ceil(self.accumulator / self.dt - 1e-6))
+        # Simulated time now runs up to one step ahead: accumulator is in (-dt, 0]
+        self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        """How far the render time is between the previous and latest step (0..1]."""
+        return min(1.0, max(0.0, 1.0 + self.accumulator / self.dt))
+
+    def reset(self):
+        self.accumulator = 0.0
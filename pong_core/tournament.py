@@ -0,0 +1,118 @@
+"""Multiprocess AI-vs-AI tournaments on the Hyper-Pong engine.
+
+Every ordered pair of AIs plays `--rounds` full matches (11 points, win by 2,
+best of 3 sets, as in ppg.py) on each side of the table. Matches run
+headlessly in a `ProcessPoolExecutor` sized to the machine's cores; each
+worker returns a small result dict and the parent streams them into one JSON
+Lines file.
+
+    python -m pong_core.tournament --ai tracker --ai sluggish --rounds 20
+"""
+import argparse
+import itertools
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from pong_core.ai import AIS, make_ai
+from pong_core.controls import LEFT, RIGHT
+from pong_core.engine import GameEngine, GameState, PADDLE_HIT, POINT_SCORED
+from pong_core.rules import HYPER_PONG
+
+# Matches between two AIs that never miss would otherwise never end
+DEFAULT_MAX_TICKS = 200_000
+
+
+def play_match(left, right, seed, max_ticks=DEFAULT_MAX_TICKS, swept=False, rules=HYPER_PONG):
+    """Plays one match between two registered AIs; returns its result dict."""
+    engine = GameEngine(rules, swept=swept)
+    engine.start_match(seed)
+    left_ai, right_ai = make_ai(left, seed), make_ai(right, seed + 1)
+
+    points = {LEFT: 0, RIGHT: 0}
+    rallies = []
+    hits = 0
+    while engine.state == GameState.PLAYING and engine.ticks < max_ticks:
+        before = (engine.opponent_score, engine.opponent_sets)
+        events = engine.step(right_ai(engine, RIGHT), left_ai(engine, LEFT))
+        if events & PADDLE_HIT:
+            hits += 1
+        if events & POINT_SCORED:
+            # Winning a set resets both scores, so compare each side's own count
+            left_scored = engine.opponent_score > before[0] or engine.opponent_sets > before[1]
+            points[LEFT if left_scored else RIGHT] += 1
+            rallies.append(hits)
+            hits = 0
+
+    winner = None
+    if engine.state != GameState.PLAYING:
+        winner = RIGHT if engine.player_sets > engine.opponent_sets else LEFT
+    return {
+        "left": left,
+        "right": right,
+        "seed": seed,
+        "winner": winner,
+        "sets": [engine.opponent_sets, engine.player_sets],
+        "points": [points[LEFT], points[RIGHT]],
+        "rallies": rallies,
+        "ticks": engine.ticks,
+    }
+
+
+def _play(task):
+    return play_match(*task)
+
+
+def schedule(ais, rounds, seed=0, max_ticks=DEFAULT_MAX_TICKS, swept=False):
+    """Yields one task tuple per match: every ordered AI pair, `rounds` times."""
+    pairs = list(itertools.permutations(ais, 2)) or [(ais[0], ais[0])]
+    matches = itertools.product(range(rounds), pairs)
+    for number, (_, (left, right)) in enumerate(matches):
+        yield (left, right, seed + 2 * number, max_ticks, swept)
+
+
+def run_tournament(ais, rounds, out_path, workers=None, seed=0, max_ticks=DEFAULT_MAX_TICKS, swept=False):
+    """Runs every scheduled match across processes; returns per-AI win counts."""
+    tasks = list(schedule(ais, rounds, seed, max_ticks, swept))
+    workers = workers or os.cpu_count() or 1
+    # Large chunks keep inter-process traffic negligible next to the matches
+    chunksize = max(1, len(tasks) // (workers * 4))
+
+    wins = Counter()
+    with open(out_path, "w") as out, ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(_play, tasks, chunksize=chunksize):
+            out.write(json.dumps(result) + "\n")
+            if result["winner"] is not None:
+                wins[result[result["winner"]]] += 1
+            else:
+                wins["(unfinished)"] += 1
+    return wins, len(tasks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a headless AI-vs-AI Hyper-Pong tournament.")
+    parser.add_argument("--ai", action="append", choices=sorted(AIS), dest="ais",
+                        help="AI to enter (repeatable; default: tracker and sluggish)")
+    parser.add_argument("--rounds", type=int, default=10, help="matches per ordered pair")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--swept", action="store_true", help="use swept paddle collision")
+    parser.add_argument("--out", default="tournament.jsonl", help="results file (JSON Lines)")
+    args = parser.parse_args(argv)
+
+    ais = args.ais or ["tracker", "sluggish"]
+    start = time.perf_counter()
+    wins, matches = run_tournament(
+        ais, args.rounds, args.out, args.workers, args.seed, args.max_ticks, args.swept
+    )
+    elapsed = time.perf_counter() - start
+    for name, count in wins.most_common():
+        print(f"{name:>14}: {count} wins")
+    print(f"{matches} matches in {elapsed:.1f}s ({matches / elapsed:.1f}/s), results in {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Parameter sweeps over the Pro Ping-Pong physics constants.
+
+Every combination of the given rule values (`ProPongRules` fields such as
+angle_multiplier, ball_dy_max, paddle_speed and ball_speed_initial) plays
+`--matches` headless `Match`es between two scripted paddles that follow the
+ball's center on a `--reaction` share of ticks. Matches run in a
+`ProcessPoolExecutor` sized to the machine's cores. Each config is scored on:
+
+    hits_per_rally   paddle hits per point
+    rally_seconds    play time per point
+    tunnels          ticks where the ball's path crossed a paddle, or clipped
+                     its corner, without a hit (what --collision swept prevents)
+    stuck            rallies cut off after --stuck-seconds, or a paddle hitting
+                     the ball again within STUCK_REHIT_TICKS (ball trapped)
+
+and ranked by `score` (lower is better). Results are appended to a JSON
+Lines cache keyed by the config and the simulation settings, so a rerun only
+plays the configs it has not seen:
+
+    python -m pong_core.tune --param angle_multiplier=0.08:0.16:0.02 --param paddle_speed=8,10,12
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from pong_core.ai import track_ball
+from pong_core.collision import sweep_box
+from pong_core.controls import LEFT, RIGHT
+from pong_core.pro_pong import Match
+from pong_core.rules import PRO_PONG, override
+
+CACHE_VERSION = 2  # Bump when the simulation or the metrics change
+DEFAULT_CACHE = "tune_cache.jsonl"
+STUCK_REHIT_TICKS = 8
+
+
+def parse_values(text):
+    """"a,b,c" or an inclusive "start:stop:step" range; returns the values as strings."""
+    if ":" not in text:
+        return text.split(",")
+    start, stop, step = (float(part) for part in text.split(":"))
+    count = int(round((stop - start) / step)) + 1
+    return [f"{start + step * index:g}" for index in range(count)]
+
+
+def configs(params):
+    """Every combination of {name: [values]} as a list of {name: value} dicts."""
+    names = sorted(params)
+    return [dict(zip(names, values)) for values in itertools.product(*(params[name] for name in names))]
+
+
+def cache_key(config, settings):
+    blob = json.dumps([CACHE_VERSION, sorted(config.items()), sorted(settings.items())])
+    return hashlib.sha1(blob.encode()).hexdigest()
+
+
+# --- One match ---
+def play_match(config, seed, reaction, max_ticks, stuck_seconds):
+    """Plays one match with `config` applied to PRO_PONG; returns its raw counts."""
+    rules = override(PRO_PONG, **config)
+    match = Match(rules)
+    rng = random.Random(seed)
+    stuck_ticks = int(stuck_seconds * rules.fps)
+    counts = {"points": 0, "hits": 0, "rally_ticks": 0, "tunnels": 0, "stuck": 0, "finished": 0, "ticks": 0}
+    rally_ticks = 0
+    last_hit = {1: -STUCK_REHIT_TICKS, -1: -STUCK_REHIT_TICKS}
+
+    tick = -1  # No ticks at all when max_ticks is 0
+    for tick in range(max_ticks):
+        ball_x, ball_y, dx = int(match.ball_x), int(match.ball_y), match.ball_dx
+        can_hit = match.serve_cooldown == 0 and match.paddle_hit_cooldown <= 1
+        points = (match.score_a, match.score_b, match.sets_a, match.sets_b)
+        over = match.step(*track_ball(match, LEFT, rng, reaction), *track_ball(match, RIGHT, rng, reaction))
+        rally_ticks += 1
+
+        if over or points != (match.score_a, match.score_b, match.sets_a, match.sets_b):
+            counts["points"] += 1
+            counts["rally_ticks"] += rally_ticks
+            rally_ticks = 0
+            if over:
+                counts["finished"] = 1
+                break
+        elif (match.ball_dx > 0) != (dx > 0):
+            counts["hits"] += 1
+            side = 1 if dx < 0 else -1  # Left paddle (1) hit a ball moving left
+            if tick - last_hit[side] < STUCK_REHIT_TICKS:
+                counts["stuck"] += 1
+            last_hit[side] = tick
+        elif can_hit:
+            # No hit: did the ball's drawn rect cross the paddle it was heading for this tick?
+            paddle_x, paddle_y = (match.left_x, match.p1_y) if dx < 0 else (match.right_x, match.p2_y)
+            contact = sweep_box(ball_x, ball_y, rules.ball_size, rules.ball_size,
+                                int(match.ball_x) - ball_x, int(match.ball_y) - ball_y,
+                                paddle_x, int(paddle_y), rules.paddle_width, rules.paddle_height)
+            if contact is not None and 0.0 < contact.time < 1.0:  # Not already beside it, not just touching
+                counts["tunnels"] += 1
+
+        if rally_ticks >= stuck_ticks:
+            counts["stuck"] += 1
+            counts["rally_ticks"] += rally_ticks
+            counts["points"] += 1
+            rally_ticks = 0
+            match.serve(rng.random() < 0.5)
+    counts["ticks"] = tick + 1
+    return counts
+
+
+def _play(task):
+    index, config, seed, reaction, max_ticks, stuck_seconds = task
+    return index, play_match(config, seed, reaction, max_ticks, stuck_seconds)
+
+
+# --- Sweeps ---
+def summarize(config, totals, matches):
+    points = max(totals["points"], 1)
+    return {
+        "config": config,
+        "matches": matches,
+        "finished": totals["finished"],
+        "points": totals["points"],
+        "hits_per_rally": totals["hits"] / points,
+        "rally_seconds": totals["rally_ticks"] / points / override(PRO_PONG, **config).fps,
+        "tunnels": totals["tunnels"],
+        "stuck": totals["stuck"],
+    }
+
+
+def score(result, target_hits=8.0):
+    """Lower is better: distance from `target_hits` per rally, plus tunnels and stuck balls per point."""
+    points = max(result["points"], 1)
+    return (
+        abs(result["hits_per_rally"] - target_hits) / target_hits
+        + (result["tunnels"] + result["stuck"]) / points
+    )
+
+
+def load_cache(path):
+    cache = {}
+    if os.path.exists(path):
+        with open(path) as src:
+            for line in src:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Line cut short by an interrupted run
+                cache[entry["key"]] = entry["result"]
+    return cache
+
+
+def sweep(params, matches=8, seed=0, reaction=0.3, max_ticks=200_000, stuck_seconds=60.0,
+          cache_path=DEFAULT_CACHE, workers=None):
+    """Evaluates every config not yet in the cache; returns (results, configs played)."""
+    settings = {"matches": matches, "seed": seed, "reaction": reaction, "max_ticks": max_ticks,
+                "stuck_seconds": stuck_seconds}
+    cache = load_cache(cache_path) if cache_path else {}
+    todo = [config for config in configs(params) if cache_key(config, settings) not in cache]
+
+    tasks = [
+        (index, config, seed + number, reaction, max_ticks, stuck_seconds)
+        for index, config in enumerate(todo)
+        for number in range(matches)
+    ]
+    totals = [dict.fromkeys(("points", "hits", "rally_ticks", "tunnels", "stuck", "finished", "ticks"), 0)
+              for _ in todo]
+    remaining = [matches] * len(todo)
+    workers = workers or os.cpu_count() or 1
+    if tasks:
+        out = open(cache_path, "a") if cache_path else None
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for index, counts in pool.map(_play, tasks, chunksize=max(1, len(tasks) // (workers * 4))):
+                    for name, value in counts.items():
+                        totals[index][name] += value
+                    remaining[index] -= 1
+                    if remaining[index] == 0:
+                        # Cached as soon as its last match is in, so an interrupted sweep keeps it
+                        result = summarize(todo[index], totals[index], matches)
+                        cache[cache_key(todo[index], settings)] = result
+                        if out:
+                            out.write(json.dumps({"key": cache_key(todo[index], settings), "result": result}) + "\n")
+                            out.flush()
+        finally:
+            if out:
+                out.close()
+
+    results = [cache[cache_key(config, settings)] for config in configs(params)]
+    return results, len(todo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep Pro Ping-Pong physics constants with headless matches.")
+    parser.add_argument("--param", action="append", required=True, metavar="NAME=VALUES",
+                        help="rule values to try: a,b,c or start:stop:step (repeatable)")
+    parser.add_argument("--matches", type=int, default=8, help="matches per config")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--reaction", type=float, default=0.3,
+                        help="fraction of ticks the scripted paddles react on (default: 0.3)")
+    parser.add_argument("--max-ticks", type=int, default=200_000, help="ticks before a match is cut off")
+    parser.add_argument("--stuck-seconds", type=float, default=60.0,
+                        help="rally length counted as a stuck ball; the ball is then served again")
+    parser.add_argument("--target-hits", type=float, default=8.0, help="ideal paddle hits per rally")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE, help="results cache (JSON Lines); '' disables it")
+    parser.add_argument("--top", type=int, default=10, help="configs to print")
+    args = parser.parse_args(argv)
+
+    params = {}
+    for item in args.param:
+        name, _, values = item.partition("=")
+        if name not in PRO_PONG._fields:
+            parser.error(f"unknown rule {name!r}; choose from {', '.join(PRO_PONG._fields)}")
+        params[name] = parse_values(values)
+    if args.max_ticks < 1:
+        parser.error("--max-ticks must be at least 1")
+
+    start = time.perf_counter()
+    results, played = sweep(params, args.matches, args.seed, args.reaction, args.max_ticks,
+                            args.stuck_seconds, args.cache, args.workers)
+    elapsed = time.perf_counter() - start
+    results.sort(key=lambda result: score(result, args.target_hits))
+    for result in results[:args.top]:
+        config = " ".join(f"{name}={value}" for name, value in sorted(result["config"].items()))
+        print(f"{score(result, args.target_hits):7.3f}  {config}  "
+              f"hits/rally {result['hits_per_rally']:.1f}  rally {result['rally_seconds']:.1f}s  "
+              f"tunnels {result['tunnels']}  stuck {result['stuck']}  finished {result['finished']}/{result['matches']}")
+    print(f"{len(results)} configs, {played} played and {len(results) - played} from the cache, in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
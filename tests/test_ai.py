@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from pong_core.ai import DIFFICULTIES, PredictiveAI, intercept_y, make_ai
+from pong_core.controls import LEFT, RIGHT
+from pong_core.engine import GameEngine
+
+TICKS = 10_000
+
+
+def reflect(y, speed, low, high):
+    """Mirrors a position that left [low, high] back in, flipping the speed per bounce."""
+    bounces = 0
+    while y < low or y > high:
+        y = 2 * low - y if y < low else 2 * high - y
+        speed, bounces = -speed, bounces + 1
+    return y, speed, bounces
+
+
+def brute_force_crossing(x, y, speed_x, speed_y, plane_x, low, high):
+    """Steps the ball tick by tick, bouncing off the walls, until it reaches `plane_x`.
+
+    Returns (y, ticks, bounces) at the crossing.
+    """
+    ticks = bounces = 0
+    while (plane_x - x) / speed_x > 1:
+        x, ticks = x + speed_x, ticks + 1
+        y, speed_y, bounced = reflect(y + speed_y, speed_y, low, high)
+        bounces += bounced
+    rest = (plane_x - x) / speed_x
+    y, _, bounced = reflect(y + speed_y * rest, speed_y, low, high)
+    return y, ticks + rest, bounces + bounced
+
+
+def test_intercept_matches_a_tick_by_tick_ball_path():
+    rng = random.Random(0)
+    engine = GameEngine()
+    rules, low, high = engine.rules, 0, engine.rules.screen_height - engine.ball_size
+    most_bounces = 0
+    for _ in range(500):
+        side = rng.choice((LEFT, RIGHT))
+        engine.ball_x = rng.randrange(100, rules.screen_width - 100)
+        engine.ball_y = rng.randrange(low, high + 1)
+        engine.ball_speed_x = rng.choice((-1, 1)) * rng.randrange(2, 12)
+        engine.ball_speed_y = rng.choice((-1, 1)) * rng.randrange(0, 60)
+        if side == LEFT:
+            engine.ball_speed_x = -abs(engine.ball_speed_x)
+            plane_x = engine.opponent_x + rules.paddle_width
+        else:
+            engine.ball_speed_x = abs(engine.ball_speed_x)
+            plane_x = engine.player_x - engine.ball_size
+
+        y, ticks = intercept_y(engine, side)
+        expected_y, expected_ticks, bounces = brute_force_crossing(
+            engine.ball_x, engine.ball_y, engine.ball_speed_x, engine.ball_speed_y, plane_x, low, high)
+        assert y == pytest.approx(expected_y, abs=1e-6)
+        assert ticks == pytest.approx(expected_ticks)
+        most_bounces = max(most_bounces, bounces)
+    assert most_bounces >= 3
+
+
+def test_no_intercept_for_a_ball_going_away_or_already_past():
+    engine = GameEngine()
+    engine.ball_x, engine.ball_y, engine.ball_speed_y = 400, 300, 5
+    engine.ball_speed_x = 8
+    assert intercept_y(engine, LEFT) is None
+    assert intercept_y(engine, RIGHT) is not None
+    engine.ball_x = engine.player_x  # Behind the right paddle's face
+    assert intercept_y(engine, RIGHT) is None
+
+
+@pytest.mark.parametrize("difficulty", sorted(DIFFICULTIES))
+def test_difficulty_aim_error_and_reaction_delay(difficulty):
+    error, delay = DIFFICULTIES[difficulty]
+    engine = GameEngine()
+    engine.start_match(0)
+    engine.ball_speed_x = abs(engine.ball_speed_x)  # Heading for the RIGHT paddle
+    y, _ = intercept_y(engine, RIGHT)
+    start = engine.ticks
+    for seed in range(20):
+        ai = PredictiveAI(difficulty, seed)
+        moves = []
+        for tick in range(delay + 1):
+            engine.ticks = start + tick
+            moves.append(ai(engine, RIGHT))
+        assert moves[:delay] == [0] * delay  # Waits before reacting to the new trajectory
+        assert abs(ai._target - (y + engine.ball_size / 2)) <= error
+
+
+def points_lost(name, seeds=range(3)):
+    """Points an AI on the right paddle concedes to `center_ai` on the left."""
+    lost = 0
+    for seed in seeds:
+        engine = GameEngine()
+        engine.start_match(seed)
+        right, left = make_ai(name, seed), make_ai("center", seed)
+        for _ in range(TICKS):
+            conceded = (engine.opponent_score, engine.opponent_sets)
+            engine.step(right(engine, RIGHT), left(engine, LEFT))
+            lost += (engine.opponent_score, engine.opponent_sets) != conceded
+    return lost
+
+
+def test_harder_difficulties_concede_fewer_points():
+    easy, medium, hard = (points_lost(f"predictive-{name}") for name in ("easy", "medium", "hard"))
+    assert hard == 0
+    assert hard < medium < easy
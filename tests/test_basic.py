@@ -0,0 +1,124 @@
+import random
+
+import pygame
+
+from pong_core import controls
+from pong_core.basic import BasicGame
+from pong_core.inputs import KeyboardSource
+
+# The constants of the original ping_pong_gemini.py
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+PADDLE_WIDTH = 10
+PADDLE_HEIGHT = 140
+BALL_RADIUS = 7
+PADDLE_SPEED = 7
+BALL_SPEED_X = 7
+BALL_SPEED_Y = 7
+
+TICKS = 60_000
+
+
+class LegacyBasic:
+    """The original ping_pong_gemini.py loop, without drawing or the window clock."""
+
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+        self.player_paddle = pygame.Rect(SCREEN_WIDTH - 20 - PADDLE_WIDTH, SCREEN_HEIGHT / 2 - PADDLE_HEIGHT / 2, PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.opponent_paddle = pygame.Rect(20, SCREEN_HEIGHT / 2 - PADDLE_HEIGHT / 2, PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.ball = pygame.Rect(SCREEN_WIDTH / 2 - BALL_RADIUS, SCREEN_HEIGHT / 2 - BALL_RADIUS, BALL_RADIUS * 2, BALL_RADIUS * 2)
+        self.ball_speed_x = BALL_SPEED_X * self.random.choice((1, -1))
+        self.ball_speed_y = BALL_SPEED_Y * self.random.choice((1, -1))
+        self.player_speed = 0
+        self.player_score = 0
+        self.opponent_score = 0
+
+    def ball_reset(self):
+        self.ball.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+        self.ball_speed_y *= self.random.choice((1, -1))
+        self.ball_speed_x *= self.random.choice((1, -1))
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_DOWN:
+                self.player_speed += PADDLE_SPEED
+            if event.key == pygame.K_UP:
+                self.player_speed -= PADDLE_SPEED
+        if event.type == pygame.KEYUP:
+            if event.key == pygame.K_DOWN:
+                self.player_speed -= PADDLE_SPEED
+            if event.key == pygame.K_UP:
+                self.player_speed += PADDLE_SPEED
+
+    def step(self):
+        ball, player_paddle, opponent_paddle = self.ball, self.player_paddle, self.opponent_paddle
+        ball.x += self.ball_speed_x
+        ball.y += self.ball_speed_y
+
+        if ball.top <= 0 or ball.bottom >= SCREEN_HEIGHT:
+            self.ball_speed_y *= -1
+
+        if ball.left <= 0:
+            self.player_score += 1
+            self.ball_reset()
+        if ball.right >= SCREEN_WIDTH:
+            self.opponent_score += 1
+            self.ball_reset()
+
+        if ball.colliderect(player_paddle) or ball.colliderect(opponent_paddle):
+            self.ball_speed_x *= -1
+
+        player_paddle.y += self.player_speed
+        if player_paddle.top <= 0:
+            player_paddle.top = 0
+        if player_paddle.bottom >= SCREEN_HEIGHT:
+            player_paddle.bottom = SCREEN_HEIGHT
+
+        if opponent_paddle.top < ball.y:
+            opponent_paddle.top += PADDLE_SPEED
+        if opponent_paddle.bottom > ball.y:
+            opponent_paddle.bottom -= PADDLE_SPEED
+        if opponent_paddle.top <= 0:
+            opponent_paddle.top = 0
+        if opponent_paddle.bottom >= SCREEN_HEIGHT:
+            opponent_paddle.bottom = SCREEN_HEIGHT
+
+
+def game_state(game):
+    return (tuple(game.ball), tuple(game.player_paddle), tuple(game.opponent_paddle),
+            game.ball_speed_x, game.ball_speed_y, game.player_score, game.opponent_score)
+
+
+def key_events(rng, held):
+    """A frame's KEYDOWN/KEYUP events: each arrow key is pressed or released now and then."""
+    events = []
+    for key in (pygame.K_UP, pygame.K_DOWN, pygame.K_w):
+        if rng.random() < 0.03:
+            kind = pygame.KEYUP if key in held else pygame.KEYDOWN
+            held.symmetric_difference_update((key,))
+            events.append(pygame.event.Event(kind, key=key))
+    rng.shuffle(events)
+    return events
+
+
+def test_basic_game_matches_the_original_loop_tick_for_tick():
+    rng = random.Random(0)
+    game, legacy = BasicGame(seed=1), LegacyBasic(seed=1)
+    keyboard = KeyboardSource(sides=(controls.RIGHT,))
+    held = set()
+    both_held = top = bottom = 0
+    for tick in range(TICKS):
+        # The script's event loop, then one tick of game logic
+        for event in key_events(rng, held):
+            keyboard.handle_event(event)
+            legacy.handle_event(event)
+        game.step(controls.direction(keyboard.poll(), *controls.SIDE_BITS[controls.RIGHT]))
+        legacy.step()
+        assert game_state(game) == game_state(legacy), f"tick {tick}"
+
+        both_held += {pygame.K_UP, pygame.K_DOWN} <= held
+        top += game.player_paddle.top == 0
+        bottom += game.player_paddle.bottom == SCREEN_HEIGHT
+    # Both arrows held cancel out, and the paddle was held against both walls
+    assert both_held and top and bottom
+    assert game.player_score + game.opponent_score > 0
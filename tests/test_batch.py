@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from pong_core.batch import OPPONENT, PLAYER, BatchSimulator, tracking_policy
+from pong_core.engine import OPPONENT_NAME, PLAYER_NAME, GameEngine, GameState
+from pong_core.rules import HYPER_PONG
+
+GAMES = 6
+MAX_TICKS = 20_000
+WINNERS = {"": 0, PLAYER_NAME: PLAYER, OPPONENT_NAME: OPPONENT}
+
+
+class Serves:
+    """Stands in for GameEngine's rng: replays the serve directions the batch drew."""
+
+    def __init__(self):
+        self.queue = []
+
+    def serve(self, ball_dx, ball_dy):
+        self.queue += [int(np.sign(ball_dy)), int(np.sign(ball_dx))]  # ball_reset draws y first
+
+    def choice(self, options):
+        return self.queue.pop(0)
+
+
+FIELDS = ("ball_x", "ball_y", "ball_dx", "ball_dy", "player_y", "opponent_y",
+          "player_score", "opponent_score", "player_sets", "opponent_sets", "done", "winner")
+
+
+def engine_row(engine):
+    return (engine.ball_x, engine.ball_y, engine.ball_speed_x, engine.ball_speed_y, engine.player_y,
+            engine.opponent_y, engine.player_score, engine.opponent_score, engine.player_sets,
+            engine.opponent_sets, engine.state != GameState.PLAYING, WINNERS[engine.match_winner])
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_batch_matches_the_engine_tick_for_tick(seed):
+    sim = BatchSimulator(GAMES, HYPER_PONG, seed)
+    engines = []
+    for game in range(GAMES):
+        engine = GameEngine(HYPER_PONG)
+        engine.rng = Serves()
+        engine.rng.serve(sim.ball_dx[game], sim.ball_dy[game])
+        engine.start_match()
+        engines.append(engine)
+
+    for tick in range(MAX_TICKS):
+        if sim.done.all():
+            break
+        player_dir, opponent_dir = tracking_policy(sim, reaction=0.3)
+        _, _, _, scored = sim.step(player_dir, opponent_dir)
+        for game in np.flatnonzero(scored):
+            engines[game].rng.serve(sim.ball_dx[game], sim.ball_dy[game])
+        for engine, player, opponent in zip(engines, player_dir, opponent_dir):
+            engine.step(int(player), int(opponent))
+        batch = np.stack([getattr(sim, name) for name in FIELDS], axis=1).tolist()
+        assert batch == [list(engine_row(engine)) for engine in engines], f"tick {tick}"
+    assert sim.done.all()
@@ -0,0 +1,72 @@
+import pygame
+import pytest
+
+from pong_core.collision import Contact, sweep_box, sweep_rect
+from pong_core.engine import PADDLE_HIT, GameEngine
+
+BALL = (0, 0, 10, 10)
+PADDLE = (30, -20, 12, 90)
+
+
+def test_head_on_hit_reports_the_time_and_the_face():
+    assert sweep_box(*BALL, 40, 0, *PADDLE) == Contact(0.5, -1, 0)
+    assert sweep_box(50, 0, 10, 10, -16, 0, *PADDLE) == Contact(0.5, 1, 0)
+
+
+def test_top_and_bottom_faces():
+    assert sweep_box(30, -40, 10, 10, 0, 20, *PADDLE) == Contact(0.5, 0, -1)
+    assert sweep_box(30, 80, 10, 10, 0, -20, *PADDLE) == Contact(0.5, 0, 1)
+
+
+def test_a_fast_ball_does_not_tunnel_through_a_thin_paddle():
+    contact = sweep_box(*BALL, 400, 0, *PADDLE)
+    assert contact == Contact(20 / 400, -1, 0)
+
+
+@pytest.mark.parametrize("move", [(10, 0), (-40, 0), (40, 200), (0, 40)])
+def test_moves_that_fall_short_go_away_or_pass_by_miss(move):
+    assert sweep_box(*BALL, *move, *PADDLE) is None
+
+
+def test_sliding_along_a_face_is_not_a_hit():
+    # Touching edges do not collide, as with Rect.colliderect
+    assert sweep_box(0, -30, 10, 10, 100, 0, *PADDLE) is None
+    assert sweep_box(0, 70, 10, 10, 100, 0, *PADDLE) is None
+
+
+def test_a_corner_graze_is_not_a_hit():
+    # The ball's top-left corner passes exactly over the paddle's bottom-right corner
+    assert sweep_box(0, 20, 10, 10, 20, -20, 0, 0, 10, 10) is None
+    # One pixel lower and the corners overlap
+    assert sweep_box(0, 19, 10, 10, 20, -20, 0, 0, 10, 10) is not None
+
+
+def test_touching_at_the_end_of_the_move_is_reported():
+    assert sweep_box(*BALL, 20, 0, *PADDLE) == Contact(1.0, -1, 0)
+
+
+def test_boxes_already_overlapping_report_time_zero():
+    assert sweep_box(25, 0, 10, 10, 5, 0, *PADDLE) == Contact(0.0, -1, 0)
+    assert sweep_box(25, 0, 10, 10, 0, 0, *PADDLE).time == 0.0
+
+
+def test_zero_velocity():
+    assert sweep_box(*BALL, 0, 0, *PADDLE) is None
+
+
+def test_sweep_rect_matches_sweep_box():
+    ball, paddle = pygame.Rect(BALL), pygame.Rect(PADDLE)
+    for move in [(40, 0), (40, 30), (10, 0), (0, 0)]:
+        assert sweep_rect(ball, move, paddle) == sweep_box(*BALL, *move, *PADDLE)
+
+
+def test_engine_sweep_lands_the_ball_on_the_paddle_face():
+    # 15 / 22 * 22 is 14.999..., which int() used to truncate a pixel short
+    engine = GameEngine(swept=True)
+    engine.start_match(0)
+    engine.ball_x = engine.player_x - engine.ball_size - 15
+    engine.ball_y = engine.player_y + 20
+    engine.ball_speed_x, engine.ball_speed_y = 22, 0
+    assert engine._sweep_ball() == PADDLE_HIT
+    assert engine.ball_x + engine.ball_size == engine.player_x
+    assert engine.ball_speed_x == -22
@@ -0,0 +1,122 @@
+import random
+
+import pygame
+import pytest
+
+from pong_core.ai import make_ai
+from pong_core.collision import sweep_rect
+from pong_core.controls import LEFT, RIGHT
+from pong_core.engine import GameEngine, GameState
+from pong_core.rules import HYPER_PONG
+
+
+class LegacyMatch:
+    """The physics of the original ppg.py loop, on pygame.Rect, without drawing or sound."""
+
+    def __init__(self, seed, swept):
+        r = HYPER_PONG
+        self.rng = random.Random(seed)
+        self.swept = swept
+        self.player = pygame.Rect(r.screen_width - 30 - r.paddle_width, r.screen_height / 2 - r.paddle_height / 2,
+                                  r.paddle_width, r.paddle_height)
+        self.opponent = pygame.Rect(30, r.screen_height / 2 - r.paddle_height / 2, r.paddle_width, r.paddle_height)
+        self.ball = pygame.Rect(r.screen_width / 2 - r.ball_radius, r.screen_height / 2 - r.ball_radius,
+                                r.ball_radius * 2, r.ball_radius * 2)
+        self.player_score = self.opponent_score = self.player_sets = self.opponent_sets = 0
+        self.over = False
+        self.ball_reset()
+
+    def ball_reset(self):
+        r = HYPER_PONG
+        self.ball.center = (r.screen_width / 2, r.screen_height / 2)
+        self.speed_y = r.ball_speed_y_start * self.rng.choice((1, -1))
+        self.speed_x = r.ball_speed_x_start * self.rng.choice((1, -1))
+
+    def sweep(self):
+        contact = None
+        for paddle in (self.player, self.opponent):
+            hit = sweep_rect(self.ball, (self.speed_x, self.speed_y), paddle)
+            if hit is not None and (contact is None or hit.time < contact.time):
+                contact = hit
+        if contact is None:
+            self.ball.x += self.speed_x
+            self.ball.y += self.speed_y
+            return
+        self.ball.x += round(self.speed_x * contact.time)
+        self.ball.y += round(self.speed_y * contact.time)
+        if contact.normal_x:
+            self.speed_x = contact.normal_x * abs(self.speed_x)
+        else:
+            self.speed_y = contact.normal_y * abs(self.speed_y)
+
+    def step(self, player_dir, opponent_dir):
+        r = HYPER_PONG
+        ball = self.ball
+        if self.swept:
+            self.sweep()
+        else:
+            ball.x += self.speed_x
+            ball.y += self.speed_y
+        if ball.top <= 0 or ball.bottom >= r.screen_height:
+            self.speed_y *= -1
+        if not self.swept and ball.colliderect(self.player):
+            if abs(ball.right - self.player.left) < 10:
+                self.speed_x *= -1
+            elif abs(ball.bottom - self.player.top) < 10 and self.speed_y > 0:
+                self.speed_y *= -1
+            elif abs(ball.top - self.player.bottom) < 10 and self.speed_y < 0:
+                self.speed_y *= -1
+        if not self.swept and ball.colliderect(self.opponent):
+            if abs(ball.left - self.opponent.right) < 10:
+                self.speed_x *= -1
+            elif abs(ball.bottom - self.opponent.top) < 10 and self.speed_y > 0:
+                self.speed_y *= -1
+            elif abs(ball.top - self.opponent.bottom) < 10 and self.speed_y < 0:
+                self.speed_y *= -1
+        if ball.left <= 0:
+            self.player_score += 1
+            self.ball_reset()
+        if ball.right >= r.screen_width:
+            self.opponent_score += 1
+            self.ball_reset()
+        if self.player_score >= r.winning_score and self.player_score >= self.opponent_score + 2:
+            self.player_sets += 1
+            self.player_score, self.opponent_score = 0, 0
+        if self.opponent_score >= r.winning_score and self.opponent_score >= self.player_score + 2:
+            self.opponent_sets += 1
+            self.player_score, self.opponent_score = 0, 0
+        if self.player_sets >= r.sets_to_win_match or self.opponent_sets >= r.sets_to_win_match:
+            self.over = True
+        for paddle, direction in ((self.player, player_dir), (self.opponent, opponent_dir)):
+            paddle.y += direction * r.paddle_speed
+            if paddle.top <= 0:
+                paddle.top = 0
+            if paddle.bottom >= r.screen_height:
+                paddle.bottom = r.screen_height
+
+    def state(self):
+        return (self.ball.x, self.ball.y, self.speed_x, self.speed_y, self.player.y, self.opponent.y,
+                self.player_score, self.opponent_score, self.player_sets, self.opponent_sets, self.over)
+
+
+def engine_state(engine):
+    return (engine.ball_x, engine.ball_y, engine.ball_speed_x, engine.ball_speed_y, engine.player_y,
+            engine.opponent_y, engine.player_score, engine.opponent_score, engine.player_sets,
+            engine.opponent_sets, engine.state == GameState.GAME_OVER)
+
+
+MAX_TICKS = 20_000  # Swept-collision AIs rally for a very long time
+
+
+@pytest.mark.parametrize("swept", [False, True])
+def test_engine_matches_the_original_loop_tick_for_tick(swept):
+    for seed in range(4):
+        engine = GameEngine(swept=swept)
+        engine.start_match(seed)
+        legacy = LegacyMatch(seed, swept)
+        right, left = make_ai("sluggish", seed), make_ai("tracker", seed + 1)
+        while engine.state == GameState.PLAYING and engine.ticks < MAX_TICKS:
+            player_dir, opponent_dir = right(engine, RIGHT), left(engine, LEFT)
+            engine.step(player_dir, opponent_dir)
+            legacy.step(player_dir, opponent_dir)
+            assert engine_state(engine) == legacy.state(), f"seed {seed}, tick {engine.ticks}"
@@ -0,0 +1,34 @@
+import numpy as np
+
+from pong_core.env import OBS_FIELDS, VectorPongEnv, random_actions, tracking_actions
+from pong_core.pro_pong import Match
+
+GAMES = 8
+TICKS = 10_000
+
+
+def match_obs(match):
+    return (match.ball_x, match.ball_y, match.ball_dx, match.ball_dy, match.p1_y, match.p2_y,
+            match.score_a, match.score_b, match.sets_a, match.sets_b, match.serve_cooldown)
+
+
+def test_env_matches_match_tick_for_tick():
+    env = VectorPongEnv(GAMES)
+    matches = [Match() for _ in range(GAMES)]
+    rng = np.random.default_rng(0)
+    obs, _ = env.reset()
+    finished = 0
+    for tick in range(TICKS):
+        # A tracking left paddle against a random right one: rallies, misses and match ends
+        actions = tracking_actions(obs, 0.9, rng)
+        actions[:, 1] = random_actions(obs, rng)[:, 1]
+        over = [match.step(left < 0, left > 0, right < 0, right > 0) for match, (left, right) in zip(matches, actions)]
+        obs, _, terminated, _, _ = env.step(actions)
+        assert list(terminated) == over, f"tick {tick}"
+        for game in np.flatnonzero(terminated):
+            matches[game] = Match()  # The env auto-resets finished matches
+            finished += 1
+        expected = np.array([match_obs(match) for match in matches], np.float32)
+        assert expected.shape == (GAMES, len(OBS_FIELDS))
+        np.testing.assert_array_equal(obs, expected, err_msg=f"tick {tick}")
+    assert finished > 0
@@ -0,0 +1,62 @@
+from pong_core.controls import LEFT
+from pong_core.net import ABANDONED, HISTORY, OVER_LINGER, PLAYING, NetClient, PongServer, Room, encode_state
+from pong_core.rules import PRO_PONG
+
+
+class FakeTransport:
+    """Collects what the server sends, per address."""
+
+    def __init__(self):
+        self.sent = {}
+
+    def sendto(self, data, addr):
+        self.sent.setdefault(addr, []).append(data)
+
+    def is_closing(self):
+        return False
+
+
+def deliver(transport, addr, client):
+    for data in transport.sent.pop(addr, []):
+        client.receive(data)
+
+
+def test_client_state_bases_stay_bounded_on_a_lossy_link():
+    room = Room(1, PRO_PONG, PRO_PONG.fps, "rect")
+    client = NetClient(1)
+    client.side = LEFT
+    for tick in range(1, 20 * HISTORY):
+        if tick % 3:  # Two of every three states are lost
+            continue
+        client.receive(encode_state(tick, room.snapshot(), 0))
+    assert client.state_tick == 20 * HISTORY - 2
+    assert len(client.states) <= HISTORY
+    assert min(client.states) > client.state_tick - HISTORY
+
+
+def test_a_player_leaving_mid_match_abandons_it_for_the_other():
+    server = PongServer()
+    transport = FakeTransport()
+    server.connection_made(transport)
+    clients = {("127.0.0.1", port): NetClient(1) for port in (5001, 5002)}
+    for addr, client in clients.items():
+        server.datagram_received(client.join_packet(), addr)
+        deliver(transport, addr, client)
+    for _ in range(5):
+        server.tick()
+        for addr, client in clients.items():
+            deliver(transport, addr, client)
+            server.datagram_received(client.input_packet(False, False), addr)
+    assert all(client.status == PLAYING for client in clients.values())
+
+    (left_addr, leaver), (stayer_addr, stayer) = clients.items()
+    server.datagram_received(leaver.leave_packet(), left_addr)
+    server.tick()
+    deliver(transport, stayer_addr, stayer)
+    assert stayer.status == ABANDONED
+    assert left_addr not in transport.sent  # The leaver gets nothing more
+
+    # The abandoned match lingers like a finished one, then closes
+    for _ in range(int(OVER_LINGER * server.physics_hz)):
+        server.tick()
+    assert not server.rooms and not server.players
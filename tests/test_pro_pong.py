@@ -0,0 +1,125 @@
+import random
+
+import pygame
+
+from pong_core.pro_pong import Match
+
+# The constants of the original ping_pong_cursor.py
+WINDOW_WIDTH = 800
+PADDLE_WIDTH, PADDLE_HEIGHT = 12, 90
+PADDLE_SPEED = 10
+PADDLE_MARGIN = 30
+BALL_SIZE = 12
+BALL_SPEED_INITIAL = 5
+BALL_SPEED_MAX = 12
+ANGLE_MULTIPLIER = 0.12
+BALL_DY_MAX = 7
+SCORE_LIMIT = 11
+PLAY_Y = 60
+PLAY_H = 500
+PLAY_BOTTOM = PLAY_Y + PLAY_H
+
+TICKS = 60_000
+
+
+def clamp(value, low, high):
+    return max(low, min(high, value))
+
+
+class LegacyMatch:
+    """The physics of the original run_game loop, without drawing or the window clock."""
+
+    def __init__(self):
+        self.p1_y = float(PLAY_Y + (PLAY_H - PADDLE_HEIGHT) // 2)
+        self.p2_y = float(PLAY_Y + (PLAY_H - PADDLE_HEIGHT) // 2)
+        self.ball_x, self.ball_y = float(WINDOW_WIDTH // 2), float(PLAY_Y + PLAY_H // 2)
+        self.ball_dx, self.ball_dy = float(BALL_SPEED_INITIAL), 3.0
+        self.score_a = self.score_b = self.sets_a = self.sets_b = 0
+        self.serve_cooldown = 60
+        self.paddle_hit_cooldown = 0
+
+    def bounce(self, paddle_y):
+        diff = (self.ball_y + BALL_SIZE / 2.0) - (paddle_y + PADDLE_HEIGHT / 2.0)
+        target_dy = clamp(diff * ANGLE_MULTIPLIER * 2.0, -BALL_DY_MAX, BALL_DY_MAX)
+        self.ball_dy = clamp(0.6 * self.ball_dy + 0.4 * target_dy, -BALL_DY_MAX, BALL_DY_MAX)
+        return clamp(abs(self.ball_dx) + 0.3, BALL_SPEED_INITIAL, BALL_SPEED_MAX)
+
+    def step(self, w, s, up, down):
+        """One frame of the loop; returns True where run_game returned the sets."""
+        if w and self.p1_y > PLAY_Y: self.p1_y -= PADDLE_SPEED
+        if s and self.p1_y < (PLAY_BOTTOM - PADDLE_HEIGHT): self.p1_y += PADDLE_SPEED
+        if up and self.p2_y > PLAY_Y: self.p2_y -= PADDLE_SPEED
+        if down and self.p2_y < (PLAY_BOTTOM - PADDLE_HEIGHT): self.p2_y += PADDLE_SPEED
+
+        if self.serve_cooldown > 0:
+            self.serve_cooldown -= 1
+        else:
+            self.ball_x += self.ball_dx
+            self.ball_y += self.ball_dy
+
+        if self.ball_y <= PLAY_Y:
+            self.ball_y = float(PLAY_Y)
+            self.ball_dy *= -1
+        elif self.ball_y >= (PLAY_BOTTOM - BALL_SIZE):
+            self.ball_y = float(PLAY_BOTTOM - BALL_SIZE)
+            self.ball_dy *= -1
+
+        rect_p1 = pygame.Rect(PADDLE_MARGIN, int(self.p1_y), PADDLE_WIDTH, PADDLE_HEIGHT)
+        rect_p2 = pygame.Rect(WINDOW_WIDTH - PADDLE_MARGIN - PADDLE_WIDTH, int(self.p2_y), PADDLE_WIDTH, PADDLE_HEIGHT)
+        rect_ball = pygame.Rect(int(self.ball_x), int(self.ball_y), BALL_SIZE, BALL_SIZE)
+
+        if self.paddle_hit_cooldown > 0: self.paddle_hit_cooldown -= 1
+
+        if self.paddle_hit_cooldown == 0:
+            if self.ball_dx < 0 and rect_ball.colliderect(rect_p1):
+                self.ball_dx = self.bounce(self.p1_y)
+                self.ball_x = float(rect_p1.right + 2)
+                self.paddle_hit_cooldown = 4
+            elif self.ball_dx > 0 and rect_ball.colliderect(rect_p2):
+                self.ball_dx = -self.bounce(self.p2_y)
+                self.ball_x = float(rect_p2.left - BALL_SIZE - 2)
+                self.paddle_hit_cooldown = 4
+
+        if self.ball_x < 0 or self.ball_x > WINDOW_WIDTH:
+            scored_by_a = (self.ball_x > WINDOW_WIDTH)
+            if scored_by_a: self.score_a += 1
+            else: self.score_b += 1
+
+            if (self.score_a >= SCORE_LIMIT or self.score_b >= SCORE_LIMIT) and abs(self.score_a - self.score_b) >= 2:
+                if self.score_a > self.score_b: self.sets_a += 1
+                else: self.sets_b += 1
+                self.score_a, self.score_b = 0, 0
+                if self.sets_a >= 3 or self.sets_b >= 3: return True
+
+            self.ball_x, self.ball_y = float(WINDOW_WIDTH // 2), float(PLAY_Y + PLAY_H // 2)
+            self.ball_dx = float(BALL_SPEED_INITIAL if scored_by_a else -BALL_SPEED_INITIAL)
+            self.ball_dy = 3.0
+            self.serve_cooldown, self.paddle_hit_cooldown = 60, 0
+        return False
+
+
+def match_state(match):
+    return (match.ball_x, match.ball_y, match.ball_dx, match.ball_dy, match.p1_y, match.p2_y,
+            match.score_a, match.score_b, match.sets_a, match.sets_b,
+            match.serve_cooldown, match.paddle_hit_cooldown)
+
+
+def test_match_matches_the_original_loop_tick_for_tick():
+    rng = random.Random(0)
+    match, legacy = Match(), LegacyMatch()
+    finished = 0
+    right = (False, False)
+    for tick in range(TICKS):
+        # A ball-tracking left paddle against random held keys on the right
+        center = match.p1_y + PADDLE_HEIGHT / 2
+        track = rng.random() < 0.9
+        left = (track and match.ball_y < center - 10, track and match.ball_y > center + 10)
+        if tick % 30 == 0:
+            right = (rng.random() < 0.4, rng.random() < 0.4)
+        over = match.step(*left, *right)
+        assert legacy.step(*left, *right) == over, f"tick {tick}"
+        assert match_state(match) == match_state(legacy), f"tick {tick}"
+        if over:
+            match, legacy = Match(), LegacyMatch()
+            finished += 1
+    assert finished > 0
@@ -0,0 +1,80 @@
+import random
+
+from pong_core import controls
+from pong_core.ai import make_ai
+from pong_core.controls import LEFT, RIGHT
+from pong_core.engine import GameEngine, GameState
+from pong_core.pro_pong import Match
+from pong_core.replay import GAME_HYPER_PONG, GAME_PRO_PONG, InputRecorder, read_log, replay, replay_ticks
+from pong_core.rules import HYPER_PONG, PRO_PONG
+
+MAX_TICKS = 20_000
+
+
+def pro_pong_state(match):
+    return (match.ball_x, match.ball_y, match.ball_dx, match.ball_dy, match.p1_y, match.p2_y,
+            match.score_a, match.score_b, match.sets_a, match.sets_b)
+
+
+def hyper_pong_state(engine):
+    return (engine.ball_x, engine.ball_y, engine.ball_speed_x, engine.ball_speed_y, engine.player_y,
+            engine.opponent_y, engine.player_score, engine.opponent_score, engine.player_sets,
+            engine.opponent_sets, engine.state)
+
+
+def last_matches(path):
+    """The final state of every match in a log, re-simulated by replay_ticks."""
+    finals = []
+    for _, match, over in replay_ticks(path):
+        if not finals or finals[-1][0] is not match:
+            finals.append([match, over])
+        finals[-1][1] = over
+    return finals
+
+
+def test_pro_pong_record_read_replay_round_trip(tmp_path):
+    path = tmp_path / "pro.rec"
+    rng = random.Random(1)
+    played = []
+    with InputRecorder(path, GAME_PRO_PONG) as recorder:
+        for physics_hz, collision in ((60, "rect"), (120, "swept"), (60, "rect")):
+            match = Match(PRO_PONG, physics_hz, collision)
+            recorder.start_match(0, physics_hz, collision == "swept")
+            over, ticks = False, 0
+            while not over and ticks < MAX_TICKS:
+                held = controls.unpack(rng.randrange(16)) if ticks % 20 == 0 else held
+                recorder.record(controls.pack(*held))
+                over, ticks = match.step(*held), ticks + 1
+            recorder.end_match()
+            played.append((pro_pong_state(match), over, ticks))
+
+    records = list(read_log(path))
+    assert records[0] == ("game", GAME_PRO_PONG)
+    assert [record[1:] for record in records if record[0] == "match"] == [(0, 60, 0), (0, 120, 1), (0, 60, 0)]
+    assert sum(record[2] for record in records if record[0] == "input") == sum(ticks for _, _, ticks in played)
+
+    results = replay(path)
+    assert [(r["finished"], r["ticks"]) for r in results] == [(over, ticks) for _, over, ticks in played]
+    finals = last_matches(path)
+    assert [(pro_pong_state(match), over) for match, over in finals] == [(state, over) for state, over, _ in played]
+
+
+def test_hyper_pong_record_read_replay_round_trip(tmp_path):
+    path = tmp_path / "hyper.rec"
+    played = []
+    with InputRecorder(path, GAME_HYPER_PONG) as recorder:
+        for seed, swept in ((3, False), (4, True)):
+            engine = GameEngine(HYPER_PONG, swept=swept)
+            engine.start_match(seed)
+            recorder.start_match(seed, 60, swept)
+            right, left = make_ai("sluggish", seed), make_ai("tracker", seed + 1)
+            while engine.state == GameState.PLAYING and engine.ticks < MAX_TICKS:
+                inputs = (right(engine, RIGHT), left(engine, LEFT))
+                recorder.record(*inputs)
+                engine.step(*inputs)
+            recorder.end_match()
+            played.append((hyper_pong_state(engine), engine.state != GameState.PLAYING))
+
+    finals = last_matches(path)
+    assert [(hyper_pong_state(match), over) for match, over in finals] == played
+    assert [r["finished"] for r in replay(path)] == [over for _, over in played]
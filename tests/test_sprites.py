@@ -0,0 +1,90 @@
+import pygame
+import pytest
+
+from pong_core.background import GradientCache
+from pong_core.pro_pong import Match
+from pong_core.renderer import BALL_COLOR, BG_COLOR_BOTTOM, BG_COLOR_TOP, PADDLE_COLOR, UI_COLOR, hyper_pong_theme
+from pong_core.rules import HYPER_PONG, PRO_PONG
+from pong_core.sprites import atlas_cache
+from pong_core.startup import load_script
+
+# Ball and paddle spots: centered, touching, overlapping and at the table edges
+BALLS = [(400, 300), (42, 250), (-6, 100), (794, 554), (30, 60)]
+PADDLES = [(30, 60), (30, 470), (758, 240)]
+
+
+@pytest.fixture(params=["display", "offscreen"])
+def display(request):
+    """Atlases built in the window's format, and as plain 32-bit sheets without a window."""
+    pygame.display.init()
+    if request.param == "display":
+        pygame.display.set_mode((PRO_PONG.window_width, PRO_PONG.window_height))
+    atlas_cache.clear()
+    yield request.param
+    atlas_cache.clear()
+    pygame.display.quit()
+
+
+def surfaces_equal(a, b):
+    return pygame.image.tobytes(a, "RGB") == pygame.image.tobytes(b, "RGB")
+
+
+def test_pro_pong_table_matches_draw_primitives(display):
+    game = load_script("pro-pong")
+    size = (game.WINDOW_WIDTH, game.WINDOW_HEIGHT)
+    for ball in BALLS:
+        for p1, p2 in zip(PADDLES, reversed(PADDLES)):
+            rect_p1, rect_p2 = (pygame.Rect(pos, (PRO_PONG.paddle_width, PRO_PONG.paddle_height)) for pos in (p1, p2))
+            rect_ball = pygame.Rect(ball, (PRO_PONG.ball_size, PRO_PONG.ball_size))
+            sprites = pygame.Surface(size, 0, 32)
+            game.draw_table(sprites, [], rect_p1, rect_p2, rect_ball)
+
+            # The draw calls the table used before the sprite atlas
+            primitives = pygame.Surface(size, 0, 32)
+            primitives.fill(game.BLACK)
+            pygame.draw.rect(primitives, game.MENU_BG, (0, 0, game.WINDOW_WIDTH, game.TOP_BAR_H))
+            for y in range(game.PLAY_Y, game.WINDOW_HEIGHT, 20):
+                pygame.draw.rect(primitives, game.NET_COLOR, (game.WINDOW_WIDTH // 2 - 1, y, 2, 10))
+            pygame.draw.rect(primitives, game.PADDLE_COLOR, rect_p1)
+            pygame.draw.rect(primitives, game.PADDLE_COLOR, rect_p2)
+            pygame.draw.ellipse(primitives, game.BALL_COLOR, rect_ball)
+            assert surfaces_equal(sprites, primitives), (display, ball, p1, p2)
+
+
+def test_pro_pong_dirty_rect_sprites_match_draw_primitives(display):
+    game = load_script("pro-pong")
+    for rect in Match(PRO_PONG).rects():
+        sprites = pygame.Surface(rect.size, 0, 32)
+        primitives = pygame.Surface(rect.size, 0, 32)
+        local = pygame.Rect((0, 0), rect.size)
+        if rect.width == PRO_PONG.paddle_width:
+            game.paint_paddle(sprites, local)
+            pygame.draw.rect(primitives, game.PADDLE_COLOR, local)
+        else:
+            game.paint_ball(sprites, local)
+            pygame.draw.ellipse(primitives, game.BALL_COLOR, local)
+        assert surfaces_equal(sprites, primitives), (display, rect)
+
+
+def test_hyper_pong_field_matches_draw_primitives(display):
+    rules = HYPER_PONG
+    size = (rules.screen_width, rules.screen_height)
+    gradient = GradientCache()
+    atlas = atlas_cache.get(hyper_pong_theme(rules))
+    for ball in BALLS:
+        paddles = [pygame.Rect(pos, (rules.paddle_width, rules.paddle_height)) for pos in ((30, 0), (915, 560))]
+        ball_rect = pygame.Rect(ball, (rules.ball_radius * 2, rules.ball_radius * 2))
+        sprites = pygame.Surface(size, 0, 32)
+        gradient.draw(sprites, BG_COLOR_TOP, BG_COLOR_BOTTOM)
+        atlas.draw(sprites, [("net", (rules.screen_width // 2, 0))]
+                   + [("paddle", paddle.topleft) for paddle in paddles] + [("ball", ball_rect.topleft)])
+
+        # The draw calls of the original ppg.py loop
+        primitives = pygame.Surface(size, 0, 32)
+        gradient.draw(primitives, BG_COLOR_TOP, BG_COLOR_BOTTOM)
+        width, height = size
+        pygame.draw.aaline(primitives, UI_COLOR, (width / 2, 0), (width / 2, height))
+        for paddle in paddles:
+            pygame.draw.rect(primitives, PADDLE_COLOR, paddle, border_radius=10)
+        pygame.draw.ellipse(primitives, BALL_COLOR, ball_rect)
+        assert surfaces_equal(sprites, primitives), (display, ball)
@@ -0,0 +1,63 @@
+import sqlite3
+
+from pong_core.controls import LEFT, RIGHT
+from pong_core.stats import StatsRecorder, StatsStore
+
+
+def play(recorder, winner):
+    recorder.start_match()
+    recorder.hit(LEFT, 0.5)
+    recorder.point(winner, 120, 6.0)
+    recorder.end_match(winner, 2, 0)
+
+
+def test_recorders_sharing_a_database_get_distinct_match_ids(tmp_path):
+    path = tmp_path / "stats.db"
+    first, second = StatsRecorder(path, "pro-pong"), StatsRecorder(path, "pro-pong")
+    for _ in range(3):
+        play(first, LEFT)
+        play(second, RIGHT)
+    first.close()
+    second.close()
+
+    db = sqlite3.connect(path)
+    assert db.execute("SELECT COUNT(*), COUNT(DISTINCT id) FROM matches").fetchone() == (6, 6)
+    # Every rally points at its own match
+    assert db.execute(
+        "SELECT COUNT(*) FROM rallies JOIN matches ON matches.id = rallies.match_id WHERE scorer = winner"
+    ).fetchone() == (6,)
+    summary = StatsStore(path).summary("pro-pong")
+    assert (summary["matches"], summary["finished"]) == (6, 6)
+
+
+def test_writer_survives_a_failed_batch(tmp_path, capsys):
+    path = tmp_path / "stats.db"
+    recorder = StatsRecorder(path, "pro-pong")
+    recorder.start_match()
+    recorder.hit(LEFT, object())  # SQLite cannot bind this, so the batch fails
+    recorder.point(LEFT, 10, 6.0)
+    play(recorder, LEFT)
+    recorder.close()
+
+    assert recorder.failed_batches == 1
+    assert "stats: lost" in capsys.readouterr().err
+    assert StatsStore(path).summary("pro-pong")["finished"] == 1
+
+
+def test_match_started_in_a_failed_commit_gets_no_row_id(tmp_path):
+    path = tmp_path / "stats.db"
+    recorder = StatsRecorder(path, "pro-pong")
+    # A deferred foreign key the insert breaks, so the batch fails at COMMIT, after every statement ran
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA foreign_keys=ON")
+    db.executescript("""
+        CREATE TEMP TABLE parent (id INTEGER PRIMARY KEY);
+        CREATE TEMP TABLE child (parent_id INTEGER REFERENCES parent (id) DEFERRABLE INITIALLY DEFERRED);
+        CREATE TEMP TRIGGER orphan AFTER INSERT ON matches BEGIN INSERT INTO child VALUES (1); END;
+    """)
+    error = recorder._commit(db, [("start", (1, "pro-pong", 0.0))])
+    db.close()
+    recorder.close()
+
+    assert isinstance(error, sqlite3.IntegrityError)
+    assert recorder._row_ids == {}
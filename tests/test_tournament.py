@@ -0,0 +1,13 @@
+import pytest
+
+from pong_core.rules import HYPER_PONG
+from pong_core.tournament import play_match
+
+
+@pytest.mark.parametrize("left, right", [("tracker", "idle"), ("idle", "tracker"), ("tracker", "sluggish")])
+def test_points_credit_the_side_that_scored(left, right):
+    for seed in range(3):
+        result = play_match(left, right, seed)
+        for side in (0, 1):  # Left, right
+            # Every won set took at least `winning_score` of that side's points
+            assert result["points"][side] >= HYPER_PONG.winning_score * result["sets"][side]
@@ -0,0 +1,14 @@
+from pong_core.tune import play_match, summarize
+
+TOTALS = {"points": 10, "hits": 50, "rally_ticks": 1200, "tunnels": 0, "stuck": 0, "finished": 1}
+
+
+def test_rally_seconds_use_the_swept_tick_rate():
+    assert summarize({}, TOTALS, 1)["rally_seconds"] == 2.0  # PRO_PONG's 60 fps
+    assert summarize({"fps": 120}, TOTALS, 1)["rally_seconds"] == 1.0
+
+
+def test_a_match_cut_off_before_its_first_tick_counts_nothing():
+    counts = play_match({}, 0, 0.3, 0, 60.0)
+    assert counts["ticks"] == 0 and counts["points"] == 0
+    assert play_match({}, 0, 0.3, 1, 60.0)["ticks"] == 1